@@ -1,7 +1,34 @@
 from typing import Union
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Query
+from pydantic import BaseModel, Field
+
+from polymarket_agents.connectors.rag_service import (
+    RAGQueryService,
+    get_configured_rag_service,
+)
 
 app = FastAPI()
+MAX_RAG_RESULTS = 100
+
+
+class RAGSearchRequest(BaseModel):
+    queries: list[str]
+    k: int = Field(4, ge=1, le=MAX_RAG_RESULTS)
+
+
+def rag_service() -> RAGQueryService:
+    """Server-configured markets service, re-exported first if the collection changed."""
+    service = get_configured_rag_service()
+    service.reload_if_stale()
+    return service
+
+
+def _serialise_hits(hits: "list[tuple]") -> list[dict]:
+    return [
+        {"id": document.metadata.get("id"), "score": score, "content": document.page_content,
+         "metadata": document.metadata}
+        for document, score in hits
+    ]
 
 
 @app.get("/")
@@ -24,4 +51,20 @@ def read_market(market_id: int, q: Union[str, None] = None):
     return {"market_id": market_id, "q": q}
 
 
+@app.get("/rag/markets")
+def search_markets(
+    q: str,
+    k: int = Query(4, ge=1, le=MAX_RAG_RESULTS),
+    service: RAGQueryService = Depends(rag_service),
+):
+    return _serialise_hits(service.query(q, k=k))
+
+
+@app.post("/rag/markets")
+def multi_search_markets(
+    request: RAGSearchRequest, service: RAGQueryService = Depends(rag_service)
+):
+    return _serialise_hits(service.multi_query(request.queries, k=request.k))
+
+
 # post new prompt
@@ -0,0 +1,245 @@
+"""Decide which markets changed enough since their last analysis to analyse again."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from polymarket_agents.utils.logging import log_debug, log_print
+from polymarket_agents.utils.objects import Market
+
+DEFAULT_CHANGE_STATE_PATH = "./local_db_changes/changes.sqlite"
+FINGERPRINT_FIELDS = ("outcomePrices", "volume24hr", "spread", "updatedAt")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS market_state (
+    market_id TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    prices TEXT NOT NULL,
+    volume24hr REAL,
+    spread REAL,
+    articles TEXT NOT NULL,
+    price_ewma REAL NOT NULL,
+    observed_at REAL NOT NULL,
+    analyzed_fingerprint TEXT,
+    analyzed_prices TEXT,
+    analyzed_volume24hr REAL,
+    analyzed_spread REAL,
+    analyzed_articles TEXT,
+    analyzed_at REAL
+);
+"""
+
+
+def article_digest(identifier: str) -> str:
+    """Short stable digest for an article URL or id."""
+    return hashlib.sha256(identifier.encode("utf-8")).hexdigest()[:16]
+
+
+def market_fingerprint(market: Market, article_digests: Iterable[str] = ()) -> str:
+    """Digest of the Gamma fields that matter for analysis plus linked articles."""
+    payload = {name: getattr(market, name, None) for name in FINGERPRINT_FIELDS}
+    payload["articles"] = sorted(article_digests)
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _max_move(current: list[float], previous: list[float] | None) -> float:
+    if not previous:
+        return 0.0
+    if len(current) != len(previous):
+        return 1.0
+    return max((abs(now - then) for now, then in zip(current, previous)), default=0.0)
+
+
+@dataclass(slots=True)
+class ChangeDecision:
+    """Whether one market should be re-analysed, and why."""
+
+    market_id: str
+    reanalyze: bool
+    reasons: list[str] = field(default_factory=list)
+    price_move: float = 0.0  # largest outcome price move since the last analysis
+    price_ewma: float = 0.0  # EWMA of per-observation price moves
+    new_articles: int = 0
+
+
+class ChangeDetector:
+    """Per-market fingerprints and price-move EWMAs persisted in SQLite.
+
+    `assess` records the latest observation of each market and flags it when
+    it was never analysed, or when its fingerprint differs from the one at its
+    last analysis *and* something material moved. Material means one of:
+    outcome prices moved by `price_threshold` since the last analysis, the
+    EWMA of per-observation moves reached `volatility_threshold`, new articles
+    were linked, 24h volume changed by `volume_threshold` (relative), or the
+    spread widened or narrowed by `spread_threshold`. Call `mark_analyzed` once
+    the analysis for a market has actually run, so failed runs are retried.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = DEFAULT_CHANGE_STATE_PATH,
+        price_threshold: float = 0.02,
+        volatility_threshold: float = 0.01,
+        volume_threshold: float = 0.5,
+        spread_threshold: float = 0.02,
+        ewma_alpha: float = 0.3,
+    ) -> None:
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError("ewma_alpha must be in (0, 1].")
+        self.price_threshold = price_threshold
+        self.volatility_threshold = volatility_threshold
+        self.volume_threshold = volume_threshold
+        self.spread_threshold = spread_threshold
+        self.ewma_alpha = ewma_alpha
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ChangeDetector":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _reasons(
+        self,
+        state: sqlite3.Row,
+        prices: list[float],
+        volume: float | None,
+        spread: float | None,
+        digests: list[str],
+        decision: ChangeDecision,
+    ) -> None:
+        analyzed_prices = json.loads(state["analyzed_prices"] or "[]")
+        decision.price_move = _max_move(prices, analyzed_prices)
+        if decision.price_move >= self.price_threshold:
+            decision.reasons.append("price")
+        if decision.price_ewma >= self.volatility_threshold:
+            decision.reasons.append("volatility")
+        known = set(json.loads(state["analyzed_articles"] or "[]"))
+        decision.new_articles = len(set(digests) - known)
+        if decision.new_articles:
+            decision.reasons.append("news")
+        previous_volume = state["analyzed_volume24hr"]
+        if volume is not None and previous_volume:
+            if abs(volume - previous_volume) / previous_volume >= self.volume_threshold:
+                decision.reasons.append("volume")
+        previous_spread = state["analyzed_spread"]
+        if spread is not None and previous_spread is not None:
+            if abs(spread - previous_spread) >= self.spread_threshold:
+                decision.reasons.append("spread")
+
+    def assess(
+        self,
+        markets: Iterable[Market],
+        articles: Mapping[str, Iterable[str]] | None = None,
+    ) -> list[ChangeDecision]:
+        """Record an observation of each market and decide which need re-analysis.
+
+        `articles` maps market id to the URLs (or ids) of articles linked to it.
+        """
+        articles = articles or {}
+        decisions: list[ChangeDecision] = []
+        now = time.time()
+        with self.connection:
+            for market in markets:
+                market_id = str(market.id)
+                prices = [float(price) for price in market.outcomePrices or []]
+                digests = sorted(
+                    {article_digest(str(item)) for item in articles.get(market_id, ())}
+                )
+                fingerprint = market_fingerprint(market, digests)
+                state = self.connection.execute(
+                    "SELECT * FROM market_state WHERE market_id = ?", (market_id,)
+                ).fetchone()
+                decision = ChangeDecision(market_id=market_id, reanalyze=False)
+                if state is None or state["analyzed_fingerprint"] is None:
+                    decision.reasons.append("new")
+                    decision.new_articles = len(digests)
+                else:
+                    step = _max_move(prices, json.loads(state["prices"]))
+                    decision.price_ewma = (
+                        self.ewma_alpha * step + (1 - self.ewma_alpha) * state["price_ewma"]
+                    )
+                    if fingerprint != state["analyzed_fingerprint"]:
+                        self._reasons(
+                            state, prices, market.volume24hr, market.spread, digests, decision
+                        )
+                decision.reanalyze = bool(decision.reasons)
+                decisions.append(decision)
+                self.connection.execute(
+                    "INSERT INTO market_state (market_id, fingerprint, prices, volume24hr, "
+                    "spread, articles, price_ewma, observed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(market_id) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                    "prices = excluded.prices, volume24hr = excluded.volume24hr, "
+                    "spread = excluded.spread, articles = excluded.articles, "
+                    "price_ewma = excluded.price_ewma, observed_at = excluded.observed_at",
+                    (
+                        market_id,
+                        fingerprint,
+                        json.dumps(prices),
+                        market.volume24hr,
+                        market.spread,
+                        json.dumps(digests),
+                        decision.price_ewma,
+                        now,
+                    ),
+                )
+        flagged = sum(decision.reanalyze for decision in decisions)
+        log_debug(f"Change detection: {flagged}/{len(decisions)} markets need re-analysis")
+        return decisions
+
+    def select(
+        self,
+        markets: Iterable[Market],
+        articles: Mapping[str, Iterable[str]] | None = None,
+    ) -> list[Market]:
+        """Return only the markets `assess` flags, in input order."""
+        markets = list(markets)
+        flagged = {
+            decision.market_id
+            for decision in self.assess(markets, articles)
+            if decision.reanalyze
+        }
+        return [market for market in markets if str(market.id) in flagged]
+
+    def mark_analyzed(self, market_ids: Iterable[str | int]) -> None:
+        """Make each market's latest observation the baseline for future changes."""
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE market_state SET analyzed_fingerprint = fingerprint, "
+                "analyzed_prices = prices, analyzed_volume24hr = volume24hr, "
+                "analyzed_spread = spread, analyzed_articles = articles, analyzed_at = ? "
+                "WHERE market_id = ?",
+                [(time.time(), str(market_id)) for market_id in market_ids],
+            )
+
+
+def print_change_decisions(decisions: list[ChangeDecision], top: int = 20) -> None:
+    """Summarise a change-detection pass and list the largest movers."""
+    flagged = [decision for decision in decisions if decision.reanalyze]
+    log_print(
+        f"{len(flagged)} of {len(decisions)} markets need re-analysis "
+        f"({len(decisions) - len(flagged)} skipped)"
+    )
+    flagged.sort(key=lambda decision: (decision.price_move, decision.price_ewma), reverse=True)
+    for decision in flagged[:top]:
+        log_print(
+            f"  {decision.market_id:>10}  move {decision.price_move:.3f}  "
+            f"ewma {decision.price_ewma:.3f}  articles +{decision.new_articles}  "
+            f"{', '.join(decision.reasons)}"
+        )
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Iterable, Sequence
 
+from polymarket_agents.polymarket.book_cache import OrderBookCache
+from polymarket_agents.polymarket.clob import ClobReader
 from polymarket_agents.polymarket.gamma import GammaMarketClient
 from polymarket_agents.polymarket.polymarket import Polymarket
 from polymarket_agents.utils.logging import log_debug, log_print
@@ -22,6 +25,7 @@ class MarketOpportunity:
     profit_per_share: float
     max_position_size: float
     estimated_profit: float
+    detected_at: float = field(default_factory=time.time)
 
 
 @dataclass(slots=True)
@@ -32,6 +36,23 @@ class OutcomeQuote:
     ask_size: float | None = None
     bid_price: float | None = None
     bid_size: float | None = None
+    book_timestamp: float | None = None  # seconds since epoch, as reported by the CLOB
+
+
+@dataclass(slots=True)
+class ScanCoverage:
+    """How much of the catalogue a scan actually observed."""
+
+    start_offset: int = 0
+    markets: int = 0
+    unseen: int = 0  # markets whose books were suppressed or failed to load
+    exhausted: bool = False  # Gamma ran out of markets before the target was hit
+    observed: set[int] = field(default_factory=set)  # ids of markets whose books were read
+
+    @property
+    def complete(self) -> bool:
+        """True only if every market from offset 0 to the end had its books read."""
+        return self.start_offset == 0 and self.exhausted and not self.unseen
 
 
 def _normalize_prices(prices: Sequence[float]) -> list[float]:
@@ -80,19 +101,36 @@ def _best_order(
     return best_price, best_size
 
 
+def _book_timestamp(orderbook) -> float | None:
+    """Return the CLOB book timestamp (published in milliseconds) as epoch seconds."""
+    raw_timestamp = getattr(orderbook, "timestamp", None)
+    try:
+        return float(raw_timestamp) / 1000.0
+    except (TypeError, ValueError):
+        return None
+
+
 def _collect_orderbook_quotes(
-    market: Market, polymarket: Polymarket, token_ids: list[str]
-) -> list[OutcomeQuote]:
-    """Fetch best ask/bid quotes for each outcome token."""
+    market: Market, polymarket: Polymarket | ClobReader | OrderBookCache, token_ids: list[str]
+) -> list[OutcomeQuote] | None:
+    """Fetch best ask/bid quotes for each outcome token.
+
+    Returns None when a book was not observed (suppressed or failed to load),
+    and an empty list when a book was read but had no usable quotes.
+    """
     quotes: list[OutcomeQuote] = []
     outcomes = market.outcomes or []
 
+    # One dead leg sinks the whole market, so skip it without spending requests.
+    if isinstance(polymarket, OrderBookCache) and polymarket.suppressed(token_ids):
+        return None
+
     for index, token_id in enumerate(token_ids):
         try:
             orderbook = polymarket.get_orderbook(token_id)
         except Exception as exc:  # pragma: no cover - network/HTTP guard
             log_debug(f"Failed to fetch order book for {token_id}: {exc}")
-            return []
+            return None
 
         ask_price, ask_size = _best_order(
             getattr(orderbook, "asks", None), prefer_high=False
@@ -115,6 +153,7 @@ def _collect_orderbook_quotes(
                 ask_size=ask_size,
                 bid_price=bid_price,
                 bid_size=bid_size,
+                book_timestamp=_book_timestamp(orderbook),
             )
         )
     return quotes
@@ -177,16 +216,47 @@ def _build_opportunity(
     return None
 
 
+def _scan_market(
+    market: Market, polymarket: Polymarket | ClobReader | OrderBookCache
+) -> tuple[MarketOpportunity | None, bool]:
+    """Evaluate one market; the flag is False when its books could not be read."""
+    token_ids = _iter_token_ids(market)
+    if not token_ids:
+        return None, True
+
+    quotes = _collect_orderbook_quotes(market, polymarket, token_ids)
+    if quotes is None:
+        return None, False
+    if len(quotes) != len(token_ids):
+        return None, True
+
+    return _build_opportunity(market, quotes), True
+
+
 def find_probabilistic_arbitrage(
     target_results: int = 2,
     batch_limit: int = 200,
     start_offset: int = 0,
+    gamma: GammaMarketClient | None = None,
+    polymarket: Polymarket | ClobReader | OrderBookCache | None = None,
+    coverage: ScanCoverage | None = None,
 ) -> list[MarketOpportunity]:
-    """Identify markets where outcome prices sum away from parity."""
-    gamma = GammaMarketClient()
-    polymarket = Polymarket()
+    """Identify markets where outcome prices sum away from parity.
+
+    `gamma` and `polymarket` default to live clients; pass replay-backed or
+    stand-in clients (see `polymarket_agents.replay`) to scan offline. Book
+    fetches go through an `OrderBookCache`; pass one explicitly to keep its
+    negative entries across scans. A `coverage` object, if given, is filled
+    in with how much of the catalogue the scan observed.
+    """
+    gamma = gamma or GammaMarketClient()
+    polymarket = polymarket or Polymarket()
+    if not isinstance(polymarket, OrderBookCache):
+        polymarket = OrderBookCache(polymarket)
     opportunities: list[MarketOpportunity] = []
     offset = max(start_offset, 0)
+    coverage = coverage if coverage is not None else ScanCoverage()
+    coverage.start_offset = offset
 
     while len(opportunities) < target_results:
         log_print(
@@ -195,19 +265,16 @@ def find_probabilistic_arbitrage(
         markets = gamma.get_tradable_markets(limit=batch_limit, offset=offset)
         if not markets:
             log_print("No more markets returned by Gamma; stopping search.")
+            coverage.exhausted = True
             break
 
         log_print(f"Processing {len(markets)} markets for probability sums...")
         for market in markets:
-            token_ids = _iter_token_ids(market)
-            if not token_ids:
-                continue
-
-            quotes = _collect_orderbook_quotes(market, polymarket, token_ids)
-            if len(quotes) != len(token_ids):
-                continue
-
-            opportunity = _build_opportunity(market, quotes)
+            opportunity, observed = _scan_market(market, polymarket)
+            coverage.markets += 1
+            coverage.unseen += not observed
+            if observed:
+                coverage.observed.add(int(market.id))
             if opportunity is None:
                 continue
 
@@ -228,12 +295,14 @@ def find_probabilistic_arbitrage(
             log_print(
                 "Reached the end of available markets before hitting the target count."
             )
+            coverage.exhausted = True
             break
 
     log_print(
         f"Finished scanning: discovered {len(opportunities)} "
         f"opportunit{'y' if len(opportunities)==1 else 'ies'}."
     )
+    log_print(f"Order book cache: {polymarket.metrics.summary()}.")
     return opportunities
 
 
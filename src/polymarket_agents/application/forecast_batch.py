@@ -0,0 +1,169 @@
+"""Run `Prompter.superforecaster` over many markets with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterable
+
+from polymarket_agents.application.prompt_budget import PromptAssembler
+from polymarket_agents.application.prompts import Prompter
+from polymarket_agents.connectors.llm import LLMClient, estimate_tokens
+from polymarket_agents.utils.logging import log_debug, log_print
+from polymarket_agents.utils.objects import Market
+from polymarket_agents.utils.ratelimit import RateLimiter
+
+
+@dataclass(slots=True)
+class ForecastTask:
+    """One superforecaster prompt for one market outcome."""
+
+    market_id: str
+    question: str
+    outcome: str
+    prompt: str
+
+
+@dataclass(slots=True)
+class ForecastResult:
+    """What came back for a `ForecastTask`."""
+
+    task: ForecastTask
+    text: str | None = None
+    error: str | None = None
+    attempts: int = 0
+    latency_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def build_forecast_tasks(
+    markets: Iterable[Market],
+    prompter: Prompter | None = None,
+    assembler: PromptAssembler | None = None,
+) -> list[ForecastTask]:
+    """One task per market per outcome, prompts built by `Prompter.superforecaster`.
+
+    With an `assembler`, long descriptions are trimmed to the prompt's token budget.
+    """
+    prompter = prompter or Prompter()
+    tasks: list[ForecastTask] = []
+    for market in markets:
+        question = market.question or ""
+        description = market.description or ""
+        for outcome in market.outcomes or []:
+            if assembler is not None:
+                prompt = assembler.superforecaster(question, description, outcome).prompt
+            else:
+                prompt = prompter.superforecaster(question, description, outcome)
+            tasks.append(
+                ForecastTask(
+                    market_id=str(market.id),
+                    question=question,
+                    outcome=outcome,
+                    prompt=prompt,
+                )
+            )
+    return tasks
+
+
+class BatchForecaster:
+    """Evaluate forecast tasks concurrently under a concurrency cap and token budget.
+
+    At most `max_concurrency` calls are in flight. Before each call the task's
+    estimated tokens (prompt plus `max_output_tokens`) are taken from a
+    `tokens_per_minute` bucket, so a large batch spreads itself over the
+    provider's TPM quota instead of tripping it. Failed calls are retried up to
+    `max_retries` times with exponential backoff; results are yielded in
+    completion order.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        max_concurrency: int = 8,
+        tokens_per_minute: float = 0.0,
+        max_output_tokens: int = 512,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        self.client = client
+        self.count_tokens = count_tokens
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.max_output_tokens = max_output_tokens
+        self.max_retries = max(int(max_retries), 0)
+        self.backoff = backoff
+        self.budget = RateLimiter(
+            tokens_per_minute, per=60.0, burst=tokens_per_minute or None
+        )
+
+    async def _evaluate(self, task: ForecastTask, slots: asyncio.Semaphore) -> ForecastResult:
+        result = ForecastResult(task=task)
+        queued_at = time.time()
+        cost = self.count_tokens(task.prompt) + self.max_output_tokens
+        async with slots:
+            started = time.perf_counter()
+            while True:
+                result.attempts += 1
+                delay = self.budget.reserve(cost)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    result.text = await self.client.acomplete(
+                        task.prompt,
+                        name="superforecaster",
+                        queued_at=queued_at,
+                        cache_scope=f"superforecaster:{task.market_id}:{task.outcome}",
+                    )
+                    result.error = None
+                    break
+                except Exception as exc:
+                    result.error = f"{type(exc).__name__}: {exc}"
+                    if result.attempts > self.max_retries:
+                        break
+                    await asyncio.sleep(self.backoff * 2 ** (result.attempts - 1))
+            result.latency_s = time.perf_counter() - started
+        return result
+
+    async def stream(self, tasks: Iterable[ForecastTask]) -> AsyncIterator[ForecastResult]:
+        """Yield results as soon as each task finishes."""
+        slots = asyncio.Semaphore(self.max_concurrency)
+        pending = [asyncio.ensure_future(self._evaluate(task, slots)) for task in tasks]
+        started = time.perf_counter()
+        failed = 0
+        try:
+            for future in asyncio.as_completed(pending):
+                result = await future
+                failed += not result.ok
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+        log_debug(
+            f"Forecast batch: {len(pending)} tasks, {failed} failed "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+
+    def run(self, tasks: Iterable[ForecastTask]) -> list[ForecastResult]:
+        """Blocking helper collecting `stream` into a list (completion order)."""
+
+        async def collect() -> list[ForecastResult]:
+            return [result async for result in self.stream(tasks)]
+
+        return asyncio.run(collect())
+
+
+def print_forecast_result(result: ForecastResult) -> None:
+    task = result.task
+    if result.ok:
+        answer = " ".join((result.text or "").split())
+        log_print(f"[{task.market_id}] {task.outcome}: {answer}")
+    else:
+        log_print(
+            f"[{task.market_id}] {task.outcome}: failed after {result.attempts} attempts "
+            f"({result.error})"
+        )
@@ -0,0 +1,270 @@
+"""Persistent record of detected arbitrage opportunities and their lifetimes."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from polymarket_agents.application.finder import MarketOpportunity
+from polymarket_agents.utils.logging import log_print
+
+DEFAULT_LEDGER_PATH = "./local_db_ledger/opportunities.sqlite"
+UNCATEGORIZED = "uncategorized"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY,
+    detected_at REAL NOT NULL,
+    opportunities INTEGER NOT NULL,
+    complete INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    market_id INTEGER NOT NULL,
+    side TEXT NOT NULL,
+    category TEXT NOT NULL,
+    detected_at REAL NOT NULL,
+    book_timestamp REAL,
+    detection_lag REAL,
+    total_probability REAL NOT NULL,
+    profit_per_share REAL NOT NULL,
+    max_position_size REAL NOT NULL,
+    estimated_profit REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    id INTEGER PRIMARY KEY,
+    market_id INTEGER NOT NULL,
+    side TEXT NOT NULL,
+    category TEXT NOT NULL,
+    question TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    closed_at REAL,
+    peak_profit REAL NOT NULL,
+    peak_profit_per_share REAL NOT NULL,
+    observations INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS episodes_open
+    ON episodes(market_id, side) WHERE closed_at IS NULL;
+CREATE INDEX IF NOT EXISTS observations_market ON observations(market_id, side);
+"""
+
+
+@dataclass(slots=True)
+class CategoryEdgeStats:
+    """Aggregate edge lifetimes for one market category."""
+
+    category: str
+    closed_episodes: int
+    open_episodes: int
+    half_life_s: float | None  # median lifetime of closed episodes
+    p90_lifetime_s: float | None
+    median_detection_lag_s: float | None
+    mean_peak_profit: float | None
+
+
+def _detection_lag(opportunity: MarketOpportunity) -> tuple[float | None, float | None]:
+    """Return `(book_timestamp, lag)` for an opportunity.
+
+    The edge exists once every leg is in its current state, so the newest leg's
+    book timestamp is the earliest moment we could have seen it.
+    """
+    stamps = [quote.book_timestamp for quote in opportunity.quotes if quote.book_timestamp]
+    if not stamps:
+        return None, None
+    book_timestamp = max(stamps)
+    return book_timestamp, max(opportunity.detected_at - book_timestamp, 0.0)
+
+
+def _quantile(values: list[float], fraction: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+class OpportunityLedger:
+    """SQLite-backed ledger keyed by `(market id, side)`.
+
+    Every detection is appended to `observations`; `episodes` tracks each
+    contiguous stretch during which an edge kept being detected. An episode
+    closes when a scan reads its market's books and no longer finds the edge.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_LEDGER_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "OpportunityLedger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record_scan(
+        self,
+        opportunities: Iterable[MarketOpportunity],
+        observed: Iterable[int] = (),
+        complete: bool = False,
+        detected_at: float | None = None,
+    ) -> int:
+        """Append a scan's opportunities and update open episodes.
+
+        `observed` holds the ids of markets whose books this scan read; an open
+        episode on one of them that was not detected again is closed. Markets
+        the scan did not reach are left alone. `complete=True` marks a scan of
+        the whole catalogue and closes every open episode it did not detect.
+        """
+        opportunities = list(opportunities)
+        observed = {int(market_id) for market_id in observed}
+        scan_time = detected_at if detected_at is not None else time.time()
+        seen: set[tuple[int, str]] = set()
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO scans (detected_at, opportunities, complete) VALUES (?, ?, ?)",
+                (scan_time, len(opportunities), int(complete)),
+            )
+            scan_id = cursor.lastrowid
+            for opportunity in opportunities:
+                market = opportunity.market
+                key = (int(market.id), opportunity.execution_side)
+                seen.add(key)
+                category = market.category or UNCATEGORIZED
+                book_timestamp, lag = _detection_lag(opportunity)
+                self.connection.execute(
+                    "INSERT INTO observations (scan_id, market_id, side, category, "
+                    "detected_at, book_timestamp, detection_lag, total_probability, "
+                    "profit_per_share, max_position_size, estimated_profit) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        scan_id,
+                        *key,
+                        category,
+                        opportunity.detected_at,
+                        book_timestamp,
+                        lag,
+                        opportunity.total_probability,
+                        opportunity.profit_per_share,
+                        opportunity.max_position_size,
+                        opportunity.estimated_profit,
+                    ),
+                )
+                updated = self.connection.execute(
+                    "UPDATE episodes SET last_seen = MAX(last_seen, ?), "
+                    "peak_profit = MAX(peak_profit, ?), "
+                    "peak_profit_per_share = MAX(peak_profit_per_share, ?), "
+                    "observations = observations + 1 "
+                    "WHERE market_id = ? AND side = ? AND closed_at IS NULL",
+                    (
+                        opportunity.detected_at,
+                        opportunity.estimated_profit,
+                        opportunity.profit_per_share,
+                        *key,
+                    ),
+                )
+                if updated.rowcount == 0:
+                    self.connection.execute(
+                        "INSERT INTO episodes (market_id, side, category, question, "
+                        "first_seen, last_seen, peak_profit, peak_profit_per_share, "
+                        "observations) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)",
+                        (
+                            *key,
+                            category,
+                            market.question,
+                            opportunity.detected_at,
+                            opportunity.detected_at,
+                            opportunity.estimated_profit,
+                            opportunity.profit_per_share,
+                        ),
+                    )
+            if complete or observed:
+                open_rows = self.connection.execute(
+                    "SELECT id, market_id, side FROM episodes WHERE closed_at IS NULL"
+                ).fetchall()
+                stale = [
+                    (scan_time, episode_id)
+                    for episode_id, market_id, side in open_rows
+                    if (market_id, side) not in seen and (complete or market_id in observed)
+                ]
+                self.connection.executemany(
+                    "UPDATE episodes SET closed_at = ? WHERE id = ?", stale
+                )
+        return scan_id
+
+    def category_stats(self) -> list[CategoryEdgeStats]:
+        """Summarise edge half-lives and detection lag per category."""
+        lifetimes: dict[str, list[float]] = {}
+        open_counts: dict[str, int] = {}
+        peaks: dict[str, list[float]] = {}
+        for category, first_seen, closed_at, peak in self.connection.execute(
+            "SELECT category, first_seen, closed_at, peak_profit FROM episodes"
+        ):
+            peaks.setdefault(category, []).append(peak)
+            if closed_at is None:
+                open_counts[category] = open_counts.get(category, 0) + 1
+            else:
+                lifetimes.setdefault(category, []).append(closed_at - first_seen)
+        lags: dict[str, list[float]] = {}
+        for category, lag in self.connection.execute(
+            "SELECT category, detection_lag FROM observations WHERE detection_lag IS NOT NULL"
+        ):
+            lags.setdefault(category, []).append(lag)
+
+        stats: list[CategoryEdgeStats] = []
+        for category in sorted(peaks):
+            closed = lifetimes.get(category, [])
+            category_lags = lags.get(category, [])
+            stats.append(
+                CategoryEdgeStats(
+                    category=category,
+                    closed_episodes=len(closed),
+                    open_episodes=open_counts.get(category, 0),
+                    half_life_s=statistics.median(closed) if closed else None,
+                    p90_lifetime_s=_quantile(closed, 0.9),
+                    median_detection_lag_s=(
+                        statistics.median(category_lags) if category_lags else None
+                    ),
+                    mean_peak_profit=statistics.fmean(peaks[category]),
+                )
+            )
+        return stats
+
+
+def _format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if value >= 3600:
+        return f"{value / 3600:.1f}h"
+    if value >= 60:
+        return f"{value / 60:.1f}m"
+    return f"{value:.1f}s"
+
+
+def print_category_stats(stats: Iterable[CategoryEdgeStats]) -> None:
+    """Pretty-print per-category edge lifetimes."""
+    stats = list(stats)
+    if not stats:
+        log_print("No opportunities recorded yet.")
+        return
+    log_print(
+        f"{'Category':<20} {'Closed':>7} {'Open':>5} {'Half-life':>10} "
+        f"{'P90 life':>9} {'Lag p50':>8} {'Avg peak':>9}"
+    )
+    for row in stats:
+        peak = f"{row.mean_peak_profit:.4f}" if row.mean_peak_profit is not None else "-"
+        log_print(
+            f"{row.category[:20]:<20} {row.closed_episodes:>7} {row.open_episodes:>5} "
+            f"{_format_seconds(row.half_life_s):>10} {_format_seconds(row.p90_lifetime_s):>9} "
+            f"{_format_seconds(row.median_detection_lag_s):>8} {peak:>9}"
+        )
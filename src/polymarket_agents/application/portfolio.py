@@ -0,0 +1,251 @@
+"""Columnar portfolio valuation, exposure and shock analysis over Data API positions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+from py_clob_client.clob_types import OrderBookSummary
+
+from polymarket_agents.polymarket.clob import ClobReader
+from polymarket_agents.utils.logging import log_debug, log_print
+
+UNCATEGORIZED = "uncategorized"
+UNKNOWN_EVENT = "unknown-event"
+PRICE_MODES = ("mid", "bid")
+_BOOKS_PER_REQUEST = 100
+
+
+def _as_float(value: Any, default: float = np.nan) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _book_price(book: OrderBookSummary, mode: str) -> float | None:
+    """Return the best-bid or mid price of a book, or None when it has no quotes."""
+    bids = [float(level.price) for level in book.bids or []]
+    asks = [float(level.price) for level in book.asks or []]
+    best_bid = max(bids) if bids else None
+    if mode == "bid":
+        return best_bid
+    best_ask = min(asks) if asks else None
+    if best_bid is None or best_ask is None:
+        return best_bid if best_ask is None else best_ask
+    return (best_bid + best_ask) / 2
+
+
+def _encode(labels: list[str]) -> tuple[np.ndarray, list[str]]:
+    """Map labels to dense integer codes for `np.bincount`-style grouping."""
+    codes: dict[str, int] = {}
+    encoded = np.fromiter(
+        (codes.setdefault(label, len(codes)) for label in labels),
+        dtype=np.int64,
+        count=len(labels),
+    )
+    return encoded, list(codes)
+
+
+@dataclass(slots=True)
+class ShockResult:
+    """Portfolio value before and after a price shock."""
+
+    base_value: float
+    shocked_value: float
+    pnl_change: float
+    by_event: dict[str, float]
+
+
+class Portfolio:
+    """Positions held as parallel float arrays, marked against CLOB prices.
+
+    Sizes, average entry prices and marks are parsed once into numpy arrays.
+    Per-event and per-category exposure is kept as running sums so that
+    `update_prices` only touches the rows whose tokens moved.
+    """
+
+    def __init__(
+        self,
+        positions: Iterable[Mapping[str, Any]],
+        categories: Mapping[str, str] | None = None,
+    ) -> None:
+        rows = [position for position in positions if position.get("asset")]
+        categories = categories or {}
+        self.token_ids: list[str] = [str(position["asset"]) for position in rows]
+        self.titles: list[str] = [
+            position.get("title") or position.get("slug") or "-" for position in rows
+        ]
+        self.size = np.array([_as_float(p.get("size"), 0.0) for p in rows], dtype=np.float64)
+        self.avg_price = np.array(
+            [_as_float(p.get("avgPrice"), 0.0) for p in rows], dtype=np.float64
+        )
+        # Start from the Data API mark; refresh_prices replaces it with live quotes.
+        self.mark = np.array([_as_float(p.get("curPrice")) for p in rows], dtype=np.float64)
+        self.mark = np.where(np.isnan(self.mark), self.avg_price, self.mark)
+        self.event_codes, self.events = _encode(
+            [position.get("eventSlug") or UNKNOWN_EVENT for position in rows]
+        )
+        self.category_codes, self.categories = _encode(
+            [
+                categories.get(str(position.get("conditionId")), UNCATEGORIZED)
+                for position in rows
+            ]
+        )
+        self._rows_by_token: dict[str, np.ndarray] = {}
+        for token_id, indices in self._group_rows().items():
+            self._rows_by_token[token_id] = np.asarray(indices, dtype=np.int64)
+        self._recompute()
+
+    def _group_rows(self) -> dict[str, list[int]]:
+        grouped: dict[str, list[int]] = {}
+        for row, token_id in enumerate(self.token_ids):
+            grouped.setdefault(token_id, []).append(row)
+        return grouped
+
+    def _recompute(self) -> None:
+        value = self.size * self.mark
+        self._event_value = np.bincount(
+            self.event_codes, weights=value, minlength=len(self.events)
+        )
+        self._category_value = np.bincount(
+            self.category_codes, weights=value, minlength=len(self.categories)
+        )
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    @property
+    def cost_basis(self) -> np.ndarray:
+        return self.size * self.avg_price
+
+    @property
+    def market_value(self) -> np.ndarray:
+        return self.size * self.mark
+
+    @property
+    def unrealized_pnl(self) -> np.ndarray:
+        return self.size * (self.mark - self.avg_price)
+
+    @property
+    def total_value(self) -> float:
+        return float(self._event_value.sum())
+
+    @property
+    def total_pnl(self) -> float:
+        return self.total_value - float(self.cost_basis.sum())
+
+    def exposure_by_event(self) -> dict[str, float]:
+        return dict(zip(self.events, self._event_value.tolist()))
+
+    def exposure_by_category(self) -> dict[str, float]:
+        return dict(zip(self.categories, self._category_value.tolist()))
+
+    def update_prices(self, prices: Mapping[str, float]) -> int:
+        """Apply new marks for a subset of tokens and return how many rows moved."""
+        indices: list[np.ndarray] = []
+        values: list[np.ndarray] = []
+        for token_id, price in prices.items():
+            rows = self._rows_by_token.get(str(token_id))
+            if rows is None or price is None:
+                continue
+            indices.append(rows)
+            values.append(np.full(len(rows), float(price)))
+        if not indices:
+            return 0
+        rows = np.concatenate(indices)
+        new_marks = np.concatenate(values)
+        delta = self.size[rows] * (new_marks - self.mark[rows])
+        changed = delta != 0
+        if not changed.any():
+            return 0
+        rows, new_marks, delta = rows[changed], new_marks[changed], delta[changed]
+        self.mark[rows] = new_marks
+        np.add.at(self._event_value, self.event_codes[rows], delta)
+        np.add.at(self._category_value, self.category_codes[rows], delta)
+        return int(len(rows))
+
+    def refresh_prices(self, source: ClobReader, mode: str = "mid") -> int:
+        """Re-mark every held token from bulk CLOB books; returns rows that moved.
+
+        `mode="mid"` marks at the bid/ask midpoint, `mode="bid"` at the best bid
+        (liquidation value). Tokens with no quotes keep their previous mark.
+        """
+        if mode not in PRICE_MODES:
+            raise ValueError(f"Unsupported price mode {mode!r}; choose from {PRICE_MODES}.")
+        token_ids = list(self._rows_by_token)
+        prices: dict[str, float] = {}
+        for start in range(0, len(token_ids), _BOOKS_PER_REQUEST):
+            for book in source.get_orderbooks(token_ids[start : start + _BOOKS_PER_REQUEST]):
+                price = _book_price(book, mode)
+                if price is not None:
+                    prices[str(book.asset_id)] = price
+        moved = self.update_prices(prices)
+        log_debug(f"Priced {len(prices)}/{len(token_ids)} tokens; {moved} positions moved")
+        return moved
+
+    def _group_shift(self, shifts: Mapping[str, float], by: str) -> np.ndarray:
+        if by == "token":
+            shift = np.zeros(len(self))
+            for token_id, amount in shifts.items():
+                rows = self._rows_by_token.get(str(token_id))
+                if rows is not None:
+                    shift[rows] = amount
+            return shift
+        if by == "event":
+            labels, codes = self.events, self.event_codes
+        elif by == "category":
+            labels, codes = self.categories, self.category_codes
+        else:
+            raise ValueError("Shocks can be grouped by 'token', 'event' or 'category'.")
+        lookup = np.array([float(shifts.get(label, 0.0)) for label in labels])
+        return lookup[codes] if len(labels) else np.zeros(0)
+
+    def shock(self, shifts: Mapping[str, float] | float, by: str = "token") -> ShockResult:
+        """Revalue after adding `shifts` to marks, with prices clipped to [0, 1].
+
+        A scalar shifts every position; a mapping is keyed by token id, event
+        slug or category depending on `by`.
+        """
+        if isinstance(shifts, (int, float)):
+            shift = np.full(len(self), float(shifts))
+        else:
+            shift = self._group_shift(shifts, by)
+        shocked = np.clip(self.mark + shift, 0.0, 1.0)
+        change = self.size * (shocked - self.mark)
+        by_event = np.bincount(self.event_codes, weights=change, minlength=len(self.events))
+        return ShockResult(
+            base_value=self.total_value,
+            shocked_value=self.total_value + float(change.sum()),
+            pnl_change=float(change.sum()),
+            by_event=dict(zip(self.events, by_event.tolist())),
+        )
+
+    def scenario_pnl(self, shifts: np.ndarray) -> np.ndarray:
+        """Return the PnL change for each row of an `(n_scenarios, n_positions)` shift matrix."""
+        shifts = np.atleast_2d(np.asarray(shifts, dtype=np.float64))
+        if shifts.shape[1] != len(self):
+            raise ValueError(f"Expected {len(self)} columns of price shifts.")
+        shocked = np.clip(self.mark + shifts, 0.0, 1.0)
+        return (shocked - self.mark) @ self.size
+
+
+def print_portfolio(portfolio: Portfolio, top: int = 10) -> None:
+    """Pretty-print totals and the largest event and category exposures."""
+    if not len(portfolio):
+        log_print("No positions to value.")
+        return
+    cost = float(portfolio.cost_basis.sum())
+    log_print(
+        f"Positions: {len(portfolio)} | Value: {portfolio.total_value:,.2f} USDC | "
+        f"Cost: {cost:,.2f} USDC | Unrealized P&L: {portfolio.total_pnl:+,.2f} USDC"
+    )
+    for heading, exposure in (
+        ("Event", portfolio.exposure_by_event()),
+        ("Category", portfolio.exposure_by_category()),
+    ):
+        log_print(f"{heading:<40} {'Exposure':>12}")
+        ranked = sorted(exposure.items(), key=lambda item: abs(item[1]), reverse=True)
+        for label, value in ranked[:top]:
+            log_print(f"{label[:40]:<40} {value:>12,.2f}")
@@ -0,0 +1,244 @@
+"""Fit ranked context into per-prompt token budgets before calling the LLM."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Sequence
+
+from polymarket_agents.application.prompts import Prompter
+from polymarket_agents.connectors.llm import CHARS_PER_TOKEN
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_ENCODING = "o200k_base"
+DEFAULT_MEMO_SIZE = 16_384
+# Total prompt tokens allowed per Prompter prompt type, template included.
+PROMPT_BUDGETS = {
+    "simple_ai_trader": 3_000,
+    "sentiment_analyzer": 2_000,
+    "superforecaster": 2_500,
+    "one_best_trade": 3_000,
+    "filter_events": 6_000,
+    "filter_markets": 6_000,
+}
+# A piece is truncated to fit the remaining budget only if at least this much is left.
+MIN_PARTIAL_TOKENS = 64
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = DEFAULT_ENCODING) -> Any | None:
+    """Load (once per process) a tiktoken encoding, or None when unavailable.
+
+    tiktoken downloads encoding files on first use; offline machines without a
+    populated cache fall back to a characters-per-token estimate.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception as exc:
+        log_debug(f"tiktoken encoding {name!r} unavailable, estimating tokens: {exc}")
+        return None
+
+
+class TokenCounter:
+    """Count and truncate text in tokens, memoising counts per distinct chunk."""
+
+    def __init__(
+        self, encoding: str = DEFAULT_ENCODING, memo_size: int = DEFAULT_MEMO_SIZE
+    ) -> None:
+        self.encoding = get_encoding(encoding)
+        self.memo_size = memo_size
+        self._memo: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _encode(self, text: str) -> list[int]:
+        return self.encoding.encode(text, disallowed_special=())
+
+    def count(self, text: str) -> int:
+        with self._lock:
+            cached = self._memo.get(text)
+            if cached is not None:
+                self._memo.move_to_end(text)
+                return cached
+        if self.encoding is None:
+            tokens = -(-len(text) // CHARS_PER_TOKEN)
+        else:
+            tokens = len(self._encode(text))
+        with self._lock:
+            self._memo[text] = tokens
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of `text` within `max_tokens`."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        if self.encoding is None:
+            return text[: max_tokens * CHARS_PER_TOKEN]
+        return self.encoding.decode(self._encode(text)[:max_tokens])
+
+
+@dataclass(slots=True)
+class PackedContext:
+    """Context pieces that fit a budget, and what was left out."""
+
+    text: str = ""
+    tokens: int = 0
+    included: int = 0
+    truncated: int = 0
+    dropped: int = 0
+    trimmed_tokens: int = 0
+
+
+@dataclass(slots=True)
+class AssembledPrompt:
+    """A rendered prompt with its token count and packing report."""
+
+    kind: str
+    prompt: str
+    tokens: int
+    budget: int
+    context: PackedContext = field(default_factory=PackedContext)
+
+
+class PromptAssembler:
+    """Render `Prompter` prompts with their variable context packed into a budget.
+
+    Context pieces are taken in rank order until the budget (the prompt
+    type's total budget minus its fixed template) is spent; the first piece
+    that does not fit is truncated when enough room remains, and the rest are
+    dropped. Token counts are reported per call so callers can see how much
+    was trimmed.
+    """
+
+    def __init__(
+        self,
+        counter: TokenCounter | None = None,
+        budgets: Mapping[str, int] | None = None,
+        prompter: Prompter | None = None,
+        separator: str = "\n\n",
+    ) -> None:
+        self.counter = counter or TokenCounter()
+        self.budgets = {**PROMPT_BUDGETS, **(budgets or {})}
+        self.prompter = prompter or Prompter()
+        self.separator = separator
+
+    def pack(self, pieces: Sequence[str], budget: int) -> PackedContext:
+        """Greedily pack ranked `pieces` into `budget` tokens."""
+        packed = PackedContext()
+        chosen: list[str] = []
+        separator_tokens = self.counter.count(self.separator)
+        remaining = max(budget, 0)
+        for position, piece in enumerate(pieces):
+            if not piece:
+                continue
+            cost = self.counter.count(piece) + (separator_tokens if chosen else 0)
+            if cost <= remaining:
+                chosen.append(piece)
+                remaining -= cost
+                packed.included += 1
+                continue
+            room = remaining - (separator_tokens if chosen else 0)
+            if room >= MIN_PARTIAL_TOKENS:
+                chosen.append(self.counter.truncate(piece, room))
+                packed.truncated += 1
+            rest = [item for item in pieces[position + 1 :] if item]
+            packed.dropped = len(rest) + (0 if room >= MIN_PARTIAL_TOKENS else 1)
+            break
+        packed.text = self.separator.join(chosen)
+        packed.tokens = self.counter.count(packed.text) if chosen else 0
+        total = sum(self.counter.count(piece) for piece in pieces if piece)
+        total += separator_tokens * max(sum(1 for piece in pieces if piece) - 1, 0)
+        packed.trimmed_tokens = max(total - packed.tokens, 0)
+        return packed
+
+    def assemble(
+        self, kind: str, render: Callable[[str], str], pieces: Sequence[str]
+    ) -> AssembledPrompt:
+        """Render `render(context)` for prompt type `kind` within its budget."""
+        if kind not in self.budgets:
+            raise ValueError(f"No token budget for prompt type {kind!r}.")
+        budget = self.budgets[kind]
+        overhead = self.counter.count(render(""))
+        context = self.pack(pieces, budget - overhead)
+        prompt = render(context.text)
+        assembled = AssembledPrompt(
+            kind=kind,
+            prompt=prompt,
+            tokens=self.counter.count(prompt),
+            budget=budget,
+            context=context,
+        )
+        if context.trimmed_tokens:
+            log_debug(
+                f"Prompt {kind}: {assembled.tokens}/{budget} tokens, "
+                f"trimmed {context.trimmed_tokens} ({context.truncated} truncated, "
+                f"{context.dropped} dropped)"
+            )
+        return assembled
+
+    def superforecaster(
+        self, question: str, description: str, outcome: str
+    ) -> AssembledPrompt:
+        return self.assemble(
+            "superforecaster",
+            lambda context: self.prompter.superforecaster(question, context, outcome),
+            [description],
+        )
+
+    def one_best_trade(
+        self,
+        prediction: str,
+        outcomes: Sequence[str],
+        outcome_prices: str,
+        structured: bool = False,
+    ) -> AssembledPrompt:
+        """Trade prompt with the free-text prediction trimmed to the budget."""
+        return self.assemble(
+            "one_best_trade",
+            lambda context: self.prompter.one_best_trade(
+                context, list(outcomes), outcome_prices, structured=structured
+            ),
+            [prediction],
+        )
+
+    def simple_ai_trader(
+        self, market_description: str, relevant_info: Sequence[str]
+    ) -> AssembledPrompt:
+        """Pack ranked RAG hits or news snippets into the simple trader prompt."""
+        return self.assemble(
+            "simple_ai_trader",
+            lambda context: Prompter.generate_simple_ai_trader(market_description, context),
+            relevant_info,
+        )
+
+    def sentiment_analyzer(
+        self, question: str, outcome: str, texts: Sequence[str]
+    ) -> AssembledPrompt:
+        """Sentiment prompt followed by as many ranked texts as fit."""
+        return self.assemble(
+            "sentiment_analyzer",
+            lambda context: self.prompter.sentiment_analyzer(question, outcome)
+            + (f"\n{context}" if context else ""),
+            texts,
+        )
+
+    def filter_markets(self, markets: Sequence[str]) -> AssembledPrompt:
+        return self.assemble(
+            "filter_markets",
+            lambda context: self.prompter.filter_markets() + context,
+            markets,
+        )
+
+    def filter_events(self, events: Sequence[str]) -> AssembledPrompt:
+        return self.assemble(
+            "filter_events",
+            lambda context: self.prompter.filter_events() + context,
+            events,
+        )
@@ -148,25 +148,23 @@ class Prompter:
         prediction: str,
         outcomes: List[str],
         outcome_prices: str,
+        structured: bool = False,
     ) -> str:
-        return (
-            self.polymarket_analyst_api()
-            + f"""
-        
-                Imagine yourself as the top trader on Polymarket, dominating the world of information markets with your keen insights and strategic acumen. You have an extraordinary ability to analyze and interpret data from diverse sources, turning complex information into profitable trading opportunities.
-                You excel in predicting the outcomes of global events, from political elections to economic developments, using a combination of data analysis and intuition. Your deep understanding of probability and statistics allows you to assess market sentiment and make informed decisions quickly.
-                Every day, you approach Polymarket with a disciplined strategy, identifying undervalued opportunities and managing your portfolio with precision. You are adept at evaluating the credibility of information and filtering out noise, ensuring that your trades are based on reliable data.
-                Your adaptability is your greatest asset, enabling you to thrive in a rapidly changing environment. You leverage cutting-edge technology and tools to gain an edge over other traders, constantly seeking innovative ways to enhance your strategies.
-                In your journey on Polymarket, you are committed to continuous learning, staying informed about the latest trends and developments in various sectors. Your emotional intelligence empowers you to remain composed under pressure, making rational decisions even when the stakes are high.
-                Visualize yourself consistently achieving outstanding returns, earning recognition as the top trader on Polymarket. You inspire others with your success, setting new standards of excellence in the world of information markets.
+        if structured:
+            return self._one_best_trade_intro(prediction, outcomes, outcome_prices) + f"""
+        Given your prediction, respond with a genius trade as a single JSON object and nothing else:
 
-        """
-            + f"""
-        
-        You made the following prediction for a market: {prediction}
+        {{"price": 0.5, "size": 0.1, "side": "BUY", "outcome": "{outcomes[0] if outcomes else 'Yes'}", "confidence": 0.7}}
 
-        The current outcomes ${outcomes} prices are: ${outcome_prices}
+        - price: limit price on the orderbook, a number strictly between 0 and 1
+        - size: fraction of total funds to commit, a number greater than 0 and at most 1
+        - side: "BUY" or "SELL"
+        - outcome: exactly one of {list(outcomes)}
+        - confidence: how confident you are in this trade, a number from 0 to 1
 
+        Your trade should approximate price using the likelihood in your prediction.
+        """
+        return self._one_best_trade_intro(prediction, outcomes, outcome_prices) + f"""
         Given your prediction, respond with a genius trade in the format:
         `
             price:'price_on_the_orderbook',
@@ -185,6 +183,29 @@ class Prompter:
         ```
         
         """
+
+    def _one_best_trade_intro(
+        self, prediction: str, outcomes: List[str], outcome_prices: str
+    ) -> str:
+        return (
+            self.polymarket_analyst_api()
+            + f"""
+        
+                Imagine yourself as the top trader on Polymarket, dominating the world of information markets with your keen insights and strategic acumen. You have an extraordinary ability to analyze and interpret data from diverse sources, turning complex information into profitable trading opportunities.
+                You excel in predicting the outcomes of global events, from political elections to economic developments, using a combination of data analysis and intuition. Your deep understanding of probability and statistics allows you to assess market sentiment and make informed decisions quickly.
+                Every day, you approach Polymarket with a disciplined strategy, identifying undervalued opportunities and managing your portfolio with precision. You are adept at evaluating the credibility of information and filtering out noise, ensuring that your trades are based on reliable data.
+                Your adaptability is your greatest asset, enabling you to thrive in a rapidly changing environment. You leverage cutting-edge technology and tools to gain an edge over other traders, constantly seeking innovative ways to enhance your strategies.
+                In your journey on Polymarket, you are committed to continuous learning, staying informed about the latest trends and developments in various sectors. Your emotional intelligence empowers you to remain composed under pressure, making rational decisions even when the stakes are high.
+                Visualize yourself consistently achieving outstanding returns, earning recognition as the top trader on Polymarket. You inspire others with your success, setting new standards of excellence in the world of information markets.
+
+        """
+            + f"""
+        
+        You made the following prediction for a market: {prediction}
+
+        The current outcomes ${outcomes} prices are: ${outcome_prices}
+
+        """
         )
 
     def format_price_from_one_best_trade_output(self, output: str) -> str:
@@ -0,0 +1,250 @@
+"""Multi-process catalogue scan for probabilistic arbitrage.
+
+Parsing `Market` models and evaluating books is CPU-bound Python, so a single
+process is limited by the GIL. This module stripes the Gamma offset space across
+worker processes: shard `k` of `n` scans batches `k, k + n, k + 2n, ...`. Each
+worker owns its HTTP session, streams compact `OpportunityRecord`s back to the
+parent, and stops as soon as the parent signals that `target_results` is met.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+from dataclasses import dataclass
+from typing import Callable
+
+from polymarket_agents.application.finder import (
+    MarketOpportunity,
+    OutcomeQuote,
+    ScanCoverage,
+    _scan_market,
+)
+from polymarket_agents.polymarket.book_cache import OrderBookCache
+from polymarket_agents.polymarket.clob import ClobReader
+from polymarket_agents.polymarket.gamma import GammaMarketClient
+from polymarket_agents.polymarket.polymarket import Polymarket
+from polymarket_agents.utils.logging import enable_logging, log_debug, log_error, log_print
+from polymarket_agents.utils.objects import Market
+
+ClientFactory = Callable[[], "tuple[GammaMarketClient, Polymarket | ClobReader]"]
+
+_RESULT_POLL_SECONDS = 0.5
+_SHUTDOWN_GRACE_SECONDS = 10.0
+
+
+@dataclass(slots=True, frozen=True)
+class OpportunityRecord:
+    """Compact, picklable summary of a `MarketOpportunity` sent between processes."""
+
+    market_id: int
+    question: str | None
+    slug: str | None
+    category: str | None
+    volume: float | None
+    execution_side: str
+    total_probability: float
+    profit_per_share: float
+    max_position_size: float
+    estimated_profit: float
+    detected_at: float
+    # (token_id, outcome_label, ask_price, ask_size, bid_price, bid_size, book_timestamp)
+    quotes: tuple[tuple, ...]
+    offset: int
+
+    @property
+    def key(self) -> tuple[int, str]:
+        return self.market_id, self.execution_side
+
+    @classmethod
+    def from_opportunity(cls, opportunity: MarketOpportunity, offset: int) -> "OpportunityRecord":
+        market = opportunity.market
+        return cls(
+            market_id=market.id,
+            question=market.question,
+            slug=market.slug,
+            category=market.category,
+            volume=market.volume,
+            execution_side=opportunity.execution_side,
+            total_probability=opportunity.total_probability,
+            profit_per_share=opportunity.profit_per_share,
+            max_position_size=opportunity.max_position_size,
+            estimated_profit=opportunity.estimated_profit,
+            detected_at=opportunity.detected_at,
+            quotes=tuple(
+                (
+                    quote.token_id,
+                    quote.outcome_label,
+                    quote.ask_price,
+                    quote.ask_size,
+                    quote.bid_price,
+                    quote.bid_size,
+                    quote.book_timestamp,
+                )
+                for quote in opportunity.quotes
+            ),
+            offset=offset,
+        )
+
+    def to_opportunity(self) -> MarketOpportunity:
+        """Rebuild a `MarketOpportunity` (with a slim `Market`) for display."""
+        return MarketOpportunity(
+            market=Market(
+                id=self.market_id,
+                question=self.question,
+                slug=self.slug,
+                category=self.category,
+                volume=self.volume,
+            ),
+            total_probability=self.total_probability,
+            quotes=[OutcomeQuote(*quote) for quote in self.quotes],
+            execution_side=self.execution_side,
+            profit_per_share=self.profit_per_share,
+            max_position_size=self.max_position_size,
+            estimated_profit=self.estimated_profit,
+            detected_at=self.detected_at,
+        )
+
+
+def default_clients() -> tuple[GammaMarketClient, ClobReader]:
+    """Live Gamma client plus an unauthenticated CLOB reader (books are public)."""
+    return GammaMarketClient(), ClobReader()
+
+
+def _scan_shard(
+    shard: int,
+    n_shards: int,
+    start_offset: int,
+    batch_limit: int,
+    client_factory: ClientFactory,
+    results: multiprocessing.Queue,
+    cancel: multiprocessing.synchronize.Event,
+) -> None:
+    """Worker entry point: scan every `n_shards`-th batch and stream hits back."""
+    enable_logging(False)
+    scanned = unseen = 0
+    observed_ids: list[int] = []
+    exhausted = False
+    try:
+        gamma, book_source = client_factory()
+        book_source = OrderBookCache(book_source)
+        batch_index = shard
+        while not cancel.is_set():
+            offset = start_offset + batch_index * batch_limit
+            markets = gamma.get_tradable_markets(limit=batch_limit, offset=offset)
+            for position, market in enumerate(markets):
+                if cancel.is_set():
+                    break
+                opportunity, observed = _scan_market(market, book_source)
+                scanned += 1
+                unseen += not observed
+                if observed:
+                    observed_ids.append(int(market.id))
+                if opportunity is not None:
+                    record = OpportunityRecord.from_opportunity(opportunity, offset + position)
+                    results.put(("opportunity", shard, record))
+            if len(markets) < batch_limit:
+                exhausted = not cancel.is_set()
+                break
+            batch_index += n_shards
+    except Exception as exc:
+        results.put(("error", shard, f"{type(exc).__name__}: {exc}"))
+    finally:
+        # (markets scanned, markets whose books were not read, reached the end,
+        #  ids of the markets whose books were read)
+        results.put(("done", shard, (scanned, unseen, exhausted, observed_ids)))
+
+
+def find_probabilistic_arbitrage_sharded(
+    target_results: int = 2,
+    batch_limit: int = 200,
+    start_offset: int = 0,
+    workers: int = 4,
+    client_factory: ClientFactory = default_clients,
+    coverage: ScanCoverage | None = None,
+) -> list[OpportunityRecord]:
+    """Scan the catalogue with `workers` processes and merge their opportunities.
+
+    Results are deduplicated by `(market id, side)` and capped at `target_results`
+    across all shards; the remaining shards are cancelled once the cap is hit.
+    `client_factory` runs inside each worker and must be picklable. A `coverage`
+    object, if given, is filled in from every shard's report.
+    """
+    coverage = coverage if coverage is not None else ScanCoverage()
+    coverage.start_offset = max(start_offset, 0)
+    exhausted_shards = 0
+    workers = max(int(workers), 1)
+    context = multiprocessing.get_context()
+    results = context.Queue()
+    cancel = context.Event()
+    processes = [
+        context.Process(
+            target=_scan_shard,
+            args=(
+                shard,
+                workers,
+                max(start_offset, 0),
+                batch_limit,
+                client_factory,
+                results,
+                cancel,
+            ),
+            daemon=True,
+        )
+        for shard in range(workers)
+    ]
+    log_print(f"Scanning catalogue with {workers} worker processes...")
+    for process in processes:
+        process.start()
+
+    opportunities: dict[tuple[int, str], OpportunityRecord] = {}
+    finished: set[int] = set()
+    detected: set[int] = set()
+    scanned = 0
+    try:
+        while len(finished) < workers:
+            try:
+                kind, shard, payload = results.get(timeout=_RESULT_POLL_SECONDS)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            if kind == "opportunity":
+                detected.add(payload.market_id)
+                if cancel.is_set() or payload.key in opportunities:
+                    continue
+                opportunities[payload.key] = payload
+                log_print(
+                    f"  Potential arbitrage in market {payload.market_id} "
+                    f"(sum={payload.total_probability:.4f}, shard {shard})"
+                )
+                if len(opportunities) >= target_results:
+                    log_debug("Target reached; cancelling remaining shards.")
+                    cancel.set()
+            elif kind == "error":
+                log_error(f"Shard {shard} failed: {payload}")
+            elif kind == "done":
+                finished.add(shard)
+                shard_scanned, shard_unseen, shard_exhausted, shard_observed = payload
+                scanned += shard_scanned
+                coverage.unseen += shard_unseen
+                coverage.observed.update(shard_observed)
+                exhausted_shards += shard_exhausted
+    finally:
+        cancel.set()
+        for process in processes:
+            process.join(timeout=_SHUTDOWN_GRACE_SECONDS)
+            if process.is_alive():
+                process.terminate()
+        results.close()
+
+    coverage.markets = scanned
+    coverage.exhausted = exhausted_shards == workers and len(opportunities) < target_results
+    merged = list(opportunities.values())[:target_results]
+    # Hits dropped past the cap were still detected; don't report them as absent.
+    coverage.observed -= detected - {record.market_id for record in merged}
+    log_print(
+        f"Finished sharded scan of {scanned} markets: discovered {len(merged)} "
+        f"opportunit{'y' if len(merged) == 1 else 'ies'}."
+    )
+    return merged
@@ -0,0 +1,228 @@
+"""Local SQLite copy of the account's CLOB trade history with incremental sync."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Iterable, Protocol
+
+from py_clob_client.clob_types import TradeParams
+
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_TRADE_LEDGER_PATH = "./local_db_trades/trades.sqlite"
+# Trades move MATCHED -> MINED -> CONFIRMED (or RETRYING/FAILED) after matching,
+# so each sync re-reads this window before the newest stored match to pick up
+# status changes.
+DEFAULT_RESYNC_WINDOW_S = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id TEXT PRIMARY KEY,
+    account TEXT NOT NULL,
+    market TEXT,
+    asset_id TEXT,
+    side TEXT,
+    size REAL,
+    price REAL,
+    status TEXT,
+    outcome TEXT,
+    trader_side TEXT,
+    match_time INTEGER,
+    last_update INTEGER,
+    transaction_hash TEXT,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS maker_orders (
+    trade_id TEXT NOT NULL REFERENCES trades(id) ON DELETE CASCADE,
+    order_id TEXT,
+    maker_address TEXT,
+    matched_amount REAL,
+    price REAL,
+    asset_id TEXT,
+    outcome TEXT,
+    side TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT PRIMARY KEY,
+    last_match_time INTEGER,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_account_time ON trades(account, match_time DESC);
+CREATE INDEX IF NOT EXISTS trades_account_market ON trades(account, market, match_time DESC);
+CREATE INDEX IF NOT EXISTS maker_orders_trade ON maker_orders(trade_id);
+"""
+
+
+class TradeSource(Protocol):
+    def get_trades(self, params: TradeParams = None, next_cursor: str = "MA==") -> list[dict]: ...
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _float_or_none(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TradeLedger:
+    """SQLite-backed trade history keyed by trade id and scoped per account.
+
+    `sync` asks the CLOB only for trades matched after the newest stored one
+    (minus a short re-sync window) and upserts them, so repeated calls fetch a
+    handful of records instead of the whole history. Reads are served from the
+    `(account, match_time)` and `(account, market, match_time)` indexes.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_TRADE_LEDGER_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "TradeLedger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def last_match_time(self, account: str) -> int | None:
+        row = self.connection.execute(
+            "SELECT last_match_time FROM sync_state WHERE account = ?", (account,)
+        ).fetchone()
+        return row["last_match_time"] if row else None
+
+    def sync(
+        self,
+        source: TradeSource,
+        account: str,
+        resync_window_s: int = DEFAULT_RESYNC_WINDOW_S,
+    ) -> int:
+        """Fetch trades newer than the last sync and return how many were stored.
+
+        The first sync for an account downloads the full history once.
+        """
+        last_seen = self.last_match_time(account)
+        after = max(last_seen - resync_window_s, 0) if last_seen is not None else None
+        started = time.perf_counter()
+        trades = source.get_trades(TradeParams(after=after))
+        stored = self.upsert(account, trades)
+        log_debug(
+            f"Synced {stored} trades for {account} after={after} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return stored
+
+    def upsert(self, account: str, trades: Iterable[dict]) -> int:
+        """Insert or refresh raw CLOB trade dictionaries for `account`."""
+        stored = 0
+        newest = self.last_match_time(account)
+        with self.connection:
+            for trade in trades:
+                trade_id = trade.get("id")
+                if not trade_id:
+                    continue
+                match_time = _int_or_none(trade.get("match_time"))
+                if match_time is not None and (newest is None or match_time > newest):
+                    newest = match_time
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO trades (id, account, market, asset_id, side, "
+                    "size, price, status, outcome, trader_side, match_time, last_update, "
+                    "transaction_hash, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        trade_id,
+                        account,
+                        trade.get("market"),
+                        trade.get("asset_id"),
+                        trade.get("side"),
+                        _float_or_none(trade.get("size")),
+                        _float_or_none(trade.get("price")),
+                        trade.get("status"),
+                        trade.get("outcome"),
+                        trade.get("trader_side"),
+                        match_time,
+                        _int_or_none(trade.get("last_update")),
+                        trade.get("transaction_hash"),
+                        json.dumps(trade),
+                    ),
+                )
+                self.connection.execute(
+                    "DELETE FROM maker_orders WHERE trade_id = ?", (trade_id,)
+                )
+                self.connection.executemany(
+                    "INSERT INTO maker_orders (trade_id, order_id, maker_address, "
+                    "matched_amount, price, asset_id, outcome, side) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            trade_id,
+                            order.get("order_id"),
+                            order.get("maker_address"),
+                            _float_or_none(order.get("matched_amount")),
+                            _float_or_none(order.get("price")),
+                            order.get("asset_id"),
+                            order.get("outcome"),
+                            order.get("side"),
+                        )
+                        for order in trade.get("maker_orders") or []
+                    ],
+                )
+                stored += 1
+            self.connection.execute(
+                "INSERT INTO sync_state (account, last_match_time, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(account) DO UPDATE SET "
+                "last_match_time = excluded.last_match_time, synced_at = excluded.synced_at",
+                (account, newest, time.time()),
+            )
+        return stored
+
+    def recent(
+        self,
+        account: str,
+        limit: int = 10,
+        since: int | None = None,
+        until: int | None = None,
+        market: str | None = None,
+    ) -> list[dict]:
+        """Return stored trades, newest first, as the raw CLOB dictionaries."""
+        clauses = ["account = ?"]
+        args: list[Any] = [account]
+        if market:
+            clauses.append("market = ?")
+            args.append(market)
+        if since is not None:
+            clauses.append("match_time >= ?")
+            args.append(int(since))
+        if until is not None:
+            clauses.append("match_time <= ?")
+            args.append(int(until))
+        args.append(int(limit))
+        rows = self.connection.execute(
+            f"SELECT payload FROM trades WHERE {' AND '.join(clauses)} "
+            "ORDER BY match_time DESC LIMIT ?",
+            args,
+        )
+        return [json.loads(row["payload"]) for row in rows]
+
+    def count(self, account: str) -> int:
+        row = self.connection.execute(
+            "SELECT COUNT(*) AS n FROM trades WHERE account = ?", (account,)
+        ).fetchone()
+        return int(row["n"])
+
@@ -0,0 +1,84 @@
+"""Turn a forecast into one validated trade with a single structured LLM call."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from polymarket_agents.application.prompt_budget import PromptAssembler
+from polymarket_agents.application.prompts import Prompter
+from polymarket_agents.connectors.llm import LLMClient
+from polymarket_agents.utils.logging import log_print
+from polymarket_agents.utils.objects import TradeRecommendation
+
+DEFAULT_TICK_SIZE = 0.01
+
+
+class TradeRecommendationError(ValueError):
+    """A recommendation that parsed but cannot be traded on this market."""
+
+
+def validate_trade_recommendation(
+    recommendation: TradeRecommendation,
+    outcomes: Sequence[str],
+    tick_size: float = DEFAULT_TICK_SIZE,
+) -> TradeRecommendation:
+    """Check a recommendation against the market it is meant for.
+
+    Field ranges and types are enforced by `TradeRecommendation` itself; this
+    adds the market-specific rules: the outcome must be one of `outcomes` and
+    the price must sit on the order book's tick grid, inside `[tick, 1 - tick]`.
+    """
+    if recommendation.outcome not in outcomes:
+        raise TradeRecommendationError(
+            f"Outcome {recommendation.outcome!r} is not one of {list(outcomes)}."
+        )
+    ticks = recommendation.price / tick_size
+    if abs(ticks - round(ticks)) > 1e-6:
+        raise TradeRecommendationError(
+            f"Price {recommendation.price} is not a multiple of tick size {tick_size}."
+        )
+    if not tick_size <= recommendation.price <= 1 - tick_size:
+        raise TradeRecommendationError(
+            f"Price {recommendation.price} is outside [{tick_size}, {1 - tick_size}]."
+        )
+    return recommendation
+
+
+def recommend_trade(
+    client: LLMClient,
+    prediction: str,
+    outcomes: Sequence[str],
+    outcome_prices: str,
+    tick_size: float = DEFAULT_TICK_SIZE,
+    prompter: Prompter | None = None,
+    assembler: PromptAssembler | None = None,
+    cache_scope: str | None = None,
+) -> TradeRecommendation:
+    """Ask `Prompter.one_best_trade` for a typed trade and validate it locally.
+
+    Replaces the free-text answer plus the two follow-up extraction calls
+    (`format_price_from_one_best_trade_output` and
+    `format_size_from_one_best_trade_output`) with one call whose answer is
+    parsed into `TradeRecommendation`. With an `assembler` the prediction is
+    trimmed to the prompt's token budget. Invalid answers raise `ValueError`.
+    """
+    if assembler is not None:
+        prompt = assembler.one_best_trade(
+            prediction, outcomes, outcome_prices, structured=True
+        ).prompt
+    else:
+        prompt = (prompter or Prompter()).one_best_trade(
+            prediction, list(outcomes), outcome_prices, structured=True
+        )
+    recommendation = client.complete_structured(
+        prompt, TradeRecommendation, name="one_best_trade", cache_scope=cache_scope
+    )
+    return validate_trade_recommendation(recommendation, outcomes, tick_size)
+
+
+def print_trade_recommendation(market_id: str, recommendation: TradeRecommendation) -> None:
+    log_print(
+        f"[{market_id}] {recommendation.side} {recommendation.outcome} "
+        f"at {recommendation.price:.2f} with {recommendation.size:.0%} of funds "
+        f"(confidence {recommendation.confidence:.0%})"
+    )
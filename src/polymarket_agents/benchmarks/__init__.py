@@ -0,0 +1,29 @@
+from .finder import (
+    SCALES,
+    BenchmarkReport,
+    StageResult,
+    compare_reports,
+    print_report,
+    run_finder_benchmark,
+    write_report,
+)
+from .vector_index import (
+    VectorBenchmarkReport,
+    print_vector_report,
+    run_vector_benchmark,
+    write_vector_report,
+)
+
+__all__ = [
+    "SCALES",
+    "BenchmarkReport",
+    "StageResult",
+    "VectorBenchmarkReport",
+    "compare_reports",
+    "print_report",
+    "print_vector_report",
+    "run_finder_benchmark",
+    "run_vector_benchmark",
+    "write_report",
+    "write_vector_report",
+]
@@ -0,0 +1,324 @@
+"""Throughput benchmarks for the probabilistic-arbitrage finder.
+
+Runs the full `find_probabilistic_arbitrage` pipeline and each stage on its own
+(fetch, parse, quote collection, evaluation) against a synthetic universe served
+in-process, then reports markets/sec, per-market latency percentiles, the change
+in resident memory over each stage and the process's peak RSS.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable
+
+from polymarket_agents.application.finder import (
+    _build_opportunity,
+    _collect_orderbook_quotes,
+    _iter_token_ids,
+    find_probabilistic_arbitrage,
+)
+from polymarket_agents.application.sharded_scan import find_probabilistic_arbitrage_sharded
+from polymarket_agents.polymarket.clob import ClobReader
+from polymarket_agents.polymarket.gamma import GammaMarketClient
+from polymarket_agents.replay import SyntheticBackend, SyntheticUniverse, backend_client
+from polymarket_agents.utils.logging import enable_logging, is_enabled, log_print
+
+SCALES: dict[str, int] = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+
+@dataclass(slots=True)
+class StageResult:
+    """Timing summary for one benchmark stage."""
+
+    stage: str
+    markets: int
+    elapsed_s: float
+    markets_per_s: float
+    p50_ms: float | None
+    p99_ms: float | None
+    rss_delta_mb: float  # resident memory after the stage minus before it
+
+
+@dataclass(slots=True)
+class BenchmarkReport:
+    """Machine-readable record of a benchmark run."""
+
+    params: dict
+    stages: list[StageResult] = field(default_factory=list)
+    peak_rss_mb: float = 0.0  # whole process, over the entire run
+    commit: str | None = None
+    python: str = platform.python_version()
+    platform: str = platform.platform()
+    started_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class SyntheticClients:
+    """Picklable client factory so worker processes can serve the same universe."""
+
+    universe: SyntheticUniverse
+
+    def __call__(self) -> tuple[GammaMarketClient, ClobReader]:
+        http_client = backend_client(SyntheticBackend(self.universe))
+        return GammaMarketClient(http_client=http_client), ClobReader(http_client=http_client)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _current_rss_mb() -> float:
+    """Resident set size right now; falls back to the peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return _peak_rss_mb()
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class _BatchTimer:
+    """Gamma proxy timing each batch, from one `get_tradable_markets` call to the next.
+
+    Each market is attributed its batch's elapsed time divided by the batch size,
+    which gives per-market latencies for stages that only run whole batches.
+    """
+
+    def __init__(self, gamma: GammaMarketClient) -> None:
+        self.gamma = gamma
+        self.latencies: list[float] = []
+        self._batch: tuple[float, int] | None = None
+
+    def _close_batch(self) -> None:
+        if self._batch is not None:
+            started, size = self._batch
+            if size:
+                self.latencies.extend([(time.perf_counter() - started) / size] * size)
+            self._batch = None
+
+    def get_tradable_markets(self, *args, **kwargs):
+        self._close_batch()
+        started = time.perf_counter()
+        markets = self.gamma.get_tradable_markets(*args, **kwargs)
+        self._batch = (started, len(markets))
+        return markets
+
+    def finish(self) -> list[float]:
+        self._close_batch()
+        return self.latencies
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float | None:
+    if not sorted_values:
+        return None
+    position = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[position]
+
+
+def _summarise(
+    stage: str,
+    markets: int,
+    elapsed: float,
+    latencies: Iterable[float] = (),
+    rss_before: float | None = None,
+) -> StageResult:
+    ordered = sorted(latencies)
+    p50 = _percentile(ordered, 0.50)
+    p99 = _percentile(ordered, 0.99)
+    return StageResult(
+        stage=stage,
+        markets=markets,
+        elapsed_s=round(elapsed, 6),
+        markets_per_s=round(markets / elapsed, 2) if elapsed > 0 else 0.0,
+        p50_ms=round(p50 * 1000, 4) if p50 is not None else None,
+        p99_ms=round(p99 * 1000, 4) if p99 is not None else None,
+        rss_delta_mb=round(_current_rss_mb() - rss_before, 2) if rss_before is not None else 0.0,
+    )
+
+
+def _timed_per_market(items: list, work: Callable) -> tuple[list, float, list[float]]:
+    results: list = []
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for item in items:
+        tick = time.perf_counter()
+        results.append(work(item))
+        latencies.append(time.perf_counter() - tick)
+    return results, time.perf_counter() - started, latencies
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def run_finder_benchmark(
+    n_markets: int = 1_000,
+    min_outcomes: int = 2,
+    max_outcomes: int = 2,
+    min_depth: int = 1,
+    max_depth: int = 10,
+    batch_limit: int = 500,
+    seed: int = 0,
+    workers: int = 0,
+) -> BenchmarkReport:
+    """Benchmark the finder stages and full pipeline on a synthetic universe.
+
+    With `workers` above zero the sharded multi-process scan is timed as well.
+    """
+    universe = SyntheticUniverse(
+        n_markets=n_markets,
+        min_outcomes=min_outcomes,
+        max_outcomes=max_outcomes,
+        min_depth=min_depth,
+        max_depth=max_depth,
+        seed=seed,
+    )
+    report = BenchmarkReport(
+        params=asdict(universe) | {"batch_limit": batch_limit, "workers": workers}
+    )
+    report.commit = _git_commit()
+    gamma, clob = SyntheticClients(universe)()
+
+    logging_was_enabled = is_enabled()
+    enable_logging(False)
+    try:
+        # Baseline: cost of generating synthetic books, included in the quote stage.
+        sample = range(0, n_markets, max(n_markets // 1_000, 1))
+        rss = _current_rss_mb()
+        _, elapsed, latencies = _timed_per_market(
+            list(sample),
+            lambda index: [universe.book(token) for token in universe.token_ids(index)],
+        )
+        report.stages.append(_summarise("generate", len(sample), elapsed, latencies, rss))
+
+        raw_markets: list[dict] = []
+        rss = _current_rss_mb()
+        timer = _BatchTimer(gamma)
+        started = time.perf_counter()
+        for offset in range(0, n_markets, batch_limit):
+            raw_markets.extend(
+                timer.get_tradable_markets(limit=batch_limit, offset=offset, parse_pydantic=False)
+            )
+        report.stages.append(
+            _summarise(
+                "fetch", len(raw_markets), time.perf_counter() - started, timer.finish(), rss
+            )
+        )
+
+        rss = _current_rss_mb()
+        parsed, elapsed, latencies = _timed_per_market(raw_markets, gamma.parse_pydantic_market)
+        markets = [market for market in parsed if market is not None]
+        report.stages.append(_summarise("parse", len(raw_markets), elapsed, latencies, rss))
+        del raw_markets, parsed
+
+        rss = _current_rss_mb()
+        quotes, elapsed, latencies = _timed_per_market(
+            markets,
+            lambda market: _collect_orderbook_quotes(market, clob, _iter_token_ids(market)),
+        )
+        report.stages.append(_summarise("quotes", len(markets), elapsed, latencies, rss))
+
+        rss = _current_rss_mb()
+        _, elapsed, latencies = _timed_per_market(
+            list(zip(markets, quotes)),
+            lambda pair: _build_opportunity(pair[0], pair[1]) if pair[1] else None,
+        )
+        report.stages.append(_summarise("evaluate", len(markets), elapsed, latencies, rss))
+        del markets, quotes
+
+        rss = _current_rss_mb()
+        timer = _BatchTimer(gamma)
+        started = time.perf_counter()
+        find_probabilistic_arbitrage(
+            target_results=n_markets + 1,
+            batch_limit=batch_limit,
+            gamma=timer,
+            polymarket=clob,
+        )
+        report.stages.append(
+            _summarise(
+                "pipeline", n_markets, time.perf_counter() - started, timer.finish(), rss
+            )
+        )
+
+        if workers > 0:
+            rss = _current_rss_mb()
+            started = time.perf_counter()
+            find_probabilistic_arbitrage_sharded(
+                target_results=n_markets + 1,
+                batch_limit=batch_limit,
+                workers=workers,
+                client_factory=SyntheticClients(universe),
+            )
+            report.stages.append(
+                _summarise("sharded", n_markets, time.perf_counter() - started, rss_before=rss)
+            )
+        report.peak_rss_mb = round(_peak_rss_mb(), 2)
+    finally:
+        enable_logging(logging_was_enabled)
+        gamma.http_client.close()
+    return report
+
+
+def write_report(report: BenchmarkReport, output_dir: str | Path = "bench_results") -> Path:
+    """Persist a report as JSON named after the commit and start time."""
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = report.started_at.replace(":", "").replace("-", "").split(".")[0]
+    path = directory / f"finder-{report.commit or 'nocommit'}-{stamp}.json"
+    path.write_text(json.dumps(report.to_dict(), indent=2))
+    return path
+
+
+def compare_reports(baseline: str | Path, current: str | Path) -> dict[str, float]:
+    """Return current/baseline throughput ratios per stage (below 1.0 is a regression)."""
+    before = json.loads(Path(baseline).read_text())
+    after = json.loads(Path(current).read_text())
+    baseline_rates = {stage["stage"]: stage["markets_per_s"] for stage in before["stages"]}
+    ratios: dict[str, float] = {}
+    for stage in after["stages"]:
+        previous = baseline_rates.get(stage["stage"])
+        if previous:
+            ratios[stage["stage"]] = round(stage["markets_per_s"] / previous, 4)
+    return ratios
+
+
+def print_report(report: BenchmarkReport) -> None:
+    """Render a report as an aligned table."""
+    log_print(
+        f"{'stage':<10} {'markets':>9} {'elapsed s':>10} {'mkts/s':>11} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'Δrss MB':>8}"
+    )
+    for stage in report.stages:
+        p50 = f"{stage.p50_ms:.3f}" if stage.p50_ms is not None else "-"
+        p99 = f"{stage.p99_ms:.3f}" if stage.p99_ms is not None else "-"
+        log_print(
+            f"{stage.stage:<10} {stage.markets:>9} {stage.elapsed_s:>10.3f} "
+            f"{stage.markets_per_s:>11.1f} {p50:>9} {p99:>9} {stage.rss_delta_mb:>+8.1f}"
+        )
+    log_print(f"Peak RSS (whole run): {report.peak_rss_mb:.1f} MB")
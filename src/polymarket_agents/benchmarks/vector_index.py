@@ -0,0 +1,196 @@
+"""Start-up and query latency of the memory-mapped index against Chroma.
+
+Both backends are loaded with the same random unit vectors and `category`
+metadata. Start-up is timed in a fresh process (open plus first query) so
+neither backend benefits from state already warm in the benchmark process.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from polymarket_agents.benchmarks.finder import _git_commit, _percentile
+from polymarket_agents.connectors.vector_index import MemmapVectorIndex
+from polymarket_agents.utils.logging import log_print
+
+BACKENDS = ("chroma", "memmap")
+_CATEGORIES = ("Politics", "Sports", "Crypto", "Business", "Science", "Pop Culture")
+_COLLECTION = "markets"
+_CHROMA_BATCH = 5_000
+
+
+@dataclass(slots=True)
+class VectorBackendResult:
+    """Latency summary for one backend."""
+
+    backend: str
+    vectors: int
+    build_s: float
+    startup_ms: float
+    p50_ms: float | None
+    p99_ms: float | None
+    filtered_p50_ms: float | None
+    filtered_p99_ms: float | None
+
+
+@dataclass(slots=True)
+class VectorBenchmarkReport:
+    """Machine-readable record of a vector index benchmark run."""
+
+    params: dict
+    results: list[VectorBackendResult] = field(default_factory=list)
+    commit: str | None = None
+    started_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _open_chroma(directory: str):
+    import chromadb
+
+    client = chromadb.PersistentClient(path=directory)
+    return client.get_or_create_collection(_COLLECTION, metadata={"hnsw:space": "cosine"})
+
+
+def _query(backend: str, handle, vector: np.ndarray, k: int, where: dict | None) -> None:
+    if backend == "memmap":
+        handle.search_by_vector(vector, k=k, where=where)
+    else:
+        handle.query(query_embeddings=[vector.tolist()], n_results=k, where=where)
+
+
+def _startup_probe(backend: str, directory: str, vector: list[float], k: int) -> float:
+    """Open a backend and run one query; runs in a fresh process."""
+    started = time.perf_counter()
+    if backend == "memmap":
+        handle = MemmapVectorIndex(directory, _COLLECTION)
+    else:
+        handle = _open_chroma(directory)
+    _query(backend, handle, np.asarray(vector, dtype=np.float32), k, None)
+    return time.perf_counter() - started
+
+
+def _latencies(backend: str, handle, queries: np.ndarray, k: int, where: dict | None) -> list[float]:
+    latencies: list[float] = []
+    for vector in queries:
+        tick = time.perf_counter()
+        _query(backend, handle, vector, k, where)
+        latencies.append(time.perf_counter() - tick)
+    return sorted(latencies)
+
+
+def _ms(value: float | None) -> float | None:
+    return round(value * 1000, 4) if value is not None else None
+
+
+def run_vector_benchmark(
+    n_vectors: int = 20_000,
+    dim: int = 768,
+    n_queries: int = 200,
+    k: int = 4,
+    seed: int = 0,
+    backends: tuple[str, ...] = BACKENDS,
+) -> VectorBenchmarkReport:
+    """Build each backend over the same vectors and time start-up and queries."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n_vectors, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = rng.standard_normal((n_queries, dim), dtype=np.float32)
+    ids = [str(index) for index in range(n_vectors)]
+    metadatas = [
+        {"id": doc_id, "category": _CATEGORIES[index % len(_CATEGORIES)]}
+        for index, doc_id in enumerate(ids)
+    ]
+    contents = [f"market {doc_id}" for doc_id in ids]
+    where = {"category": _CATEGORIES[0]}
+
+    report = VectorBenchmarkReport(
+        params={"n_vectors": n_vectors, "dim": dim, "n_queries": n_queries, "k": k, "seed": seed}
+    )
+    report.commit = _git_commit()
+    spawn = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as scratch:
+        for backend in backends:
+            directory = str(Path(scratch) / backend)
+            started = time.perf_counter()
+            if backend == "memmap":
+                handle = MemmapVectorIndex.write(
+                    directory, _COLLECTION, ids, vectors, contents, metadatas
+                )
+            elif backend == "chroma":
+                handle = _open_chroma(directory)
+                for start in range(0, n_vectors, _CHROMA_BATCH):
+                    stop = start + _CHROMA_BATCH
+                    handle.add(
+                        ids=ids[start:stop],
+                        embeddings=vectors[start:stop],
+                        documents=contents[start:stop],
+                        metadatas=metadatas[start:stop],
+                    )
+            else:
+                raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}.")
+            build_s = time.perf_counter() - started
+
+            with spawn.Pool(1) as pool:
+                startup = pool.apply(_startup_probe, (backend, directory, queries[0].tolist(), k))
+            plain = _latencies(backend, handle, queries, k, None)
+            filtered = _latencies(backend, handle, queries, k, where)
+            report.results.append(
+                VectorBackendResult(
+                    backend=backend,
+                    vectors=n_vectors,
+                    build_s=round(build_s, 4),
+                    startup_ms=_ms(startup),
+                    p50_ms=_ms(_percentile(plain, 0.50)),
+                    p99_ms=_ms(_percentile(plain, 0.99)),
+                    filtered_p50_ms=_ms(_percentile(filtered, 0.50)),
+                    filtered_p99_ms=_ms(_percentile(filtered, 0.99)),
+                )
+            )
+            del handle
+    return report
+
+
+def write_vector_report(
+    report: VectorBenchmarkReport, output_dir: str | Path = "bench_results"
+) -> Path:
+    """Persist a report as JSON named after the commit and start time."""
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = report.started_at.replace(":", "").replace("-", "").split(".")[0]
+    path = directory / f"vector-index-{report.commit or 'nocommit'}-{stamp}.json"
+    path.write_text(json.dumps(report.to_dict(), indent=2))
+    return path
+
+
+def print_vector_report(report: VectorBenchmarkReport) -> None:
+    """Render a report as an aligned table."""
+    log_print(
+        f"{'backend':<8} {'vectors':>8} {'build s':>8} {'start ms':>9} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'filt p50':>9} {'filt p99':>9}"
+    )
+    for result in report.results:
+        cells = [
+            f"{value:.3f}" if value is not None else "-"
+            for value in (
+                result.p50_ms,
+                result.p99_ms,
+                result.filtered_p50_ms,
+                result.filtered_p99_ms,
+            )
+        ]
+        log_print(
+            f"{result.backend:<8} {result.vectors:>8} {result.build_s:>8.2f} "
+            f"{result.startup_ms:>9.1f} {cells[0]:>8} {cells[1]:>8} {cells[2]:>9} {cells[3]:>9}"
+        )
@@ -1,14 +1,80 @@
 """Command-line interface for interacting with Polymarket trading agents."""
 
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
 import typer
+from polymarket_agents.application.change_detection import (
+    DEFAULT_CHANGE_STATE_PATH,
+    ChangeDetector,
+    print_change_decisions,
+)
+from polymarket_agents.application.forecast_batch import (
+    BatchForecaster,
+    build_forecast_tasks,
+    print_forecast_result,
+)
 from polymarket_agents.application.finder import (
+    ScanCoverage,
     describe_opportunities,
     find_probabilistic_arbitrage,
 )
+from polymarket_agents.application.opportunity_ledger import (
+    DEFAULT_LEDGER_PATH,
+    OpportunityLedger,
+    print_category_stats,
+)
+from polymarket_agents.application.prompt_budget import PromptAssembler
+from polymarket_agents.application.portfolio import PRICE_MODES, Portfolio, print_portfolio
+from polymarket_agents.application.sharded_scan import find_probabilistic_arbitrage_sharded
+from polymarket_agents.application.trade_ledger import DEFAULT_TRADE_LEDGER_PATH, TradeLedger
+from polymarket_agents.application.trade_recommendation import (
+    DEFAULT_TICK_SIZE,
+    print_trade_recommendation,
+    recommend_trade,
+)
+from polymarket_agents.benchmarks import (
+    SCALES,
+    compare_reports,
+    print_report,
+    print_vector_report,
+    run_finder_benchmark,
+    run_vector_benchmark,
+    write_report,
+    write_vector_report,
+)
+from polymarket_agents.connectors.article_store import DEFAULT_ARTICLE_STORE_PATH, ArticleStore
+from polymarket_agents.connectors.chroma_collections import (
+    DEFAULT_COLLECTIONS_DIRECTORY,
+    metadata_filter,
+)
+from polymarket_agents.connectors.llm import build_llm_client
+from polymarket_agents.connectors.llm_metrics import (
+    DEFAULT_CALL_LOG_PATH,
+    JsonlExporter,
+    LLMMetrics,
+    print_llm_report,
+    read_call_log,
+)
+from polymarket_agents.connectors.rag_service import get_rag_service
+from polymarket_agents.polymarket.book_cache import OrderBookCache
+from polymarket_agents.polymarket.clob import ClobReader
 from polymarket_agents.polymarket.data_api import DataAPI
 from polymarket_agents.polymarket.gamma import GammaMarketClient
 from polymarket_agents.polymarket.polymarket import Polymarket
+from polymarket_agents.replay import (
+    Cassette,
+    CassetteBackend,
+    SyntheticBackend,
+    SyntheticUniverse,
+)
+from polymarket_agents.replay.recorder import record_session
+from polymarket_agents.replay.server import serve
 from polymarket_agents.utils.logging import (
+    log_debug,
     log_error,
     log_print,
     print_positions,
@@ -71,26 +137,39 @@ def show_trading_history(
         10,
         min=1,
         help="Number of most-recent trades to display.",
-    )
+    ),
+    market: str = typer.Option(None, help="Only show trades in this condition id."),
+    since: int = typer.Option(None, help="Only show trades matched at or after this unix time."),
+    until: int = typer.Option(None, help="Only show trades matched at or before this unix time."),
+    ledger: str = typer.Option(
+        DEFAULT_TRADE_LEDGER_PATH, help="Local SQLite trade ledger to sync and read from."
+    ),
+    sync: bool = typer.Option(True, help="Fetch trades newer than the ledger before reading."),
 ) -> None:
     """Display recent trades associated with the configured account."""
     polymarket = get_polymarket()
-    typer.echo("Fetching recent trades...", nl=False)
+    account = polymarket.get_address_for_private_key()
 
-    try:
-        trades = polymarket.client.get_trades()
-    except Exception as exc:  # pragma: no cover - defensive guard
-        typer.echo("")
-        log_error(f"Failed to fetch trading history: {exc}")
-        raise typer.Exit(code=1)
+    with TradeLedger(ledger) as trade_ledger:
+        if sync:
+            typer.echo("Syncing recent trades...", nl=False)
+            try:
+                stored = trade_ledger.sync(polymarket.client, account)
+            except Exception as exc:  # pragma: no cover - defensive guard
+                typer.echo("")
+                log_error(f"Failed to fetch trading history: {exc}")
+                raise typer.Exit(code=1)
+            typer.echo(f" done ({stored} new or updated)")
 
-    typer.echo(" done")
+        trades = trade_ledger.recent(
+            account, limit=limit, since=since, until=until, market=market
+        )
 
     if not trades:
         log_print("No trades found for this account.")
         return
 
-    print_trades(trades[:limit])
+    print_trades(trades)
 
 
 @app.command()
@@ -113,8 +192,27 @@ def show_positions(
         "DESC",
         help="Sort direction (ASC or DESC).",
     ),
+    wallet: list[str] = typer.Option(
+        [],
+        help=(
+            "Wallet to report (repeatable). Every page is fetched concurrently; "
+            "--limit then caps the positions shown per wallet."
+        ),
+    ),
+    concurrency: int = typer.Option(8, min=1, help="Maximum in-flight requests."),
 ) -> None:
     """Display readable position data for the configured wallet."""
+    if wallet:
+        _show_positions_for_wallets(
+            wallet,
+            limit=limit,
+            concurrency=concurrency,
+            sizeThreshold=size_threshold,
+            sortBy=sort_by,
+            sortDirection=sort_direction,
+        )
+        return
+
     polymarket = get_polymarket()
     if not polymarket.private_key:
         log_print(
@@ -153,23 +251,440 @@ def show_positions(
     print_positions(positions)
 
 
+def _show_positions_for_wallets(
+    wallets: list[str], limit: int, concurrency: int, **params
+) -> None:
+    """Fetch and print positions for several wallets at once."""
+    data_api = DataAPI()
+    typer.echo(f"Fetching positions for {len(wallets)} wallets...", nl=False)
+    try:
+        results = data_api.get_positions_for_wallets(
+            wallets, max_concurrency=concurrency, **params
+        )
+    except Exception as exc:  # pragma: no cover - defensive guard
+        typer.echo("")
+        log_error(f"Failed to fetch positions: {exc}")
+        raise typer.Exit(code=1)
+
+    typer.echo(" done")
+
+    for result in results.values():
+        log_print(
+            f"Wallet {result.wallet}: {len(result.positions)} positions, "
+            f"{result.pages} pages in {result.latency_s:.2f}s"
+        )
+        if result.error:
+            log_error(f"  Fetch incomplete: {result.error}")
+        if result.positions:
+            print_positions(result.positions[:limit])
+
+
 @app.command()
 def find_arbitrage(
     target: int = typer.Option(2, help="Number of opportunities to surface."),
     batch: int = typer.Option(200, help="Markets fetched per Gamma request."),
     offset: int = typer.Option(0, help="Starting offset for Gamma pagination."),
+    workers: int = typer.Option(
+        1, min=1, help="Worker processes; above 1 shards the catalogue scan."
+    ),
+    book_cache: str = typer.Option(
+        "./local_db_cache/orderbook_cache.json",
+        help="File remembering empty or failing order books between runs.",
+    ),
+    ledger: str = typer.Option(
+        DEFAULT_LEDGER_PATH, help="SQLite ledger recording every detection (empty to skip)."
+    ),
 ) -> None:
     """Surface markets where summed outcome prices deviate from parity."""
     try:
-        opportunities = find_probabilistic_arbitrage(
-            target_results=target,
-            batch_limit=batch,
-            start_offset=offset,
-        )
+        coverage = ScanCoverage()
+        if workers > 1:
+            records = find_probabilistic_arbitrage_sharded(
+                target_results=target,
+                batch_limit=batch,
+                start_offset=offset,
+                workers=workers,
+                coverage=coverage,
+            )
+            opportunities = [record.to_opportunity() for record in records]
+        else:
+            cache = OrderBookCache(get_polymarket())
+            cache.load(book_cache)
+            try:
+                opportunities = find_probabilistic_arbitrage(
+                    target_results=target,
+                    batch_limit=batch,
+                    start_offset=offset,
+                    polymarket=cache,
+                    coverage=coverage,
+                )
+            finally:
+                cache.save(book_cache)
         describe_opportunities(opportunities)
+        if ledger:
+            with OpportunityLedger(ledger) as opportunity_ledger:
+                # Episodes close only on markets whose books this scan actually read.
+                opportunity_ledger.record_scan(
+                    opportunities, observed=coverage.observed, complete=coverage.complete
+                )
+                if not coverage.complete:
+                    log_debug(
+                        f"Partial scan ({coverage.markets} markets from offset "
+                        f"{coverage.start_offset}, {coverage.unseen} unread); "
+                        "episodes on unread markets left open."
+                    )
     except Exception as exc:  # pragma: no cover - defensive guard
         log_error(f"Failed to discover arbitrage opportunities: {exc}")
 
 
+@app.command()
+def opportunity_report(
+    ledger: str = typer.Option(DEFAULT_LEDGER_PATH, help="SQLite ledger to summarise."),
+) -> None:
+    """Summarise arbitrage edge half-lives and detection lag per category."""
+    with OpportunityLedger(ledger) as opportunity_ledger:
+        print_category_stats(opportunity_ledger.category_stats())
+
+
+@app.command()
+def query_markets(
+    query: list[str] = typer.Option(
+        ..., help="Search text (repeat for several reformulations, fused by rank)."
+    ),
+    k: int = typer.Option(4, min=1, help="Results to return."),
+    directory: str = typer.Option(
+        DEFAULT_COLLECTIONS_DIRECTORY, help="Directory holding the markets collection."
+    ),
+    backend: str = typer.Option("memmap", help="Search backend: memmap or chroma."),
+    category: list[str] = typer.Option([], help="Only markets in this category (repeatable)."),
+    tag: str = typer.Option(None, help="Only markets whose events carry this tag label."),
+    min_volume: float = typer.Option(None, help="Minimum traded volume (USDC)."),
+    min_liquidity: float = typer.Option(None, help="Minimum liquidity (USDC)."),
+    ends_before: datetime = typer.Option(None, help="Only markets ending on or before this date."),
+) -> None:
+    """Search the local markets collection through the warm RAG query service."""
+    where = metadata_filter(
+        category=category or None,
+        tag=tag,
+        min_volume=min_volume,
+        min_liquidity=min_liquidity,
+        ends_before=(
+            int(ends_before.replace(tzinfo=ends_before.tzinfo or timezone.utc).timestamp())
+            if ends_before
+            else None
+        ),
+    )
+    try:
+        service = get_rag_service(directory, "markets", backend)
+        if len(query) == 1:
+            hits = service.query(query[0], k=k, where=where)
+        else:
+            hits = service.multi_query(query, k=k, where=where)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        log_error(f"Failed to query markets: {exc}")
+        raise typer.Exit(code=1)
+
+    if not hits:
+        log_print("No matching markets.")
+        return
+    for document, score in hits:
+        question = document.metadata.get("question") or document.page_content[:80]
+        log_print(f"{score:8.4f}  {document.metadata.get('id', '-'):>10}  {question}")
+
+
+@app.command()
+def portfolio_report(
+    wallet: list[str] = typer.Option(..., help="Wallet to value (repeatable)."),
+    price: str = typer.Option("mid", help=f"Mark positions at one of {', '.join(PRICE_MODES)}."),
+    shock: float = typer.Option(
+        0.0, help="Also report PnL if every price moved by this amount (e.g. -0.1)."
+    ),
+    top: int = typer.Option(10, min=1, help="Events and categories to list."),
+) -> None:
+    """Mark positions to live CLOB prices and summarise exposure and PnL."""
+    try:
+        results = DataAPI().get_positions_for_wallets(wallet)
+        positions = [row for result in results.values() for row in result.positions]
+        try:
+            categories = GammaMarketClient().get_market_categories(
+                row.get("conditionId") for row in positions
+            )
+        except Exception as exc:  # pragma: no cover - categories are best effort
+            log_error(f"Failed to resolve market categories: {exc}")
+            categories = {}
+        portfolio = Portfolio(positions, categories=categories)
+        portfolio.refresh_prices(ClobReader(), mode=price)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        log_error(f"Failed to value portfolio: {exc}")
+        raise typer.Exit(code=1)
+
+    print_portfolio(portfolio, top=top)
+    if shock:
+        result = portfolio.shock(shock)
+        log_print(
+            f"Shock {shock:+.3f}: value {result.shocked_value:,.2f} USDC "
+            f"({result.pnl_change:+,.2f})"
+        )
+
+
+@app.command()
+def detect_changes(
+    limit: int = typer.Option(100, min=1, help="Tradable markets to check."),
+    state: str = typer.Option(DEFAULT_CHANGE_STATE_PATH, help="SQLite change-detection state."),
+    articles: str = typer.Option(
+        DEFAULT_ARTICLE_STORE_PATH, help="Article store whose market links count as news."
+    ),
+    price_threshold: float = typer.Option(0.02, help="Outcome price move that triggers analysis."),
+    mark: bool = typer.Option(
+        False, help="Record flagged markets as analysed (use when this gates a pipeline run)."
+    ),
+) -> None:
+    """List markets whose prices, volume, spread or linked news changed since last analysis."""
+    try:
+        markets = GammaMarketClient().get_tradable_markets(limit=limit)
+        links = {}
+        if Path(articles).exists():
+            with ArticleStore(articles) as store:
+                links = store.linked_urls(str(market.id) for market in markets)
+        with ChangeDetector(state, price_threshold=price_threshold) as detector:
+            decisions = detector.assess(markets, links)
+            if mark:
+                detector.mark_analyzed(
+                    decision.market_id for decision in decisions if decision.reanalyze
+                )
+    except Exception as exc:  # pragma: no cover - defensive guard
+        log_error(f"Failed to detect market changes: {exc}")
+        raise typer.Exit(code=1)
+
+    print_change_decisions(decisions)
+
+
+@app.command()
+def forecast_markets(
+    limit: int = typer.Option(20, min=1, help="Tradable markets to forecast."),
+    concurrency: int = typer.Option(8, min=1, help="LLM calls in flight at once."),
+    tokens_per_minute: float = typer.Option(
+        0.0, help="Provider token budget per minute (0 disables budgeting)."
+    ),
+    retries: int = typer.Option(3, min=0, help="Retries per failed call."),
+    changed_only: bool = typer.Option(
+        False, help="Only forecast markets flagged by change detection, then mark them."
+    ),
+    state: str = typer.Option(DEFAULT_CHANGE_STATE_PATH, help="SQLite change-detection state."),
+    articles: str = typer.Option(
+        DEFAULT_ARTICLE_STORE_PATH, help="Article store whose market links count as news."
+    ),
+    call_log: str = typer.Option(
+        DEFAULT_CALL_LOG_PATH, help="JSONL file receiving per-call LLM metrics (empty to skip)."
+    ),
+) -> None:
+    """Run the superforecaster prompt over tradable markets, printing answers as they land."""
+    metrics = LLMMetrics()
+    if call_log:
+        metrics.add_exporter(JsonlExporter(call_log))
+    detector = ChangeDetector(state) if changed_only else None
+    try:
+        markets = GammaMarketClient().get_tradable_markets(limit=limit)
+        if detector is not None:
+            links = {}
+            if Path(articles).exists():
+                with ArticleStore(articles) as store:
+                    links = store.linked_urls(str(market.id) for market in markets)
+            # `select` records the linked articles that `mark_analyzed` then baselines.
+            markets = detector.select(markets, links)
+        assembler = PromptAssembler()
+        forecaster = BatchForecaster(
+            build_llm_client(metrics=metrics),
+            max_concurrency=concurrency,
+            tokens_per_minute=tokens_per_minute,
+            max_retries=retries,
+            count_tokens=assembler.counter.count,
+        )
+
+        async def run() -> set[str]:
+            done: set[str] = set()
+            failed: set[str] = set()
+            tasks = build_forecast_tasks(markets, assembler=assembler)
+            async for result in forecaster.stream(tasks):
+                print_forecast_result(result)
+                (done if result.ok else failed).add(result.task.market_id)
+            return done - failed
+
+        completed = asyncio.run(run())
+        if detector is not None:
+            detector.mark_analyzed(completed)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        log_error(f"Failed to forecast markets: {exc}")
+        raise typer.Exit(code=1)
+    finally:
+        if detector is not None:
+            detector.close()
+
+    if metrics.prompts:
+        print_llm_report(metrics)
+
+
+@app.command()
+def recommend_trades(
+    limit: int = typer.Option(5, min=1, help="Tradable markets to consider."),
+    concurrency: int = typer.Option(8, min=1, help="Forecast calls in flight at once."),
+    retries: int = typer.Option(3, min=0, help="Retries per failed forecast call."),
+    call_log: str = typer.Option(
+        DEFAULT_CALL_LOG_PATH, help="JSONL file receiving per-call LLM metrics (empty to skip)."
+    ),
+) -> None:
+    """Forecast each market, then ask for one validated trade per market in a single call."""
+    metrics = LLMMetrics()
+    if call_log:
+        metrics.add_exporter(JsonlExporter(call_log))
+    try:
+        markets = GammaMarketClient().get_tradable_markets(limit=limit)
+        assembler = PromptAssembler()
+        client = build_llm_client(metrics=metrics)
+        forecaster = BatchForecaster(
+            client,
+            max_concurrency=concurrency,
+            max_retries=retries,
+            count_tokens=assembler.counter.count,
+        )
+        results = forecaster.run(build_forecast_tasks(markets, assembler=assembler))
+    except Exception as exc:  # pragma: no cover - defensive guard
+        log_error(f"Failed to forecast markets: {exc}")
+        raise typer.Exit(code=1)
+
+    predictions: dict[str, list[str]] = {}
+    failed: set[str] = set()
+    for result in results:
+        if result.ok:
+            predictions.setdefault(result.task.market_id, []).append(result.text or "")
+        else:
+            failed.add(result.task.market_id)
+    for market in markets:
+        market_id = str(market.id)
+        if market_id in failed or market_id not in predictions:
+            log_print(f"[{market_id}] skipped: forecast incomplete")
+            continue
+        try:
+            recommendation = recommend_trade(
+                client,
+                "\n".join(predictions[market_id]),
+                market.outcomes or [],
+                json.dumps(market.outcomePrices or []),
+                tick_size=market.orderPriceMinTickSize or DEFAULT_TICK_SIZE,
+                assembler=assembler,
+                cache_scope=f"one_best_trade:{market_id}",
+            )
+        except Exception as exc:  # pragma: no cover - one bad answer skips one market
+            log_error(f"[{market_id}] no valid trade recommendation: {exc}")
+            continue
+        print_trade_recommendation(market_id, recommendation)
+
+    if metrics.prompts:
+        print_llm_report(metrics)
+
+
+@app.command()
+def llm_report(
+    call_log: str = typer.Option(DEFAULT_CALL_LOG_PATH, help="JSONL call log to summarise."),
+    hours: float = typer.Option(0.0, help="Only calls from the last N hours (0 for all)."),
+) -> None:
+    """Summarise LLM latency, token usage, cache hits and estimated cost per prompt."""
+    since = time.time() - hours * 3600 if hours > 0 else None
+    try:
+        records = read_call_log(call_log, since=since)
+    except FileNotFoundError:
+        log_error(f"No LLM call log at {call_log}.")
+        raise typer.Exit(code=1)
+    print_llm_report(LLMMetrics.from_records(records))
+
+
+@app.command()
+def record_cassette(
+    path: str = typer.Argument(..., help="Destination cassette file (.jsonl.gz)."),
+    markets: int = typer.Option(50, min=1, help="Markets to fetch from Gamma."),
+    offset: int = typer.Option(0, min=0, help="Starting offset for Gamma pagination."),
+    wallet: list[str] = typer.Option(
+        [], help="Wallet address whose positions should be recorded (repeatable)."
+    ),
+) -> None:
+    """Record live Gamma, CLOB and Data API responses for offline replay."""
+    try:
+        record_session(path, market_limit=markets, offset=offset, wallets=wallet)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        log_error(f"Failed to record cassette: {exc}")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve_standin(
+    cassette: str = typer.Option(None, help="Serve responses recorded in this cassette."),
+    synthetic: int = typer.Option(
+        1000, min=1, help="Synthetic market count when no cassette is given."
+    ),
+    max_outcomes: int = typer.Option(2, min=2, help="Maximum outcomes per synthetic market."),
+    seed: int = typer.Option(0, help="Seed for synthetic data."),
+    host: str = typer.Option("127.0.0.1", help="Interface to bind."),
+    port: int = typer.Option(8765, help="Port to bind."),
+) -> None:
+    """Run a local stand-in for the Gamma, CLOB and Data API endpoints."""
+    if cassette:
+        backend = CassetteBackend(Cassette.load(cassette))
+    else:
+        backend = SyntheticBackend(
+            SyntheticUniverse(n_markets=synthetic, max_outcomes=max_outcomes, seed=seed)
+        )
+    log_print(f"Serving stand-in endpoints on http://{host}:{port}")
+    serve(backend, host=host, port=port)
+
+
+@app.command()
+def benchmark_finder(
+    scale: str = typer.Option("1k", help=f"Universe size: {', '.join(SCALES)}."),
+    min_outcomes: int = typer.Option(2, min=2, help="Minimum outcomes per market."),
+    max_outcomes: int = typer.Option(2, min=2, max=30, help="Maximum outcomes per market."),
+    max_depth: int = typer.Option(10, min=1, help="Maximum price levels per book side."),
+    batch: int = typer.Option(500, min=1, help="Markets fetched per Gamma request."),
+    output_dir: str = typer.Option("bench_results", help="Directory for JSON results."),
+    baseline: str = typer.Option(None, help="Earlier result file to compare against."),
+    workers: int = typer.Option(
+        0, min=0, help="Also benchmark a sharded scan with this many processes."
+    ),
+) -> None:
+    """Benchmark finder throughput on a synthetic market universe."""
+    if scale not in SCALES:
+        log_error(f"Unknown scale {scale!r}; choose one of {', '.join(SCALES)}.")
+        raise typer.Exit(code=1)
+
+    report = run_finder_benchmark(
+        n_markets=SCALES[scale],
+        min_outcomes=min_outcomes,
+        max_outcomes=max(max_outcomes, min_outcomes),
+        max_depth=max_depth,
+        batch_limit=batch,
+        workers=workers,
+    )
+    print_report(report)
+    path = write_report(report, output_dir)
+    log_print(f"Results written to {path}")
+
+    if baseline:
+        for stage, ratio in compare_reports(baseline, path).items():
+            log_print(f"{stage:<10} {ratio:.3f}x baseline throughput")
+
+
+@app.command()
+def benchmark_vector_index(
+    vectors: int = typer.Option(20_000, min=1, help="Number of stored vectors."),
+    dim: int = typer.Option(768, min=1, help="Embedding dimensionality."),
+    queries: int = typer.Option(200, min=1, help="Queries timed per backend."),
+    k: int = typer.Option(4, min=1, help="Results per query."),
+    output_dir: str = typer.Option("bench_results", help="Directory for JSON results."),
+) -> None:
+    """Compare start-up and query latency of the memmap index and Chroma."""
+    report = run_vector_benchmark(n_vectors=vectors, dim=dim, n_queries=queries, k=k)
+    print_vector_report(report)
+    log_print(f"Results written to {write_vector_report(report, output_dir)}")
+
+
 if __name__ == "__main__":
     app()
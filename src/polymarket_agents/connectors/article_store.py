@@ -0,0 +1,271 @@
+"""Local SQLite store of news articles with a full-text index and market links."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Protocol
+
+from polymarket_agents.utils.logging import log_debug
+from polymarket_agents.utils.objects import Article
+
+DEFAULT_ARTICLE_STORE_PATH = "./local_db_news/articles.sqlite"
+# How far back the first ingestion for a market searches.
+DEFAULT_LOOKBACK = timedelta(days=7)
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    source TEXT,
+    title TEXT,
+    description TEXT,
+    content TEXT,
+    published_at INTEGER,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description, content)
+    VALUES (new.id, new.title, new.description, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.id, old.title, old.description, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.id, old.title, old.description, old.content);
+    INSERT INTO articles_fts (rowid, title, description, content)
+    VALUES (new.id, new.title, new.description, new.content);
+END;
+CREATE TABLE IF NOT EXISTS market_articles (
+    market_id TEXT NOT NULL,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    query TEXT,
+    linked_at REAL NOT NULL,
+    PRIMARY KEY (market_id, article_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ingest_state (
+    market_id TEXT PRIMARY KEY,
+    last_published_at INTEGER,
+    ingested_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles(published_at DESC);
+CREATE INDEX IF NOT EXISTS market_articles_article ON market_articles(article_id);
+"""
+
+
+class ArticleSource(Protocol):
+    def get_articles_for_options(
+        self,
+        market_options: list[str],
+        date_start: datetime | date | None = None,
+        date_end: datetime | date | None = None,
+    ) -> dict[str, list[Article]]: ...
+
+
+def _published_at(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 expression matching any of its words."""
+    return " OR ".join(f'"{token}"' for token in dict.fromkeys(_TOKEN_PATTERN.findall(text)))
+
+
+class ArticleStore:
+    """SQLite-backed article archive keyed by URL.
+
+    Title, description and content are indexed with FTS5 (kept in sync by
+    triggers), and `market_articles` records which market's search surfaced
+    each article, so "recent articles for market X" is an indexed join.
+    `ingest` only asks the news source for articles published after the newest
+    one already linked to the market.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_ARTICLE_STORE_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ArticleStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def last_published_at(self, market_id: str) -> int | None:
+        row = self.connection.execute(
+            "SELECT last_published_at FROM ingest_state WHERE market_id = ?", (market_id,)
+        ).fetchone()
+        return row["last_published_at"] if row else None
+
+    def add(
+        self,
+        articles: Iterable[Article],
+        market_id: str | None = None,
+        query: str | None = None,
+    ) -> int:
+        """Store articles (deduplicated by URL), optionally linking them to a market.
+
+        Returns how many URLs were new to the store.
+        """
+        added = 0
+        now = time.time()
+        with self.connection:
+            for article in articles:
+                if not article.url:
+                    continue
+                existing = self.connection.execute(
+                    "SELECT id FROM articles WHERE url = ?", (article.url,)
+                ).fetchone()
+                values = (
+                    article.source.name if article.source else None,
+                    article.title,
+                    article.description,
+                    article.content,
+                    _published_at(article.publishedAt),
+                    now,
+                    article.model_dump_json(),
+                )
+                if existing is None:
+                    article_id = self.connection.execute(
+                        "INSERT INTO articles (source, title, description, content, "
+                        "published_at, fetched_at, payload, url) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (*values, article.url),
+                    ).lastrowid
+                    added += 1
+                else:
+                    article_id = existing["id"]
+                    self.connection.execute(
+                        "UPDATE articles SET source = ?, title = ?, description = ?, "
+                        "content = ?, published_at = ?, fetched_at = ?, payload = ? "
+                        "WHERE id = ? AND payload IS NOT ?",
+                        (*values, article_id, values[-1]),
+                    )
+                if market_id is not None:
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO market_articles "
+                        "(market_id, article_id, query, linked_at) VALUES (?, ?, ?, ?)",
+                        (market_id, article_id, query, now),
+                    )
+        return added
+
+    def ingest(
+        self,
+        source: ArticleSource,
+        market_id: str,
+        queries: list[str],
+        lookback: timedelta = DEFAULT_LOOKBACK,
+    ) -> int:
+        """Fetch articles published since the market's last ingestion and store them.
+
+        The search starts on the UTC day of the newest stored article (or
+        `lookback` ago) and is open-ended, so repeated calls within a day send
+        identical queries and hit the source's response cache; articles already
+        stored are skipped by URL. Returns how many new articles were stored.
+        """
+        last_seen = self.last_published_at(market_id)
+        start = (
+            datetime.fromtimestamp(last_seen, timezone.utc)
+            if last_seen
+            else datetime.now(timezone.utc) - lookback
+        ).date()
+        started = time.perf_counter()
+        results = source.get_articles_for_options(queries, date_start=start)
+        added = 0
+        for query, articles in results.items():
+            added += self.add(articles, market_id=market_id, query=query)
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO ingest_state (market_id, last_published_at, ingested_at) "
+                "VALUES (?, (SELECT MAX(a.published_at) FROM articles a JOIN market_articles m "
+                "ON m.article_id = a.id WHERE m.market_id = ?), ?) "
+                "ON CONFLICT(market_id) DO UPDATE SET "
+                "last_published_at = excluded.last_published_at, "
+                "ingested_at = excluded.ingested_at",
+                (market_id, market_id, time.time()),
+            )
+        log_debug(
+            f"Ingested {added} new articles for market {market_id} since {start.isoformat()} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return added
+
+    @staticmethod
+    def _article(row: sqlite3.Row) -> Article:
+        return Article.model_validate(json.loads(row["payload"]))
+
+    def for_market(
+        self, market_id: str, limit: int = 10, since: int | None = None
+    ) -> list[Article]:
+        """Newest articles linked to `market_id`, optionally published after `since`."""
+        clauses = ["m.market_id = ?"]
+        params: list[Any] = [market_id]
+        if since is not None:
+            clauses.append("a.published_at >= ?")
+            params.append(since)
+        rows = self.connection.execute(
+            "SELECT a.payload FROM market_articles m JOIN articles a ON a.id = m.article_id "
+            f"WHERE {' AND '.join(clauses)} ORDER BY a.published_at DESC LIMIT ?",
+            (*params, limit),
+        )
+        return [self._article(row) for row in rows]
+
+    def search(
+        self, text: str, limit: int = 10, market_id: str | None = None
+    ) -> list[Article]:
+        """Full-text search ranked by BM25, optionally restricted to one market's links."""
+        expression = fts_query(text)
+        if not expression:
+            return []
+        sql = (
+            "SELECT a.payload FROM articles_fts f JOIN articles a ON a.id = f.rowid "
+            "WHERE articles_fts MATCH ?"
+        )
+        params: list[Any] = [expression]
+        if market_id is not None:
+            sql += " AND a.id IN (SELECT article_id FROM market_articles WHERE market_id = ?)"
+            params.append(market_id)
+        sql += " ORDER BY bm25(articles_fts) LIMIT ?"
+        rows = self.connection.execute(sql, (*params, limit))
+        return [self._article(row) for row in rows]
+
+    def linked_urls(self, market_ids: Iterable[str]) -> dict[str, list[str]]:
+        """Map each market id to the URLs of the articles linked to it."""
+        links: dict[str, list[str]] = {str(market_id): [] for market_id in market_ids}
+        for market_id in links:
+            rows = self.connection.execute(
+                "SELECT a.url FROM market_articles m JOIN articles a ON a.id = m.article_id "
+                "WHERE m.market_id = ?",
+                (market_id,),
+            )
+            links[market_id] = [row["url"] for row in rows]
+        return links
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
@@ -1,20 +1,242 @@
 import json
+import math
 import os
+import re
 import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
 
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain_community.document_loaders import JSONLoader
-from langchain_community.vectorstores.chroma import Chroma
+import numpy as np
+from langchain_core.documents import Document
 
+from polymarket_agents.connectors.chroma_collections import (
+    DEFAULT_COLLECTIONS_DIRECTORY,
+    FILTERABLE_FIELDS,
+    ChromaCollections,
+)
+from polymarket_agents.connectors.embedding_cache import (
+    DEFAULT_EMBEDDING_CACHE_PATH,
+    CachedEmbeddings,
+)
+from polymarket_agents.connectors.embeddings import build_embeddings
+from polymarket_agents.connectors.rag_service import RAGQueryService
+from polymarket_agents.connectors.vector_index import MemmapVectorIndex
 from polymarket_agents.polymarket.gamma import GammaMarketClient
+from polymarket_agents.utils.logging import log_debug, log_print
 from polymarket_agents.utils.objects import Market, PolymarketEvent
 
+MARKET_EXPORT_PREFIX = "all-current-markets_"
+EXPORT_RETENTION = 3
+VECTOR_BACKENDS = ("chroma", "memmap")
+RETRIEVAL_MODES = ("dense", "hybrid")
+LEXICAL_FIELDS = ("question", "title", "slug")
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _epoch(value) -> int | None:
+    """Parse an ISO date or datetime into integer epoch seconds (UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _first_number(*values) -> float | None:
+    for value in values:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _tag_labels(tags) -> list[str]:
+    labels: list[str] = []
+    for tag in tags or []:
+        label = tag.get("label") if isinstance(tag, dict) else getattr(tag, "label", None)
+        if label:
+            labels.append(label)
+    return labels
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """Okapi BM25 over an inverted index of term -> (doc rows, term frequencies)."""
+
+    def __init__(self, texts: Iterable[str], k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        postings: dict[str, dict[int, int]] = {}
+        lengths: list[int] = []
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[row] = counts.get(row, 0) + 1
+        self.doc_lengths = np.asarray(lengths, dtype=np.float32)
+        average = float(self.doc_lengths.mean()) if lengths else 0.0
+        # Per-document length normalisation is query independent, so precompute it.
+        self._norm = k1 * (1 - b + b * self.doc_lengths / (average or 1.0))
+        n_docs = len(lengths)
+        self.postings: dict[str, tuple[np.ndarray, np.ndarray, float]] = {}
+        for token, counts in postings.items():
+            rows = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            tfs = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            idf = math.log(1 + (n_docs - len(counts) + 0.5) / (len(counts) + 0.5))
+            self.postings[token] = (rows, tfs, idf)
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def search(
+        self, query: str, n: int = 50, mask: np.ndarray | None = None
+    ) -> list[tuple[int, float]]:
+        """Return up to `n` `(row, score)` pairs for rows sharing a term with `query`.
+
+        Rows outside `mask` are never returned.
+        """
+        accumulator = None
+        for token in set(tokenize(query)):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            rows, tfs, idf = posting
+            if accumulator is None:
+                accumulator = np.zeros(len(self), dtype=np.float32)
+            accumulator[rows] += idf * tfs * (self.k1 + 1) / (tfs + self._norm[rows])
+        if accumulator is None:
+            return []
+        if mask is not None:
+            accumulator[~mask] = 0.0
+        candidates = np.flatnonzero(accumulator)
+        if len(candidates) > n:
+            candidates = candidates[np.argpartition(accumulator[candidates], -n)[-n:]]
+        ordered = candidates[np.argsort(-accumulator[candidates])]
+        return [(int(row), float(accumulator[row])) for row in ordered]
+
+
+class HybridRetriever:
+    """Lexical first stage, dense re-scoring of its top-N, reciprocal rank fusion.
+
+    BM25 runs over `question`/`title`, `slug` and the description of each row
+    of a `MemmapVectorIndex`. Only the `lexical_candidates` best lexical rows
+    are scored against the query embedding; the two rankings are then merged
+    with RRF (`sum 1 / (rrf_k + rank)`). Queries with no lexical match fall
+    back to a dense scan.
+    """
+
+    def __init__(
+        self,
+        index: MemmapVectorIndex,
+        lexical_candidates: int = 50,
+        rrf_k: int = 60,
+    ) -> None:
+        self.index = index
+        self.lexical_candidates = lexical_candidates
+        self.rrf_k = rrf_k
+        self.bm25 = BM25Index(
+            " ".join(
+                [*(str(metadata.get(key) or "") for key in LEXICAL_FIELDS), content]
+            )
+            for metadata, content in zip(index.metadatas, index.contents)
+        )
+
+    def search(
+        self, query: str, k: int = 4, where: Mapping[str, Any] | None = None
+    ) -> "list[tuple[Document, float]]":
+        """Fuse lexical and dense rankings over rows matching the `where` filter."""
+        allowed = self.index.mask(where)
+        lexical = self.bm25.search(query, n=self.lexical_candidates, mask=allowed)
+        embedding = self.index.embedding_function.embed_query(query)
+        if not lexical:
+            dense = self.index.search_by_vector(embedding, k=k, mask=allowed)
+            return [(self.index.document(row), score) for row, score in dense]
+
+        mask = np.zeros(len(self.index), dtype=bool)
+        mask[[row for row, _ in lexical]] = True
+        dense = self.index.search_by_vector(embedding, k=len(lexical), mask=mask)
+        fused: dict[int, float] = {}
+        for ranking in (lexical, dense):
+            for rank, (row, _) in enumerate(ranking):
+                fused[row] = fused.get(row, 0.0) + 1.0 / (self.rrf_k + rank + 1)
+        best = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(self.index.document(row), score) for row, score in best]
+
+
+def export_snapshot(
+    records: Iterable[dict], directory, prefix: str, keep: int = EXPORT_RETENTION
+) -> Path:
+    """Write `records` to a timestamped JSON file and prune older snapshots."""
+    target_directory = Path(directory)
+    target_directory.mkdir(parents=True, exist_ok=True)
+    path = target_directory / f"{prefix}{time.time()}.json"
+    with open(path, "w") as output_file:
+        json.dump(list(records), output_file)
+    cleanup_exports(target_directory, prefix, keep=keep)
+    return path
+
+
+def cleanup_exports(directory, prefix: str, keep: int = EXPORT_RETENTION) -> list[Path]:
+    """Delete all but the newest `keep` snapshots named `<prefix>*.json`."""
+    snapshots = sorted(
+        Path(directory).glob(f"{prefix}*.json"), key=os.path.getmtime, reverse=True
+    )
+    removed = snapshots[max(keep, 0) :]
+    for path in removed:
+        path.unlink(missing_ok=True)
+        log_debug(f"Removed old snapshot {path}")
+    return removed
+
 
 class PolymarketRAG:
-    def __init__(self, local_db_directory=None, embedding_function=None) -> None:
+    def __init__(
+        self,
+        local_db_directory=None,
+        embedding_function=None,
+        embedding_cache_path=DEFAULT_EMBEDDING_CACHE_PATH,
+        vector_backend="chroma",
+        retrieval="dense",
+    ) -> None:
+        if vector_backend not in VECTOR_BACKENDS:
+            raise ValueError(f"vector_backend must be one of {VECTOR_BACKENDS}.")
+        if retrieval not in RETRIEVAL_MODES:
+            raise ValueError(f"retrieval must be one of {RETRIEVAL_MODES}.")
         self.gamma_client = GammaMarketClient()
         self.local_db_directory = local_db_directory
         self.embedding_function = embedding_function
+        self.embedding_cache_path = embedding_cache_path
+        self._embeddings = None
+        self._collections = None
+        self._indexes: dict[str, MemmapVectorIndex] = {}
+        self._retrievers: dict[str, HybridRetriever] = {}
+        self._services: dict[tuple[str, str], RAGQueryService] = {}
+        self.vector_backend = vector_backend
+        self.retrieval = retrieval
+
+    def embeddings(self):
+        """Return the embedding function, wrapped in the content-hash cache when enabled."""
+        if self._embeddings is None:
+            embedding_function = self.embedding_function or build_embeddings()
+            if self.embedding_cache_path:
+                embedding_function = CachedEmbeddings(
+                    embedding_function, path=self.embedding_cache_path
+                )
+            self._embeddings = embedding_function
+        return self._embeddings
+
+    def _report_embedding_cache(self) -> None:
+        if isinstance(self._embeddings, CachedEmbeddings):
+            log_print(f"Embedding cache: {self._embeddings.stats.summary()}")
 
     @staticmethod
     def _serialise_event(event: PolymarketEvent) -> dict:
@@ -37,6 +259,10 @@ class PolymarketRAG:
             "description": event.description or "",
             "category": getattr(event, "category", None),
             "market_ids": market_ids,
+            "end_date_ts": _epoch(event.endDate),
+            "liquidity": event.liquidity,
+            "volume": event.volume,
+            "tags": _tag_labels(event.tags),
         }
 
     @staticmethod
@@ -80,129 +306,193 @@ class PolymarketRAG:
             "outcomePrices": outcome_prices_processed,
             "clob_token_ids": clob_token_ids,
             "clobTokenIds": clob_token_ids,
+            "end_date_ts": _epoch(market.endDateIso or market.endDate),
+            "liquidity": _first_number(market.liquidityNum, market.liquidity),
+            "volume": _first_number(market.volumeNum, market.volume),
+            "neg_risk": market.negRisk,
+            "tags": sorted(
+                {label for event in market.events or [] for label in _tag_labels(event.tags)}
+            ),
         }
 
     def load_json_from_local(
         self, json_file_path=None, vector_db_directory="./local_db"
     ) -> None:
-        loader = JSONLoader(
-            file_path=json_file_path, jq_schema=".[].description", text_content=False
+        """Index a market snapshot previously written by `export_snapshot`."""
+        with open(json_file_path) as input_file:
+            records = json.load(input_file)
+        ChromaCollections(self.embeddings(), persist_directory=vector_db_directory).sync(
+            "markets", self.iter_market_documents(records)
         )
-        loaded_docs = loader.load()
+        self._report_embedding_cache()
 
-        embedding_function = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
-        Chroma.from_documents(
-            loaded_docs, embedding_function, persist_directory=vector_db_directory
+    def create_local_markets_rag(
+        self, local_directory="./local_db", export=False, keep_exports=EXPORT_RETENTION
+    ) -> None:
+        """Index the current tradable markets, optionally exporting a JSON snapshot."""
+        all_markets = self.gamma_client.get_tradable_markets(limit=250)
+        if export:
+            export_snapshot(
+                (
+                    self._serialise_market(market) if isinstance(market, Market) else market
+                    for market in all_markets
+                ),
+                local_directory,
+                prefix=MARKET_EXPORT_PREFIX,
+                keep=keep_exports,
+            )
+        ChromaCollections(self.embeddings(), persist_directory=local_directory).sync(
+            "markets", self.iter_market_documents(all_markets)
         )
+        self._report_embedding_cache()
 
-    def create_local_markets_rag(self, local_directory="./local_db") -> None:
-        all_markets = self.gamma_client.get_tradable_markets(limit=250)
+    def query_local_markets_rag(
+        self, local_directory=None, query=None
+    ) -> "list[tuple]":
+        return self.query_service(local_directory or "./local_db").query(query)
 
-        if not os.path.isdir(local_directory):
-            os.mkdir(local_directory)
+    def query_service(self, directory, entity="markets") -> RAGQueryService:
+        """Return a warm query service for `directory`, reused across calls."""
+        key = (str(directory), entity)
+        service = self._services.get(key)
+        if service is None:
+            service = RAGQueryService(
+                directory,
+                entity=entity,
+                embedding_function=self.embeddings(),
+                embedding_cache_path=None,
+                backend=self.vector_backend,
+            )
+            self._services[key] = service
+        else:
+            service.reload_if_stale()
+        return service
 
-        local_file_path = f"{local_directory}/all-current-markets_{time.time()}.json"
+    def collections(self) -> ChromaCollections:
+        """Return the persistent per-entity collections, opening them on first use."""
+        if self._collections is None:
+            self._collections = ChromaCollections(
+                self.embeddings(),
+                persist_directory=self.local_db_directory or DEFAULT_COLLECTIONS_DIRECTORY,
+            )
+        return self._collections
 
-        serialised_markets = [
-            self._serialise_market(market) if isinstance(market, Market) else market
-            for market in all_markets
-        ]
+    @staticmethod
+    def _document(content: str, metadata: dict) -> Document:
+        # Chroma rejects empty list values, and None carries no information.
+        cleaned = {
+            key: value for key, value in metadata.items() if value is not None and value != []
+        }
+        return Document(page_content=content or "", metadata=cleaned)
 
-        with open(local_file_path, "w+") as output_file:
-            json.dump(serialised_markets, output_file)
+    def iter_event_documents(self, events: "Iterable[PolymarketEvent | dict]") -> Iterator[Document]:
+        """Yield one `Document` per event without materialising the whole set."""
+        for event in events:
+            record = (
+                self._serialise_event(event) if isinstance(event, PolymarketEvent) else event
+            )
+            market_ids = record.get("market_ids", [])
+            yield self._document(
+                record.get("description"),
+                {
+                    "id": record.get("id"),
+                    "title": record.get("title"),
+                    "slug": record.get("slug"),
+                    "market_ids": market_ids,
+                    "markets": market_ids,
+                    **{key: record.get(key) for key in FILTERABLE_FIELDS},
+                },
+            )
 
-        self.load_json_from_local(
-            json_file_path=local_file_path, vector_db_directory=local_directory
-        )
+    def iter_market_documents(self, markets: "Iterable[Market | dict]") -> Iterator[Document]:
+        """Yield one `Document` per market without materialising the whole set."""
+        for market in markets:
+            record = self._serialise_market(market) if isinstance(market, Market) else market
+            yield self._document(
+                record.get("description"),
+                {
+                    "id": record.get("id"),
+                    "outcomes": record.get("outcomes"),
+                    "outcome_prices": record.get("outcome_prices"),
+                    "outcomePrices": record.get("outcome_prices"),
+                    "question": record.get("question"),
+                    "slug": record.get("slug"),
+                    "clob_token_ids": record.get("clob_token_ids"),
+                    "clobTokenIds": record.get("clob_token_ids"),
+                    **{key: record.get(key) for key in FILTERABLE_FIELDS},
+                },
+            )
 
-    def query_local_markets_rag(
-        self, local_directory=None, query=None
+    def vector_index(self, entity: str, refresh: bool = False) -> MemmapVectorIndex:
+        """Return a memory-mapped export of an entity collection, rebuilding when stale."""
+        directory = Path(self.collections().persist_directory) / "memmap"
+        index = self._indexes.get(entity)
+        if refresh or index is None:
+            if refresh or not MemmapVectorIndex.exists(directory, entity):
+                index = MemmapVectorIndex.from_chroma(
+                    directory, entity, self.collections().collection(entity)
+                )
+            else:
+                index = MemmapVectorIndex(directory, entity)
+            index.embedding_function = self.embeddings()
+            self._indexes[entity] = index
+        return index
+
+    def hybrid_retriever(self, entity: str, refresh: bool = False) -> HybridRetriever:
+        """Return a BM25 + dense retriever over the entity's vector index."""
+        index = self.vector_index(entity, refresh=refresh)
+        retriever = self._retrievers.get(entity)
+        if retriever is None or retriever.index is not index:
+            retriever = HybridRetriever(index)
+            self._retrievers[entity] = retriever
+        return retriever
+
+    def _search(
+        self, entity: str, prompt: str, changed: bool, where: "Mapping[str, Any] | None"
     ) -> "list[tuple]":
-        embedding_function = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
-        local_db = Chroma(
-            persist_directory=local_directory, embedding_function=embedding_function
-        )
-        response_docs = local_db.similarity_search_with_score(query=query)
-        return response_docs
-
-    def events(self, events: "list[PolymarketEvent]", prompt: str) -> "list[tuple]":
-        # create local json file
-        local_events_directory: str = "./local_db_events"
-        if not os.path.isdir(local_events_directory):
-            os.mkdir(local_events_directory)
-        local_file_path = f"{local_events_directory}/events.json"
-        dict_events = [
-            self._serialise_event(event) if isinstance(event, PolymarketEvent) else event
-            for event in events
-        ]
-        with open(local_file_path, "w+") as output_file:
-            json.dump(dict_events, output_file)
-
-        # create vector db
-        def metadata_func(record: dict, metadata: dict) -> dict:
-
-            metadata["id"] = record.get("id")
-            metadata["market_ids"] = record.get("market_ids", [])
-            metadata["markets"] = metadata["market_ids"]
-
-            return metadata
-
-        loader = JSONLoader(
-            file_path=local_file_path,
-            jq_schema=".[]",
-            content_key="description",
-            text_content=False,
-            metadata_func=metadata_func,
-        )
-        loaded_docs = loader.load()
-        embedding_function = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
-        vector_db_directory = f"{local_events_directory}/chroma"
-        local_db = Chroma.from_documents(
-            loaded_docs, embedding_function, persist_directory=vector_db_directory
+        if self.retrieval == "hybrid":
+            return self.hybrid_retriever(entity, refresh=changed).search(prompt, where=where)
+        if self.vector_backend == "memmap":
+            return self.vector_index(entity, refresh=changed).similarity_search_with_score(
+                prompt, filter=where
+            )
+        return self.collections().collection(entity).similarity_search_with_score(
+            query=prompt, filter=dict(where) if where else None
         )
 
-        # query
-        return local_db.similarity_search_with_score(query=prompt)
-
-    def markets(self, markets: "list[Market]", prompt: str) -> "list[tuple]":
-        # create local json file
-        local_events_directory: str = "./local_db_markets"
-        if not os.path.isdir(local_events_directory):
-            os.mkdir(local_events_directory)
-        local_file_path = f"{local_events_directory}/markets.json"
-        serialisable_markets = [
-            self._serialise_market(market) if isinstance(market, Market) else market
-            for market in markets
-        ]
-        with open(local_file_path, "w+") as output_file:
-            json.dump(serialisable_markets, output_file)
-
-        # create vector db
-        def metadata_func(record: dict, metadata: dict) -> dict:
-
-            metadata["id"] = record.get("id")
-            metadata["outcomes"] = record.get("outcomes")
-            metadata["outcome_prices"] = record.get("outcome_prices")
-            metadata["outcomePrices"] = metadata["outcome_prices"]
-            metadata["question"] = record.get("question")
-            metadata["clob_token_ids"] = record.get("clob_token_ids")
-            metadata["clobTokenIds"] = metadata["clob_token_ids"]
-
-            return metadata
-
-        loader = JSONLoader(
-            file_path=local_file_path,
-            jq_schema=".[]",
-            content_key="description",
-            text_content=False,
-            metadata_func=metadata_func,
-        )
-        loaded_docs = loader.load()
-        embedding_function = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
-        vector_db_directory = f"{local_events_directory}/chroma"
-        local_db = Chroma.from_documents(
-            loaded_docs, embedding_function, persist_directory=vector_db_directory
+    def events(
+        self, events: "list[PolymarketEvent]", prompt: str, where=None
+    ) -> "list[tuple]":
+        """Sync `events` into the persistent events collection and query it.
+
+        `where` is a Chroma-style metadata filter (see `metadata_filter`) applied
+        inside the store before scoring.
+        """
+        return self._sync_and_search("events", self.iter_event_documents(events), prompt, where)
+
+    def markets(self, markets: "list[Market]", prompt: str, where=None) -> "list[tuple]":
+        """Sync `markets` into the persistent markets collection and query it.
+
+        `where` is a Chroma-style metadata filter (see `metadata_filter`) applied
+        inside the store before scoring.
+        """
+        return self._sync_and_search(
+            "markets", self.iter_market_documents(markets), prompt, where
         )
 
-        # query
-        return local_db.similarity_search_with_score(query=prompt)
+    def _sync_and_search(
+        self, entity: str, documents: "Iterable[Document]", prompt: str, where
+    ) -> "list[tuple]":
+        """Upsert a caller's subset without pruning, then search only that subset.
+
+        The persistent collection also holds documents synced by other calls and
+        by the full-catalogue rebuilds, so results are scoped to the given ids.
+        """
+        documents = list(documents)
+        if not documents:
+            return []
+        result = self.collections().sync(entity, documents, prune=False)
+        self._report_embedding_cache()
+        scope = {"id": {"$in": [document.metadata["id"] for document in documents]}}
+        scoped = {"$and": [dict(where), scope]} if where else scope
+        return self._search(entity, prompt, result.changed, scoped)
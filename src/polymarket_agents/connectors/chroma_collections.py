@@ -0,0 +1,211 @@
+"""Long-lived Chroma collections kept in sync with the tradable catalogue by id."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from langchain_community.vectorstores.chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_COLLECTIONS_DIRECTORY = "./local_db_collections"
+ENTITY_TYPES = ("markets", "events")
+CONTENT_HASH_KEY = "content_hash"
+# Metadata indexed on every market and event document for filtered search.
+FILTERABLE_FIELDS = ("category", "end_date_ts", "liquidity", "volume", "neg_risk", "tags")
+# Changed documents are written in chunks so large streams never sit in memory twice.
+UPSERT_CHUNK = 1024
+
+
+def metadata_filter(
+    category: str | Sequence[str] | None = None,
+    tag: str | None = None,
+    min_volume: float | None = None,
+    min_liquidity: float | None = None,
+    ends_after: int | None = None,
+    ends_before: int | None = None,
+    neg_risk: bool | None = None,
+) -> dict | None:
+    """Build a Chroma `where` expression over `FILTERABLE_FIELDS`.
+
+    Dates are epoch seconds. Returns None when no condition is given.
+    """
+    clauses: list[dict] = []
+    if category:
+        if isinstance(category, str):
+            clauses.append({"category": category})
+        else:
+            clauses.append({"category": {"$in": list(category)}})
+    if tag:
+        clauses.append({"tags": {"$contains": tag}})
+    if min_volume is not None:
+        clauses.append({"volume": {"$gte": float(min_volume)}})
+    if min_liquidity is not None:
+        clauses.append({"liquidity": {"$gte": float(min_liquidity)}})
+    if ends_after is not None:
+        clauses.append({"end_date_ts": {"$gte": int(ends_after)}})
+    if ends_before is not None:
+        clauses.append({"end_date_ts": {"$lte": int(ends_before)}})
+    if neg_risk is not None:
+        clauses.append({"neg_risk": bool(neg_risk)})
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def content_hash(document: Document) -> str:
+    """Digest of a document's text and metadata, ignoring any stored hash."""
+    metadata = {
+        key: value for key, value in document.metadata.items() if key != CONTENT_HASH_KEY
+    }
+    payload = json.dumps(
+        {"content": document.page_content, "metadata": metadata},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class SyncResult:
+    """What `ChromaCollections.sync` changed in one collection."""
+
+    entity: str
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.deleted)
+
+    def summary(self) -> str:
+        return (
+            f"{self.entity}: {self.added} added, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {self.deleted} deleted"
+        )
+
+
+class ChromaCollections:
+    """One persistent Chroma collection per entity type, updated in place.
+
+    Documents are keyed by their `metadata["id"]` (market or event id). `sync`
+    re-embeds only documents whose content hash changed and, when pruning,
+    deletes ids missing from the latest snapshot, so the collection holds
+    exactly the current catalogue no matter how many runs have written to it.
+    """
+
+    def __init__(
+        self,
+        embedding_function: Embeddings,
+        persist_directory: str | os.PathLike[str] = DEFAULT_COLLECTIONS_DIRECTORY,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.persist_directory = str(persist_directory)
+        self._stores: dict[str, Chroma] = {}
+
+    def collection(self, entity: str) -> Chroma:
+        if entity not in ENTITY_TYPES:
+            raise ValueError(f"Unknown entity type {entity!r}; expected one of {ENTITY_TYPES}.")
+        store = self._stores.get(entity)
+        if store is None:
+            store = Chroma(
+                collection_name=entity,
+                embedding_function=self.embedding_function,
+                persist_directory=self.persist_directory,
+            )
+            self._stores[entity] = store
+        return store
+
+    def _changed_marker(self, entity: str) -> Path:
+        return Path(self.persist_directory) / f"{entity}.changed"
+
+    def _mark_changed(self, entity: str) -> None:
+        marker = self._changed_marker(entity)
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+
+    def changed_at(self, entity: str) -> float | None:
+        """Modification time of the entity's last write through this class, if any.
+
+        Chroma touches its SQLite file even on reads, so derived exports (such as
+        the memmap index) compare against this marker to decide whether they are stale.
+        """
+        try:
+            return self._changed_marker(entity).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def stored_hashes(self, entity: str) -> dict[str, str | None]:
+        """Return `{id: content hash}` for everything currently in the collection."""
+        payload = self.collection(entity).get(include=["metadatas"])
+        return {
+            doc_id: (metadata or {}).get(CONTENT_HASH_KEY)
+            for doc_id, metadata in zip(payload["ids"], payload["metadatas"])
+        }
+
+    def sync(
+        self, entity: str, documents: Iterable[Document], prune: bool = True
+    ) -> SyncResult:
+        """Upsert `documents` by id; with `prune`, drop ids not in `documents`."""
+        result = SyncResult(entity=entity)
+        store = self.collection(entity)
+        stored = self.stored_hashes(entity)
+        seen: set[str] = set()
+        changed_ids: list[str] = []
+        changed_docs: list[Document] = []
+        for document in documents:
+            doc_id = document.metadata.get("id")
+            if doc_id in (None, ""):
+                raise ValueError("Documents synced into a collection need metadata['id'].")
+            doc_id = str(doc_id)
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            digest = content_hash(document)
+            if stored.get(doc_id) == digest:
+                result.unchanged += 1
+                continue
+            if doc_id in stored:
+                result.updated += 1
+            else:
+                result.added += 1
+            changed_ids.append(doc_id)
+            changed_docs.append(
+                Document(
+                    page_content=document.page_content,
+                    metadata={**document.metadata, CONTENT_HASH_KEY: digest},
+                )
+            )
+            if len(changed_docs) >= UPSERT_CHUNK:
+                store.add_documents(changed_docs, ids=changed_ids)
+                changed_ids, changed_docs = [], []
+
+        if changed_docs:
+            store.add_documents(changed_docs, ids=changed_ids)
+        if prune:
+            stale = [doc_id for doc_id in stored if doc_id not in seen]
+            if stale:
+                store.delete(ids=stale)
+            result.deleted = len(stale)
+        if result.changed:
+            self._mark_changed(entity)
+        log_debug(f"Chroma sync {result.summary()}")
+        return result
+
+    def delete(self, entity: str, ids: Iterable[str]) -> None:
+        ids = [str(doc_id) for doc_id in ids]
+        if ids:
+            self.collection(entity).delete(ids=ids)
+            self._mark_changed(entity)
+
+    def count(self, entity: str) -> int:
+        return len(self.collection(entity).get(include=[])["ids"])
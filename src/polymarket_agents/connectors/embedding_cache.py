@@ -0,0 +1,154 @@
+"""Persistent content-hash cache in front of any LangChain embedding model."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_EMBEDDING_CACHE_PATH = "./local_db_embeddings/embeddings.sqlite"
+# SQLite caps bound parameters per statement; stay well below the limit.
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, kind, digest)
+) WITHOUT ROWID;
+"""
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def model_name_of(embeddings: Embeddings) -> str:
+    """Best-effort identifier for the model behind an embedding object."""
+    for attribute in ("model", "model_name", "deployment"):
+        value = getattr(embeddings, attribute, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(embeddings).__name__
+
+
+@dataclass(slots=True)
+class EmbeddingCacheStats:
+    """Hit/miss counters for one `CachedEmbeddings` instance."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} cached, {self.misses} embedded "
+            f"({self.hit_rate:.1%} hit rate)"
+        )
+
+
+class CachedEmbeddings(Embeddings):
+    """Wrap an embedding model so unchanged texts are never re-embedded.
+
+    Vectors are stored as float32 blobs in SQLite keyed by
+    `(model name, kind, sha256(text))`. Documents and queries are cached under
+    separate kinds because some providers embed them with different task types.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        path: str | os.PathLike[str] = DEFAULT_EMBEDDING_CACHE_PATH,
+        model_name: str | None = None,
+        cache_queries: bool = True,
+    ) -> None:
+        self.underlying = underlying
+        self.model_name = model_name or model_name_of(underlying)
+        self.cache_queries = cache_queries
+        self.stats = EmbeddingCacheStats()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        # One connection is shared by every thread that embeds through this object.
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _lookup(self, kind: str, digests: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(digests), _LOOKUP_CHUNK):
+            chunk = digests[start : start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT digest, vector FROM embeddings WHERE model = ? AND kind = ? "
+                    f"AND digest IN ({placeholders})",
+                    (self.model_name, kind, *chunk),
+                ).fetchall()
+            for digest, blob in rows:
+                found[digest] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def _store(self, kind: str, items: list[tuple[str, list[float]]]) -> None:
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, kind, digest, dim, vector) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        self.model_name,
+                        kind,
+                        digest,
+                        len(vector),
+                        np.asarray(vector, dtype=np.float32).tobytes(),
+                    )
+                    for digest, vector in items
+                ],
+            )
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        digests = [text_digest(text) for text in texts]
+        cached = self._lookup("document", list(dict.fromkeys(digests)))
+        missing: dict[str, str] = {}
+        for digest, text in zip(digests, texts):
+            if digest not in cached:
+                missing.setdefault(digest, text)
+        self.stats.hits += len(texts) - len(missing)
+        self.stats.misses += len(missing)
+        if missing:
+            vectors = self.underlying.embed_documents(list(missing.values()))
+            fresh = list(zip(missing, vectors))
+            self._store("document", fresh)
+            cached.update(fresh)
+        log_debug(f"Embedding cache ({self.model_name}): {self.stats.summary()}")
+        return [cached[digest] for digest in digests]
+
+    def embed_query(self, text: str) -> list[float]:
+        if not self.cache_queries:
+            return self.underlying.embed_query(text)
+        digest = text_digest(text)
+        cached = self._lookup("query", [digest])
+        if digest in cached:
+            self.stats.hits += 1
+            return cached[digest]
+        self.stats.misses += 1
+        vector = self.underlying.embed_query(text)
+        self._store("query", [(digest, vector)])
+        return vector
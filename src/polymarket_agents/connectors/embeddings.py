@@ -0,0 +1,162 @@
+"""Embedding service: one configuration point, batched concurrent calls, offline backend."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from polymarket_agents.utils.logging import log_debug
+from polymarket_agents.utils.ratelimit import RateLimiter
+
+PROVIDERS = ("google", "hashing")
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(slots=True)
+class EmbeddingSettings:
+    """Where embeddings come from and how hard the provider may be driven."""
+
+    provider: str = "google"
+    model: str = "models/gemini-embedding-001"
+    batch_size: int = 100  # Gemini accepts at most 100 texts per batch request
+    max_concurrency: int = 4
+    requests_per_minute: float = 1500.0
+    dimensions: int = 768  # only used by the hashing backend
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingSettings":
+        """Override defaults with `EMBEDDING_*` environment variables."""
+        defaults = cls()
+        return cls(
+            provider=os.getenv("EMBEDDING_PROVIDER", defaults.provider).lower(),
+            model=os.getenv("EMBEDDING_MODEL", defaults.model),
+            batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", defaults.batch_size)),
+            max_concurrency=int(
+                os.getenv("EMBEDDING_MAX_CONCURRENCY", defaults.max_concurrency)
+            ),
+            requests_per_minute=float(
+                os.getenv("EMBEDDING_REQUESTS_PER_MINUTE", defaults.requests_per_minute)
+            ),
+            dimensions=int(os.getenv("EMBEDDING_DIMENSIONS", defaults.dimensions)),
+        )
+
+
+class HashingEmbeddings(Embeddings):
+    """Deterministic, network-free embeddings from hashed word and character n-grams.
+
+    Each feature is hashed into one of `dimensions` buckets with a signed
+    weight and the result is L2-normalised, so texts sharing vocabulary land
+    close together. Good enough for tests, replay runs and air-gapped indexing.
+    """
+
+    def __init__(self, dimensions: int = 768, char_ngrams: tuple[int, ...] = (3, 4)) -> None:
+        self.dimensions = int(dimensions)
+        self.char_ngrams = char_ngrams
+        self.model = f"hashing-{self.dimensions}"
+
+    def _features(self, text: str) -> list[str]:
+        words = _TOKEN_PATTERN.findall(text.lower())
+        features = [f"w:{word}" for word in words]
+        features += [f"b:{first} {second}" for first, second in zip(words, words[1:])]
+        for word in words:
+            padded = f"<{word}>"
+            for size in self.char_ngrams:
+                features += [f"c:{padded[i:i + size]}" for i in range(len(padded) - size + 1)]
+        return features
+
+    def _embed(self, text: str) -> list[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dimensions] += 1.0 if value >> 63 else -1.0
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
+
+
+class BatchedEmbeddings(Embeddings):
+    """Split document embedding into provider-sized batches run concurrently.
+
+    Batches are dispatched on a thread pool of `max_concurrency` workers and
+    each request first takes a token from a shared per-minute rate limiter.
+    Output order always matches input order.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 0.0,
+    ) -> None:
+        self.underlying = underlying
+        self.model = getattr(underlying, "model", None) or type(underlying).__name__
+        self.batch_size = max(int(batch_size), 1)
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.limiter = RateLimiter(requests_per_minute, per=60.0, burst=self.max_concurrency)
+
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        self.limiter.acquire()
+        return self.underlying.embed_documents(batch)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        if not batches:
+            return []
+        started = time.perf_counter()
+        if len(batches) == 1 or self.max_concurrency == 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches))
+            ) as pool:
+                results = list(pool.map(self._embed_batch, batches))
+        log_debug(
+            f"Embedded {len(texts)} texts in {len(batches)} batches "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+        return [vector for batch in results for vector in batch]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.limiter.acquire()
+        return self.underlying.embed_query(text)
+
+
+def build_embeddings(settings: EmbeddingSettings | None = None) -> Embeddings:
+    """Construct the configured provider wrapped for batching and rate limiting."""
+    settings = settings or EmbeddingSettings.from_env()
+    if settings.provider == "hashing":
+        # Local and CPU-bound: batching adds nothing and threads would contend on the GIL.
+        return HashingEmbeddings(dimensions=settings.dimensions)
+    if settings.provider == "google":
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+        provider = GoogleGenerativeAIEmbeddings(model=settings.model)
+    else:
+        raise ValueError(
+            f"Unknown embedding provider {settings.provider!r}; expected one of {PROVIDERS}."
+        )
+    return BatchedEmbeddings(
+        provider,
+        batch_size=settings.batch_size,
+        max_concurrency=settings.max_concurrency,
+        requests_per_minute=settings.requests_per_minute,
+    )
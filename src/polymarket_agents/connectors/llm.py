@@ -0,0 +1,331 @@
+"""Chat model configuration and the single call path for Prompter-driven LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Sequence, TypeVar
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel, ValidationError
+
+from polymarket_agents.connectors.embeddings import build_embeddings
+from polymarket_agents.connectors.llm_cache import DEFAULT_LLM_CACHE_PATH, LLMResponseCache
+from polymarket_agents.connectors.llm_metrics import CallRecord, LLMMetrics, estimate_cost
+from polymarket_agents.utils.logging import log_debug
+
+PROVIDERS = ("google", "openai")
+# Rough characters-per-token ratio for English prompts, used for budgeting.
+CHARS_PER_TOKEN = 4
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclass(slots=True)
+class LLMSettings:
+    """Which chat model answers agent prompts and how."""
+
+    provider: str = "google"
+    model: str = "gemini-2.5-flash"
+    temperature: float = 0.0
+    cache_path: str = DEFAULT_LLM_CACHE_PATH  # empty disables the response cache
+    semantic_cache: bool = False
+
+    @classmethod
+    def from_env(cls) -> "LLMSettings":
+        """Override defaults with `LLM_*` environment variables."""
+        defaults = cls()
+        return cls(
+            provider=os.getenv("LLM_PROVIDER", defaults.provider).lower(),
+            model=os.getenv("LLM_MODEL", defaults.model),
+            temperature=float(os.getenv("LLM_TEMPERATURE", defaults.temperature)),
+            cache_path=os.getenv("LLM_CACHE_PATH", defaults.cache_path),
+            semantic_cache=os.getenv("LLM_SEMANTIC_CACHE", "0").lower() in ("1", "true", "yes"),
+        )
+
+
+def build_chat_model(settings: LLMSettings | None = None) -> BaseChatModel:
+    """Construct the configured LangChain chat model."""
+    settings = settings or LLMSettings.from_env()
+    if settings.provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(model=settings.model, temperature=settings.temperature)
+    if settings.provider == "openai":
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(model=settings.model, temperature=settings.temperature)
+    raise ValueError(f"Unknown LLM provider {settings.provider!r}; expected one of {PROVIDERS}.")
+
+
+def model_name_of(model: BaseChatModel) -> str:
+    """Best-effort identifier for a chat model, used in cache keys and metrics."""
+    for attribute in ("model_name", "model"):
+        value = getattr(model, attribute, None)
+        if isinstance(value, str) and value:
+            return value
+    return getattr(model, "_llm_type", type(model).__name__)
+
+
+def temperature_of(model: BaseChatModel) -> float:
+    value = getattr(model, "temperature", None)
+    return float(value) if value is not None else 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def render_messages(messages: Sequence[BaseMessage]) -> str:
+    """Canonical text form of a message list, used as the cache prompt."""
+    return "\n".join(f"[{message.type}]\n{message.content}" for message in messages)
+
+
+def as_messages(
+    prompt: str | Sequence[BaseMessage], system: str | None = None
+) -> list[BaseMessage]:
+    if isinstance(prompt, str):
+        messages: list[BaseMessage] = [HumanMessage(content=prompt)]
+    else:
+        messages = list(prompt)
+    if system:
+        messages.insert(0, SystemMessage(content=system))
+    return messages
+
+
+def parse_json_model(text: str, schema: type[ModelT]) -> ModelT:
+    """Validate the JSON object in a model answer against `schema`.
+
+    Code fences and any prose around the outermost braces are ignored; the
+    object itself is validated as-is, so a malformed answer raises
+    `ValueError` (pydantic's `ValidationError` is a subclass).
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError(f"No JSON object in model answer: {text[:200]!r}")
+    return schema.model_validate_json(text[start : end + 1])
+
+
+class LLMClient:
+    """Send prompts to a chat model, answering repeats from an `LLMResponseCache`.
+
+    Prompts built by `Prompter` are deterministic, so unchanged markets produce
+    identical prompts; with a cache those calls cost neither latency nor tokens.
+    With an `LLMMetrics` registry every call, including cache hits and errors,
+    is recorded under its prompt name.
+    """
+
+    def __init__(
+        self,
+        model: BaseChatModel | None = None,
+        cache: LLMResponseCache | None = None,
+        metrics: LLMMetrics | None = None,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        self.model = model or build_chat_model()
+        self.cache = cache
+        self.metrics = metrics
+        self.count_tokens = count_tokens
+        self.model_name = model_name_of(self.model)
+        self.temperature = temperature_of(self.model)
+
+    def _begin(
+        self, name: str, queued_at: float | None
+    ) -> tuple[CallRecord | None, float]:
+        if self.metrics is None:
+            return None, time.perf_counter()
+        now = time.time()
+        record = CallRecord(
+            prompt=name,
+            model=self.model_name,
+            started_at=now,
+            queue_s=max(now - queued_at, 0.0) if queued_at is not None else 0.0,
+        )
+        return record, time.perf_counter()
+
+    def _lookup(self, rendered: str, scope: str | None = None) -> str | None:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self.model_name, self.temperature, rendered, scope)
+        if cached is not None:
+            log_debug(f"LLM cache ({self.model_name}): {self.cache.stats.summary()}")
+        return cached
+
+    def _finish(
+        self,
+        record: CallRecord | None,
+        started: float,
+        rendered: str,
+        message: BaseMessage | None = None,
+        cache_hit: bool = False,
+        error: Exception | None = None,
+        response: str | None = None,
+        scope: str | None = None,
+    ) -> str:
+        text = response if response is not None else message.text if message is not None else ""
+        if error is None and not cache_hit and self.cache is not None:
+            self.cache.put(self.model_name, self.temperature, rendered, text, scope)
+        if record is None:
+            return text
+        record.latency_s = time.perf_counter() - started
+        record.cache_hit = cache_hit
+        if error is not None:
+            record.error = f"{type(error).__name__}: {error}"
+        elif not cache_hit:
+            usage = getattr(message, "usage_metadata", None) or {}
+            record.prompt_tokens = usage.get("input_tokens") or self.count_tokens(rendered)
+            record.completion_tokens = usage.get("output_tokens") or self.count_tokens(text)
+            record.cost_usd = estimate_cost(
+                self.model_name, record.prompt_tokens, record.completion_tokens
+            )
+        self.metrics.record(record)
+        return text
+
+    def complete(
+        self,
+        prompt: str | Sequence[BaseMessage],
+        system: str | None = None,
+        name: str = "default",
+        queued_at: float | None = None,
+        cache_scope: str | None = None,
+    ) -> str:
+        """Return the model's text answer to `prompt` (optionally after `system`).
+
+        `name` labels the call in metrics (normally the `Prompter` method) and
+        `queued_at` (epoch seconds) is when the caller first wanted the answer.
+        `cache_scope` (e.g. prompt name, market id and outcome) enables the
+        cache's semantic tier for answers within that scope only.
+        With metrics enabled the answer is streamed to time the first token.
+        """
+        messages = as_messages(prompt, system)
+        rendered = render_messages(messages)
+        record, started = self._begin(name, queued_at)
+        cached = self._lookup(rendered, cache_scope)
+        if cached is not None:
+            self._finish(record, started, rendered, cache_hit=True)
+            return cached
+        try:
+            if record is None:
+                message = self.model.invoke(messages)
+            else:
+                message = None
+                for chunk in self.model.stream(messages):
+                    if record.ttft_s is None:
+                        record.ttft_s = time.perf_counter() - started
+                    message = chunk if message is None else message + chunk
+        except Exception as exc:
+            self._finish(record, started, rendered, error=exc)
+            raise
+        return self._finish(record, started, rendered, message, scope=cache_scope)
+
+    async def acomplete(
+        self,
+        prompt: str | Sequence[BaseMessage],
+        system: str | None = None,
+        name: str = "default",
+        queued_at: float | None = None,
+        cache_scope: str | None = None,
+    ) -> str:
+        """Async `complete`; the model call is awaited.
+
+        Cache reads and writes that would embed the prompt (semantic tier) run
+        in a worker thread so they never block the event loop.
+        """
+        messages = as_messages(prompt, system)
+        rendered = render_messages(messages)
+        record, started = self._begin(name, queued_at)
+        offload = self.cache is not None and self.cache.uses_embeddings(cache_scope)
+        if offload:
+            cached = await asyncio.to_thread(self._lookup, rendered, cache_scope)
+        else:
+            cached = self._lookup(rendered, cache_scope)
+        if cached is not None:
+            self._finish(record, started, rendered, cache_hit=True)
+            return cached
+        try:
+            if record is None:
+                message = await self.model.ainvoke(messages)
+            else:
+                message = None
+                async for chunk in self.model.astream(messages):
+                    if record.ttft_s is None:
+                        record.ttft_s = time.perf_counter() - started
+                    message = chunk if message is None else message + chunk
+        except Exception as exc:
+            self._finish(record, started, rendered, error=exc)
+            raise
+        if offload:
+            return await asyncio.to_thread(
+                self._finish, record, started, rendered, message, scope=cache_scope
+            )
+        return self._finish(record, started, rendered, message, scope=cache_scope)
+
+    def complete_structured(
+        self,
+        prompt: str | Sequence[BaseMessage],
+        schema: type[ModelT],
+        system: str | None = None,
+        name: str = "default",
+        queued_at: float | None = None,
+        cache_scope: str | None = None,
+    ) -> ModelT:
+        """Return the answer to `prompt` as a validated `schema` instance in one call.
+
+        Models with native structured output (JSON schema or tool calling via
+        `with_structured_output`) are asked for `schema` directly; other models
+        are invoked as-is and their answer is parsed with `parse_json_model`, so
+        the prompt itself must ask for JSON. Answers are cached as validated
+        JSON; no first-token time is recorded for these calls.
+        """
+        messages = as_messages(prompt, system)
+        rendered = f"{render_messages(messages)}\n[schema]\n{schema.__name__}"
+        record, started = self._begin(name, queued_at)
+        cached = self._lookup(rendered, cache_scope)
+        if cached is not None:
+            try:
+                parsed = schema.model_validate_json(cached)
+            except ValidationError as exc:
+                log_debug(f"Ignoring cached {schema.__name__} that no longer validates: {exc}")
+            else:
+                self._finish(record, started, rendered, cache_hit=True)
+                return parsed
+        try:
+            structured = self.model.with_structured_output(schema, include_raw=True)
+        except NotImplementedError:
+            structured = None
+        try:
+            if structured is None:
+                message = self.model.invoke(messages)
+                parsed = parse_json_model(message.text, schema)
+            else:
+                output = structured.invoke(messages)
+                message = output["raw"]
+                if output.get("parsing_error") is not None:
+                    raise output["parsing_error"]
+                parsed = output["parsed"]
+                if not isinstance(parsed, schema):
+                    parsed = schema.model_validate(parsed)
+        except Exception as exc:
+            self._finish(record, started, rendered, error=exc)
+            raise
+        self._finish(
+            record, started, rendered, message, response=parsed.model_dump_json(), scope=cache_scope
+        )
+        return parsed
+
+
+def build_llm_client(
+    settings: LLMSettings | None = None, metrics: LLMMetrics | None = None
+) -> LLMClient:
+    """Configured chat model behind the configured response cache."""
+    settings = settings or LLMSettings.from_env()
+    cache = None
+    if settings.cache_path:
+        cache = LLMResponseCache(
+            settings.cache_path,
+            embeddings=build_embeddings() if settings.semantic_cache else None,
+        )
+    return LLMClient(build_chat_model(settings), cache=cache, metrics=metrics)
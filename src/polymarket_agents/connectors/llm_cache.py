@@ -0,0 +1,252 @@
+"""Persistent exact and semantic cache for LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_LLM_CACHE_PATH = "./local_db_llm/responses.sqlite"
+DEFAULT_LLM_CACHE_TTL = 7 * 24 * 3600.0
+DEFAULT_LLM_CACHE_ENTRIES = 50_000
+DEFAULT_SIMILARITY_CUTOFF = 0.97
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    embedding BLOB,
+    scope TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used_at);
+CREATE INDEX IF NOT EXISTS responses_created ON responses(created_at);
+"""
+# Created after the `scope` column is guaranteed to exist (older caches lack it).
+_SCOPE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS responses_scope ON responses(model, temperature, scope)"
+)
+
+
+def prompt_key(model: str, temperature: float, prompt: str) -> str:
+    """Exact-tier key: digest of model, temperature and the full prompt."""
+    payload = json.dumps([model, round(float(temperature), 4), prompt])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class LLMCacheStats:
+    """Hit/miss counters for one `LLMResponseCache`."""
+
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.exact_hits + self.semantic_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.exact_hits} exact, {self.semantic_hits} semantic, "
+            f"{self.misses} missed ({self.hit_rate:.1%} hit rate)"
+        )
+
+
+class LLMResponseCache:
+    """SQLite cache of LLM responses with an exact and an optional semantic tier.
+
+    The exact tier is keyed by `(model, temperature, sha256(prompt))`. When an
+    `embeddings` model is given and the caller names a `scope` (for example
+    prompt name, market id and outcome), a miss on the exact tier falls back
+    to the stored response in the same scope whose prompt embedding has the
+    highest cosine similarity (same model and temperature) at or above
+    `similarity_cutoff`. `Prompter` templates share long fixed bodies, so
+    prompts for different markets embed almost identically; without a scope
+    only the exact tier is used. Embedding calls run outside the cache lock.
+    Entries expire after `ttl` seconds; beyond `max_entries` the least
+    recently used are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = DEFAULT_LLM_CACHE_PATH,
+        ttl: float = DEFAULT_LLM_CACHE_TTL,
+        max_entries: int = DEFAULT_LLM_CACHE_ENTRIES,
+        embeddings: Embeddings | None = None,
+        similarity_cutoff: float = DEFAULT_SIMILARITY_CUTOFF,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embeddings = embeddings
+        self.similarity_cutoff = similarity_cutoff
+        self.clock = clock
+        self.stats = LLMCacheStats()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(responses)")}
+        if "scope" not in columns:
+            with self.connection:
+                self.connection.execute("ALTER TABLE responses ADD COLUMN scope TEXT")
+        self.connection.execute(_SCOPE_INDEX)
+        self._lock = threading.Lock()
+        # (model, temperature, scope) -> (keys, unit-length embedding matrix)
+        self._vectors: dict[tuple[str, float, str], tuple[list[str], np.ndarray]] = {}
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _touch(self, key: str, now: float) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE responses SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+
+    def uses_embeddings(self, scope: str | None) -> bool:
+        """True when a lookup or store for `scope` would call the embedding model."""
+        return self.embeddings is not None and bool(scope)
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        vector = np.asarray(self.embeddings.embed_query(prompt), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _semantic_index(
+        self, model: str, temperature: float, scope: str
+    ) -> tuple[list[str], np.ndarray]:
+        group = (model, round(float(temperature), 4), scope)
+        index = self._vectors.get(group)
+        if index is None:
+            rows = self.connection.execute(
+                "SELECT key, embedding FROM responses WHERE model = ? AND temperature = ? "
+                "AND scope = ? AND embedding IS NOT NULL AND created_at > ?",
+                (model, group[1], scope, self.clock() - self.ttl),
+            ).fetchall()
+            keys = [row[0] for row in rows]
+            matrix = (
+                np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+                if rows
+                else np.zeros((0, 0), dtype=np.float32)
+            )
+            index = (keys, matrix)
+            self._vectors[group] = index
+        return index
+
+    def _semantic_lookup(
+        self, model: str, temperature: float, scope: str, vector: np.ndarray
+    ) -> str | None:
+        keys, matrix = self._semantic_index(model, temperature, scope)
+        if not keys or matrix.shape[1] != vector.shape[0]:
+            return None
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        return keys[best] if scores[best] >= self.similarity_cutoff else None
+
+    def _response(self, key: str, now: float) -> str | None:
+        row = self.connection.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] + self.ttl <= now:
+            return None
+        self._touch(key, now)
+        return row[0]
+
+    def get(
+        self, model: str, temperature: float, prompt: str, scope: str | None = None
+    ) -> str | None:
+        """Return a cached response from the exact tier, then the scope's semantic tier."""
+        now = self.clock()
+        with self._lock:
+            response = self._response(prompt_key(model, temperature, prompt), now)
+            if response is not None:
+                self.stats.exact_hits += 1
+                return response
+            if not self.uses_embeddings(scope):
+                self.stats.misses += 1
+                return None
+        vector = self._embed(prompt)
+        with self._lock:
+            key = self._semantic_lookup(model, temperature, scope, vector)
+            response = self._response(key, now) if key else None
+            if response is not None:
+                self.stats.semantic_hits += 1
+                return response
+            self.stats.misses += 1
+            return None
+
+    def put(
+        self,
+        model: str,
+        temperature: float,
+        prompt: str,
+        response: str,
+        scope: str | None = None,
+    ) -> None:
+        now = self.clock()
+        key = prompt_key(model, temperature, prompt)
+        vector = self._embed(prompt) if self.uses_embeddings(scope) else None
+        with self._lock:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, temperature, response, "
+                    "created_at, last_used_at, hits, embedding, scope) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)",
+                    (
+                        key,
+                        model,
+                        round(float(temperature), 4),
+                        response,
+                        now,
+                        now,
+                        vector.tobytes() if vector is not None else None,
+                        scope,
+                    ),
+                )
+            if vector is not None:
+                keys, matrix = self._semantic_index(model, temperature, scope)
+                if key not in keys:
+                    stacked = np.vstack([matrix, vector]) if keys else vector[None, :]
+                    group = (model, round(float(temperature), 4), scope)
+                    self._vectors[group] = (keys + [key], stacked)
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        with self.connection:
+            expired = self.connection.execute(
+                "DELETE FROM responses WHERE created_at + ? <= ?", (self.ttl, now)
+            ).rowcount
+            overflow = self.connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        if expired or overflow:
+            self._vectors.clear()
+            log_debug(f"LLM cache evicted {expired} expired and {overflow} least-recent entries")
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
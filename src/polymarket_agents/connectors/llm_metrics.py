@@ -0,0 +1,224 @@
+"""In-process latency, token and cost metrics for LLM calls, grouped by prompt name."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+from polymarket_agents.utils.logging import log_debug, log_print
+
+DEFAULT_CALL_LOG_PATH = "./local_db_llm/calls.jsonl"
+# USD per million (prompt, completion) tokens; unknown models are costed at zero.
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+}
+# Bucket upper bounds: seconds for timings, counts for tokens.
+SECONDS_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+TOKEN_BUCKETS = (16, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 131072)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    prompt_price, completion_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum and bucket-interpolated quantiles."""
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile by linear interpolation inside the target bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                upper = min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+                lower = min(self.bounds[index - 1] if index else 0.0, upper)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+        }
+
+
+@dataclass(slots=True)
+class CallRecord:
+    """Measurements for one LLM call."""
+
+    prompt: str  # prompt name, e.g. "superforecaster"
+    model: str
+    started_at: float = field(default_factory=time.time)
+    queue_s: float = 0.0
+    ttft_s: float | None = None
+    latency_s: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    cache_hit: bool = False
+    error: str | None = None
+
+
+class PromptMetrics:
+    """Aggregates for every call made with one prompt name."""
+
+    def __init__(self, prompt: str) -> None:
+        self.prompt = prompt
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cost_usd = 0.0
+        self.queue_s = Histogram(SECONDS_BUCKETS)
+        self.ttft_s = Histogram(SECONDS_BUCKETS)
+        self.latency_s = Histogram(SECONDS_BUCKETS)
+        self.prompt_tokens = Histogram(TOKEN_BUCKETS)
+        self.completion_tokens = Histogram(TOKEN_BUCKETS)
+
+    def observe(self, record: CallRecord) -> None:
+        self.calls += 1
+        self.errors += record.error is not None
+        self.cache_hits += record.cache_hit
+        self.cost_usd += record.cost_usd
+        self.queue_s.observe(record.queue_s)
+        self.latency_s.observe(record.latency_s)
+        if record.ttft_s is not None:
+            self.ttft_s.observe(record.ttft_s)
+        if not record.cache_hit and record.error is None:
+            self.prompt_tokens.observe(record.prompt_tokens)
+            self.completion_tokens.observe(record.completion_tokens)
+
+    def to_dict(self) -> dict:
+        return {
+            "prompt": self.prompt,
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "cost_usd": self.cost_usd,
+            "queue_s": self.queue_s.to_dict(),
+            "ttft_s": self.ttft_s.to_dict(),
+            "latency_s": self.latency_s.to_dict(),
+            "prompt_tokens": self.prompt_tokens.to_dict(),
+            "completion_tokens": self.completion_tokens.to_dict(),
+        }
+
+
+class LLMMetrics:
+    """Thread-safe registry of `PromptMetrics` with pluggable exporters.
+
+    Every recorded call is passed to each exporter (for example
+    `JsonlExporter`) after it is aggregated; exporter failures never affect
+    the call being measured.
+    """
+
+    def __init__(self) -> None:
+        self.prompts: dict[str, PromptMetrics] = {}
+        self.exporters: list[Callable[[CallRecord], None]] = []
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: Callable[[CallRecord], None]) -> None:
+        self.exporters.append(exporter)
+
+    def record(self, record: CallRecord) -> None:
+        with self._lock:
+            metrics = self.prompts.get(record.prompt)
+            if metrics is None:
+                metrics = self.prompts[record.prompt] = PromptMetrics(record.prompt)
+            metrics.observe(record)
+        for exporter in self.exporters:
+            try:
+                exporter(record)
+            except Exception as exc:  # pragma: no cover - exporters are best effort
+                log_debug(f"LLM metrics exporter failed: {exc}")
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [metrics.to_dict() for metrics in self.prompts.values()]
+
+    @classmethod
+    def from_records(cls, records: Iterable[CallRecord]) -> "LLMMetrics":
+        metrics = cls()
+        for record in records:
+            metrics.record(record)
+        return metrics
+
+
+class JsonlExporter:
+    """Append each call as one JSON line, for reports across processes."""
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_CALL_LOG_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def __call__(self, record: CallRecord) -> None:
+        line = json.dumps(asdict(record))
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+
+def read_call_log(
+    path: str | os.PathLike[str] = DEFAULT_CALL_LOG_PATH, since: float | None = None
+) -> list[CallRecord]:
+    """Load calls written by `JsonlExporter`, optionally only those after `since`."""
+    records: list[CallRecord] = []
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                record = CallRecord(**json.loads(line))
+                if since is None or record.started_at >= since:
+                    records.append(record)
+    return records
+
+
+def print_llm_report(metrics: LLMMetrics) -> None:
+    """Render per-prompt calls, cache hits, latency percentiles, tokens and cost."""
+    rows = sorted(metrics.prompts.values(), key=lambda item: item.cost_usd, reverse=True)
+    log_print(
+        f"{'prompt':<22} {'calls':>6} {'cached':>7} {'errors':>6} {'queue p50':>10} "
+        f"{'ttft p50':>9} {'p50 s':>7} {'p95 s':>7} {'in tok':>8} {'out tok':>8} {'cost $':>9}"
+    )
+    for item in rows:
+        log_print(
+            f"{item.prompt:<22} {item.calls:>6} {item.cache_hits:>7} {item.errors:>6} "
+            f"{item.queue_s.quantile(0.5):>10.3f} {item.ttft_s.quantile(0.5):>9.3f} "
+            f"{item.latency_s.quantile(0.5):>7.2f} {item.latency_s.quantile(0.95):>7.2f} "
+            f"{int(item.prompt_tokens.total):>8} {int(item.completion_tokens.total):>8} "
+            f"{item.cost_usd:>9.4f}"
+        )
+    total = sum(item.cost_usd for item in rows)
+    log_print(f"Total estimated cost: ${total:.4f}")
@@ -1,13 +1,75 @@
-from datetime import datetime
+"""NewsAPI connector with concurrent, cached and de-duplicated article fetching."""
+
+from __future__ import annotations
+
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import partial
+from typing import Any
 
 from newsapi import NewsApiClient
 
+from polymarket_agents.utils.cache import TTLCache, cache_key
+from polymarket_agents.utils.logging import log_debug, log_error
 from polymarket_agents.utils.objects import Article
+from polymarket_agents.utils.ratelimit import RateLimiter
+
+DEFAULT_NEWS_CACHE_PATH = "./local_db_news/news.sqlite"
+DEFAULT_NEWS_TTL = 900.0
+
+
+# The only formats newsapi-python accepts for string dates, besides YYYY-MM-DD.
+NEWSAPI_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _date_key(value: datetime | date | str | None) -> str | None:
+    """Render a date bound as NewsAPI expects it; aware datetimes go to UTC first."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(NEWSAPI_DATETIME_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+@dataclass(slots=True)
+class NewsFetchStats:
+    """Counters for one `News` instance."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    duplicates: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.cache_hits} cached, "
+            f"{self.errors} errors, {self.duplicates} duplicate articles dropped"
+        )
 
 
 class News:
-    def __init__(self) -> None:
+    """Search NewsAPI for market options.
+
+    Per-option queries run concurrently on a thread pool, each request taking
+    a token from a shared per-minute rate limiter. Responses are cached on disk
+    for `ttl` seconds (pass `cache_path=None` to disable), and articles found
+    by several options are returned once, under the first option that matched.
+    """
+
+    def __init__(
+        self,
+        cache_path: str | os.PathLike[str] | None = DEFAULT_NEWS_CACHE_PATH,
+        ttl: float = DEFAULT_NEWS_TTL,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 30.0,
+        client: NewsApiClient | None = None,
+    ) -> None:
         self.configs = {
             "language": "en",
             "country": "us",
@@ -25,52 +87,110 @@ class News:
             "technology",
         }
 
-        self.API = NewsApiClient(os.getenv("NEWSAPI_API_KEY"))
+        self.API = client or NewsApiClient(os.getenv("NEWSAPI_API_KEY"))
+        self.cache = TTLCache(cache_path, "newsapi", ttl) if cache_path else None
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.limiter = RateLimiter(requests_per_minute, per=60.0, burst=self.max_concurrency)
+        self.stats = NewsFetchStats()
 
     def get_articles_for_cli_keywords(self, keywords) -> "list[Article]":
         query_words = keywords.split(",")
         all_articles = self.get_articles_for_options(query_words)
-        article_objects: list[Article] = []
-        for _, articles in all_articles.items():
-            for article in articles:
-                article_objects.append(Article(**article))
-        return article_objects
+        return [article for articles in all_articles.values() for article in articles]
 
     def get_top_articles_for_market(self, market_object: dict) -> "list[Article]":
         return self.API.get_top_headlines(
             language="en", country="usa", q=market_object["description"]
         )
 
+    def _request(self, endpoint: str, params: dict[str, Any]) -> list[dict]:
+        self.limiter.acquire()
+        if endpoint == "top_headlines":
+            response = self.API.get_top_headlines(**params)
+        else:
+            response = self.API.get_everything(**params)
+        return response.get("articles") or []
+
+    def _fetch_option(self, endpoint: str, params: dict[str, Any]) -> list[dict] | None:
+        try:
+            return self._request(endpoint, params)
+        except Exception as exc:
+            log_error(f"NewsAPI {endpoint} query {params.get('q')!r} failed: {exc}")
+            return None
+
+    def fetch(self, endpoint: str, queries: list[str], **params: Any) -> dict[str, list[dict]]:
+        """Return raw article dicts per query, from cache where still fresh."""
+        results: dict[str, list[dict]] = {}
+        missing: dict[str, dict[str, Any]] = {}
+        for query in dict.fromkeys(queries):
+            request = {"q": query, **params}
+            cached = self.cache.get(cache_key(endpoint, **request)) if self.cache else None
+            if cached is not None:
+                self.stats.cache_hits += 1
+                results[query] = cached
+            else:
+                missing[query] = request
+
+        if len(missing) > 1 and self.max_concurrency > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(missing))
+            ) as pool:
+                fetched = list(
+                    pool.map(partial(self._fetch_option, endpoint), missing.values())
+                )
+        else:
+            fetched = [self._fetch_option(endpoint, request) for request in missing.values()]
+
+        for (query, request), articles in zip(missing.items(), fetched):
+            self.stats.requests += 1
+            if articles is None:
+                self.stats.errors += 1
+                results[query] = []
+                continue
+            if self.cache:
+                self.cache.put(cache_key(endpoint, **request), articles)
+            results[query] = articles
+        return results
+
     def get_articles_for_options(
         self,
         market_options: "list[str]",
-        date_start: datetime = None,
-        date_end: datetime = None,
-    ) -> "list[Article]":
-
-        all_articles = {}
+        date_start: datetime | date | None = None,
+        date_end: datetime | date | None = None,
+    ) -> "dict[str, list[Article]]":
+        """Fetch articles for each option, de-duplicated by URL across options."""
+        options = [option.strip() for option in market_options if option and option.strip()]
         # Default to top articles if no start and end dates are given for search
         if not date_start and not date_end:
-            for option in market_options:
-                response_dict = self.API.get_top_headlines(
-                    q=option.strip(),
-                    language=self.configs["language"],
-                    country=self.configs["country"],
-                )
-                articles = response_dict["articles"]
-                all_articles[option] = articles
+            raw = self.fetch(
+                "top_headlines",
+                options,
+                language=self.configs["language"],
+                country=self.configs["country"],
+            )
         else:
-            for option in market_options:
-                response_dict = self.API.get_everything(
-                    q=option.strip(),
-                    language=self.configs["language"],
-                    country=self.configs["country"],
-                    from_param=date_start,
-                    to=date_end,
-                )
-                articles = response_dict["articles"]
-                all_articles[option] = articles
+            raw = self.fetch(
+                "everything",
+                options,
+                language=self.configs["language"],
+                from_param=_date_key(date_start),
+                to=_date_key(date_end),
+            )
 
+        all_articles: dict[str, list[Article]] = {}
+        seen: set[str] = set()
+        for option in dict.fromkeys(options):
+            articles: list[Article] = []
+            for payload in raw.get(option, []):
+                identity = payload.get("url") or payload.get("title")
+                if identity:
+                    if identity in seen:
+                        self.stats.duplicates += 1
+                        continue
+                    seen.add(identity)
+                articles.append(Article.model_validate(payload))
+            all_articles[option] = articles
+        log_debug(f"News fetch: {self.stats.summary()}")
         return all_articles
 
     def get_category(self, market_object: dict) -> str:
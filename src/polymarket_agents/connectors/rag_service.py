@@ -0,0 +1,225 @@
+"""Long-lived RAG query service: open the store and embedding client once, stay warm."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from polymarket_agents.connectors.chroma_collections import (
+    DEFAULT_COLLECTIONS_DIRECTORY,
+    ChromaCollections,
+)
+from polymarket_agents.connectors.embedding_cache import (
+    DEFAULT_EMBEDDING_CACHE_PATH,
+    CachedEmbeddings,
+)
+from polymarket_agents.connectors.embeddings import build_embeddings
+from polymarket_agents.connectors.vector_index import MemmapVectorIndex
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_QUERY_CACHE_SIZE = 1024
+RRF_K = 60
+
+
+@dataclass(slots=True)
+class QueryCacheStats:
+    """Hit/miss counters for the in-memory query embedding LRU."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QueryEmbeddingLRU:
+    """Thread-safe LRU of query text -> embedding in front of an embedding model."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        maxsize: int = DEFAULT_QUERY_CACHE_SIZE,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.embeddings = embeddings
+        self.maxsize = maxsize
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.stats = QueryCacheStats()
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, text: str) -> list[float] | None:
+        with self._lock:
+            vector = self._entries.get(text)
+            if vector is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(text)
+            self.stats.hits += 1
+            return vector
+
+    def _put(self, text: str, vector: list[float]) -> None:
+        with self._lock:
+            self._entries[text] = vector
+            self._entries.move_to_end(text)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed queries, calling the model concurrently only for unseen texts."""
+        found = {text: self._get(text) for text in dict.fromkeys(texts)}
+        missing = [text for text, vector in found.items() if vector is None]
+        if len(missing) == 1:
+            found[missing[0]] = self.embeddings.embed_query(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(missing))) as pool:
+                found.update(zip(missing, pool.map(self.embeddings.embed_query, missing)))
+        for text in missing:
+            self._put(text, found[text])
+        return [found[text] for text in texts]
+
+
+class RAGQueryService:
+    """Answer similarity queries against one entity collection without re-opening it.
+
+    The embedding client, Chroma collection and (for the `memmap` backend) the
+    memory-mapped index are created once and reused for every query. Several
+    reformulations of a question, such as those produced by the `multiquery`
+    prompt, are embedded together, scored in a single pass over the index and
+    fused with reciprocal rank fusion.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] = DEFAULT_COLLECTIONS_DIRECTORY,
+        entity: str = "markets",
+        embedding_function: Embeddings | None = None,
+        embedding_cache_path: str | None = DEFAULT_EMBEDDING_CACHE_PATH,
+        backend: str = "memmap",
+        cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+    ) -> None:
+        if backend not in ("chroma", "memmap"):
+            raise ValueError("backend must be 'chroma' or 'memmap'.")
+        embeddings = embedding_function or build_embeddings()
+        if embedding_cache_path:
+            embeddings = CachedEmbeddings(embeddings, path=embedding_cache_path)
+        self.entity = entity
+        self.backend = backend
+        self.embeddings = embeddings
+        self.queries = QueryEmbeddingLRU(embeddings, maxsize=cache_size)
+        self.collections = ChromaCollections(embeddings, persist_directory=directory)
+        self.store = self.collections.collection(entity)
+        self.index_directory = Path(self.collections.persist_directory) / "memmap"
+        self.index: MemmapVectorIndex | None = None
+        self._reload_lock = threading.Lock()
+        if backend == "memmap":
+            if self.is_stale():
+                self.reload()
+            else:
+                self.index = MemmapVectorIndex(
+                    self.index_directory, self.entity, self.embeddings
+                )
+                log_debug(f"RAG service opened {len(self.index)} {self.entity}")
+
+    def is_stale(self) -> bool:
+        """True when there is no memmap export or the collection changed after it."""
+        written = MemmapVectorIndex.written_at(self.index_directory, self.entity)
+        if written is None:
+            return True
+        changed = self.collections.changed_at(self.entity)
+        return changed is not None and changed > written
+
+    def reload(self) -> None:
+        """Re-export the Chroma collection into the memory-mapped index."""
+        self.index = MemmapVectorIndex.from_chroma(self.index_directory, self.entity, self.store)
+        self.index.embedding_function = self.embeddings
+        log_debug(f"RAG service loaded {len(self.index)} {self.entity}")
+
+    def reload_if_stale(self) -> bool:
+        """Re-export only if the collection changed since the export; True if it did.
+
+        Safe to call from concurrent requests: one caller re-exports while the
+        others wait and then see a fresh index.
+        """
+        if self.backend != "memmap" or not self.is_stale():
+            return False
+        with self._reload_lock:
+            if not self.is_stale():
+                return False
+            self.reload()
+        return True
+
+    def _search_vectors(
+        self, vectors: list[list[float]], k: int, where: Mapping[str, Any] | None
+    ) -> list[list[tuple[Document, float]]]:
+        if self.index is not None:
+            return [
+                [(self.index.document(row), score) for row, score in hits]
+                for hits in self.index.search_by_vectors(vectors, k=k, where=where)
+            ]
+        return [
+            self.store.similarity_search_by_vector_with_relevance_scores(
+                vector, k=k, filter=dict(where) if where else None
+            )
+            for vector in vectors
+        ]
+
+    def query(
+        self, text: str, k: int = 4, where: Mapping[str, Any] | None = None
+    ) -> list[tuple[Document, float]]:
+        return self._search_vectors(self.queries.embed([text]), k, where)[0]
+
+    def multi_query(
+        self,
+        texts: Sequence[str],
+        k: int = 4,
+        where: Mapping[str, Any] | None = None,
+    ) -> list[tuple[Document, float]]:
+        """Search every reformulation at once and merge results by reciprocal rank."""
+        texts = [text.strip() for text in texts if text and text.strip()]
+        if not texts:
+            return []
+        rankings = self._search_vectors(self.queries.embed(texts), k, where)
+        fused: dict[str, float] = {}
+        documents: dict[str, Document] = {}
+        for ranking in rankings:
+            for rank, (document, _) in enumerate(ranking):
+                key = str(document.metadata.get("id", document.page_content))
+                documents.setdefault(key, document)
+                fused[key] = fused.get(key, 0.0) + 1.0 / (RRF_K + rank + 1)
+        best = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(documents[key], score) for key, score in best]
+
+
+@lru_cache(maxsize=None)
+def get_rag_service(
+    directory: str = DEFAULT_COLLECTIONS_DIRECTORY,
+    entity: str = "markets",
+    backend: str = "memmap",
+) -> RAGQueryService:
+    """Process-wide service per `(directory, entity, backend)`, created on first use."""
+    return RAGQueryService(directory=directory, entity=entity, backend=backend)
+
+
+@lru_cache(maxsize=1)
+def get_configured_rag_service() -> RAGQueryService:
+    """The markets service set up by `RAG_DIRECTORY` and `RAG_BACKEND`, for servers.
+
+    Takes no arguments so request handlers cannot choose where the store lives.
+    """
+    return get_rag_service(
+        os.getenv("RAG_DIRECTORY", DEFAULT_COLLECTIONS_DIRECTORY),
+        "markets",
+        os.getenv("RAG_BACKEND", "memmap"),
+    )
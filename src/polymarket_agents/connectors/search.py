@@ -1,17 +1,168 @@
-import os
+"""Web search context for agent prompts, backed by Tavily or a local stand-in."""
+
+from __future__ import annotations
 
-from tavily import TavilyClient
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Iterable, Mapping, Protocol
 
 from polymarket_agents.settings.env import load_env
+from polymarket_agents.utils.cache import TTLCache, cache_key
+from polymarket_agents.utils.logging import log_debug, log_error
+
+DEFAULT_SEARCH_CACHE_PATH = "./local_db_search/search.sqlite"
+DEFAULT_SEARCH_TTL = 6 * 3600.0
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchBudgetExceeded(RuntimeError):
+    """Raised when a live search would exceed the connector's request budget."""
+
+
+class SearchBackend(Protocol):
+    """Anything with Tavily's `get_search_context` signature."""
+
+    def get_search_context(self, query: str, **kwargs: Any) -> str: ...
+
+
+def normalise_query(query: str) -> str:
+    """Lower-case, collapse whitespace and drop trailing punctuation."""
+    return " ".join(query.lower().split()).rstrip("?!. ")
+
+
+class LocalSearchBackend:
+    """Offline backend ranking a fixed corpus by word overlap with the query.
+
+    `documents` maps URL to page text. Contexts are returned in Tavily's
+    format: a JSON list of `{"url", "content"}` objects.
+    """
+
+    def __init__(self, documents: Mapping[str, str] | None = None) -> None:
+        self.documents = dict(documents or {})
+        self.calls = 0
+
+    def get_search_context(self, query: str, max_results: int = 5, **kwargs: Any) -> str:
+        self.calls += 1
+        terms = set(_TOKEN_PATTERN.findall(query.lower()))
+        scored = []
+        for url, content in self.documents.items():
+            overlap = len(terms & set(_TOKEN_PATTERN.findall(content.lower())))
+            if overlap:
+                scored.append((overlap, url, content))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return json.dumps(
+            [{"url": url, "content": content} for _, url, content in scored[:max_results]]
+        )
+
+
+@dataclass(slots=True)
+class SearchStats:
+    """Counters for one `SearchConnector`."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    over_budget: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.cache_hits} cached, "
+            f"{self.errors} errors, {self.over_budget} over budget"
+        )
+
+
+class SearchConnector:
+    """Fetch search contexts with a disk cache, concurrency and a request budget.
+
+    The Tavily client is only created on the first live search, so importing
+    or constructing the connector never touches the network. Contexts are
+    cached for `ttl` seconds keyed by the normalised query and search options.
+    `max_requests` caps live searches over the connector's lifetime; cache
+    hits are free.
+    """
+
+    def __init__(
+        self,
+        backend: SearchBackend | None = None,
+        cache_path: str | os.PathLike[str] | None = DEFAULT_SEARCH_CACHE_PATH,
+        ttl: float = DEFAULT_SEARCH_TTL,
+        max_concurrency: int = 4,
+        max_requests: int | None = None,
+    ) -> None:
+        self._backend = backend
+        self.cache = TTLCache(cache_path, "search", ttl) if cache_path else None
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.max_requests = max_requests
+        self.stats = SearchStats()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> SearchBackend:
+        with self._lock:
+            if self._backend is None:
+                from tavily import TavilyClient
+
+                load_env()
+                api_key = os.getenv("TAVILY_API_KEY")
+                if not api_key:
+                    raise RuntimeError("TAVILY_API_KEY is not set.")
+                self._backend = TavilyClient(api_key=api_key)
+            return self._backend
 
-load_env()
+    def _spend(self) -> None:
+        with self._lock:
+            if self.max_requests is not None and self.stats.requests >= self.max_requests:
+                self.stats.over_budget += 1
+                raise SearchBudgetExceeded(
+                    f"Search budget of {self.max_requests} requests is spent."
+                )
+            self.stats.requests += 1
 
-openai_api_key = os.getenv("OPEN_API_KEY")
-tavily_api_key = os.getenv("TAVILY_API_KEY")
+    def context(self, query: str, **options: Any) -> str:
+        """Return the search context for `query`, from cache when fresh."""
+        key = cache_key(normalise_query(query), **options)
+        cached = self.cache.get(key) if self.cache else None
+        if cached is not None:
+            with self._lock:
+                self.stats.cache_hits += 1
+            return cached
+        self._spend()
+        try:
+            context = self.backend.get_search_context(query=query, **options)
+        except Exception:
+            with self._lock:
+                self.stats.errors += 1
+            raise
+        if self.cache:
+            self.cache.put(key, context)
+        return context
 
-# Step 1. Instantiating your TavilyClient
-tavily_client = TavilyClient(api_key=tavily_api_key)
+    def _safe_context(self, options: dict[str, Any], query: str) -> str:
+        try:
+            return self.context(query, **options)
+        except Exception as exc:
+            log_error(f"Search for {query!r} failed: {exc}")
+            return ""
 
-# Step 2. Executing a context search query
-context = tavily_client.get_search_context(query="Will Biden drop out of the race?")
-# Step 3. That's it! You now have a context string that you can feed directly into your RAG Application
+    def contexts(self, queries: Iterable[str], **options: Any) -> dict[str, str]:
+        """Search several queries concurrently; failed or over-budget ones map to ''."""
+        queries = [query for query in queries if query and query.strip()]
+        unique: dict[str, str] = {}
+        for query in queries:
+            unique.setdefault(normalise_query(query), query.strip())
+        originals = list(unique.values())
+        if len(originals) > 1 and self.max_concurrency > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(originals))
+            ) as pool:
+                results = list(pool.map(partial(self._safe_context, options), originals))
+        else:
+            results = [self._safe_context(options, query) for query in originals]
+        log_debug(f"Search: {self.stats.summary()}")
+        by_normal = dict(zip(unique, results))
+        return {query: by_normal[normalise_query(query)] for query in queries}
@@ -0,0 +1,339 @@
+"""Memory-mapped NumPy vector index for fast-starting cosine similarity search."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from polymarket_agents.utils.logging import log_debug
+
+DEFAULT_BLOCK_ROWS = 65_536
+_VECTORS_SUFFIX = ".f32"
+_SIDECAR_SUFFIX = ".meta.json"
+_RANGE_OPERATORS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+def _normalise(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+class MemmapVectorIndex:
+    """Read-only cosine index over unit-length float32 rows in a memory-mapped file.
+
+    `<name>.f32` holds a `(count, dim)` row-major matrix and `<name>.meta.json`
+    holds ids, page contents and metadata in the same order. Opening the index
+    maps the file rather than reading it, so start-up is constant time and
+    worker processes that open (or unpickle) the same index share one copy of
+    the vectors through the page cache.
+
+    Scores are cosine similarities (higher is closer), unlike Chroma's distances.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        name: str = "markets",
+        embedding_function: Embeddings | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.name = name
+        self.embedding_function = embedding_function
+        sidecar = json.loads(self.sidecar_path.read_text())
+        self.dim = int(sidecar["dim"])
+        self.ids: list[str] = sidecar["ids"]
+        self.contents: list[str] = sidecar["contents"]
+        self.metadatas: list[dict] = sidecar["metadatas"]
+        self._columns: dict[str, np.ndarray] = {}
+        self.vectors = (
+            np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(len(self.ids), self.dim))
+            if self.ids
+            else np.zeros((0, self.dim), dtype=np.float32)
+        )
+
+    @property
+    def vectors_path(self) -> Path:
+        return self.directory / f"{self.name}{_VECTORS_SUFFIX}"
+
+    @property
+    def sidecar_path(self) -> Path:
+        return self.directory / f"{self.name}{_SIDECAR_SUFFIX}"
+
+    @staticmethod
+    def exists(directory: str | os.PathLike[str], name: str = "markets") -> bool:
+        return (Path(directory) / f"{name}{_SIDECAR_SUFFIX}").exists()
+
+    @staticmethod
+    def written_at(directory: str | os.PathLike[str], name: str = "markets") -> float | None:
+        """When the index was last written, or None if it does not exist."""
+        try:
+            return (Path(directory) / f"{name}{_SIDECAR_SUFFIX}").stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getstate__(self) -> dict:
+        # Ship paths, not vectors: the receiving process re-maps the same file.
+        return {
+            "directory": self.directory,
+            "name": self.name,
+            "embedding_function": self.embedding_function,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["directory"], state["name"], state["embedding_function"])
+
+    @classmethod
+    def write(
+        cls,
+        directory: str | os.PathLike[str],
+        name: str,
+        ids: Sequence[str],
+        vectors: np.ndarray | Sequence[Sequence[float]],
+        contents: Sequence[str],
+        metadatas: Sequence[Mapping[str, Any] | None],
+        embedding_function: Embeddings | None = None,
+    ) -> "MemmapVectorIndex":
+        """Persist normalised vectors plus sidecar and return the opened index.
+
+        Files are written under temporary names and renamed into place, so
+        readers that already mapped the previous version keep a valid view.
+        """
+        if len(ids):
+            matrix = _normalise(np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1))
+        else:
+            # An empty collection has no rows to infer a width from: dim 0.
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        vectors_path = target / f"{name}{_VECTORS_SUFFIX}"
+        sidecar_path = target / f"{name}{_SIDECAR_SUFFIX}"
+        temporary_vectors = vectors_path.with_suffix(".f32.tmp")
+        temporary_sidecar = sidecar_path.with_suffix(".json.tmp")
+        matrix.tofile(temporary_vectors)
+        temporary_sidecar.write_text(
+            json.dumps(
+                {
+                    "dim": int(matrix.shape[1]),
+                    "ids": [str(doc_id) for doc_id in ids],
+                    "contents": list(contents),
+                    "metadatas": [dict(metadata or {}) for metadata in metadatas],
+                }
+            )
+        )
+        os.replace(temporary_vectors, vectors_path)
+        os.replace(temporary_sidecar, sidecar_path)
+        log_debug(f"Wrote {len(ids)} vectors to {vectors_path}")
+        return cls(target, name, embedding_function)
+
+    @classmethod
+    def from_documents(
+        cls,
+        directory: str | os.PathLike[str],
+        name: str,
+        documents: Iterable[Document],
+        embedding_function: Embeddings,
+    ) -> "MemmapVectorIndex":
+        """Embed `documents` (keyed by `metadata["id"]`) and write a new index."""
+        documents = list(documents)
+        vectors = embedding_function.embed_documents(
+            [document.page_content for document in documents]
+        )
+        return cls.write(
+            directory,
+            name,
+            [str(document.metadata.get("id", index)) for index, document in enumerate(documents)],
+            vectors,
+            [document.page_content for document in documents],
+            [document.metadata for document in documents],
+            embedding_function,
+        )
+
+    @classmethod
+    def from_chroma(
+        cls, directory: str | os.PathLike[str], name: str, store: Any
+    ) -> "MemmapVectorIndex":
+        """Export a LangChain `Chroma` store's stored embeddings without re-embedding."""
+        payload = store.get(include=["embeddings", "documents", "metadatas"])
+        return cls.write(
+            directory,
+            name,
+            payload["ids"],
+            payload["embeddings"],
+            payload["documents"],
+            payload["metadatas"],
+            getattr(store, "embeddings", None),
+        )
+
+    def _column(self, key: str) -> np.ndarray:
+        column = self._columns.get(key)
+        if column is None:
+            column = np.empty(len(self.metadatas), dtype=object)
+            column[:] = [metadata.get(key) for metadata in self.metadatas]
+            self._columns[key] = column
+        return column
+
+    def _numeric_column(self, key: str) -> np.ndarray:
+        cache_key = f"#{key}"
+        column = self._columns.get(cache_key)
+        if column is None:
+            values = [metadata.get(key) for metadata in self.metadatas]
+            column = np.array(
+                [
+                    float(value)
+                    if isinstance(value, (int, float)) and not isinstance(value, bool)
+                    else np.nan
+                    for value in values
+                ],
+                dtype=np.float64,
+            )
+            self._columns[cache_key] = column
+        return column
+
+    def _condition(self, key: str, condition: Any) -> np.ndarray:
+        if not isinstance(condition, Mapping):
+            if isinstance(condition, (list, tuple, set)):
+                condition = {"$in": list(condition)}
+            else:
+                condition = {"$eq": condition}
+        selected = np.ones(len(self), dtype=bool)
+        for operator_name, expected in condition.items():
+            if operator_name in _RANGE_OPERATORS:
+                with np.errstate(invalid="ignore"):
+                    selected &= _RANGE_OPERATORS[operator_name](
+                        self._numeric_column(key), float(expected)
+                    )
+            elif operator_name == "$eq":
+                selected &= self._column(key) == expected
+            elif operator_name == "$ne":
+                selected &= self._column(key) != expected
+            elif operator_name in ("$in", "$nin"):
+                found = np.isin(self._column(key), list(expected))
+                selected &= found if operator_name == "$in" else ~found
+            elif operator_name == "$contains":
+                selected &= np.fromiter(
+                    (
+                        expected in value if isinstance(value, list) else value == expected
+                        for value in self._column(key)
+                    ),
+                    dtype=bool,
+                    count=len(self),
+                )
+            else:
+                raise ValueError(f"Unsupported filter operator {operator_name!r} on {key!r}.")
+        return selected
+
+    def mask(self, where: Mapping[str, Any] | None) -> np.ndarray | None:
+        """Evaluate a Chroma-style `where` expression into a boolean row mask.
+
+        Supports `$and`/`$or`, `$eq`, `$ne`, `$gt`, `$gte`, `$lt`, `$lte`, `$in`,
+        `$nin` and `$contains` (list membership). A bare value means `$eq` and a
+        bare list means `$in`. Range operators never match missing values.
+        """
+        if not where:
+            return None
+        selected = np.ones(len(self), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    selected &= self.mask(clause)
+            elif key == "$or":
+                either = np.zeros(len(self), dtype=bool)
+                for clause in condition:
+                    either |= self.mask(clause)
+                selected &= either
+            else:
+                selected &= self._condition(key, condition)
+        return selected
+
+    def search_by_vector(
+        self,
+        embedding: Sequence[float],
+        k: int = 4,
+        where: Mapping[str, Any] | None = None,
+        mask: np.ndarray | None = None,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ) -> list[tuple[int, float]]:
+        """Return `(row, cosine)` pairs for the `k` best rows passing the filters."""
+        return self.search_by_vectors([embedding], k, where, mask, block_rows)[0]
+
+    def search_by_vectors(
+        self,
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+        k: int = 4,
+        where: Mapping[str, Any] | None = None,
+        mask: np.ndarray | None = None,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ) -> list[list[tuple[int, float]]]:
+        """Answer several queries with one pass over the vectors.
+
+        Each block is read once and multiplied against the whole query matrix,
+        so `m` queries cost one scan instead of `m`.
+        """
+        queries = _normalise(np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1))
+        n_queries = len(queries)
+        if not len(self) or k <= 0 or not n_queries:
+            return [[] for _ in range(n_queries)]
+        where_mask = self.mask(where)
+        if where_mask is not None:
+            mask = where_mask if mask is None else mask & where_mask
+        best_rows = np.empty((n_queries, 0), dtype=np.int64)
+        best_scores = np.empty((n_queries, 0), dtype=np.float32)
+        for start in range(0, len(self), block_rows):
+            stop = min(start + block_rows, len(self))
+            rows = np.arange(start, stop)
+            if mask is not None:
+                rows = rows[mask[start:stop]]
+                if not len(rows):
+                    continue
+                scores = queries @ self.vectors[rows].T
+            else:
+                scores = queries @ self.vectors[start:stop].T
+            if scores.shape[1] > k:
+                top = np.argpartition(scores, -k, axis=1)[:, -k:]
+                block_best = rows[top]
+                scores = np.take_along_axis(scores, top, axis=1)
+            else:
+                block_best = np.broadcast_to(rows, scores.shape)
+            best_rows = np.concatenate([best_rows, block_best], axis=1)
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            if best_scores.shape[1] > k:
+                top = np.argpartition(best_scores, -k, axis=1)[:, -k:]
+                best_rows = np.take_along_axis(best_rows, top, axis=1)
+                best_scores = np.take_along_axis(best_scores, top, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        return [
+            [(int(row), float(score)) for row, score in zip(row_ids, row_scores)]
+            for row_ids, row_scores in zip(best_rows, best_scores)
+        ]
+
+    def document(self, row: int) -> Document:
+        return Document(page_content=self.contents[row], metadata=dict(self.metadatas[row]))
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: Mapping[str, Any] | None = None
+    ) -> list[tuple[Document, float]]:
+        """Chroma-compatible text query; requires an embedding function."""
+        if self.embedding_function is None:
+            raise RuntimeError("This index was opened without an embedding function.")
+        embedding = self.embedding_function.embed_query(query)
+        return [
+            (self.document(row), score)
+            for row, score in self.search_by_vector(embedding, k=k, where=filter)
+        ]
@@ -0,0 +1,170 @@
+"""Positive and negative caching for CLOB order book fetches."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+from py_clob_client.clob_types import OrderBookSummary
+
+from polymarket_agents.polymarket.clob import ClobReader
+from polymarket_agents.polymarket.polymarket import Polymarket
+from polymarket_agents.utils.logging import log_debug, log_error
+
+
+class OrderBookUnavailable(RuntimeError):
+    """Raised instead of fetching a book that is negatively cached."""
+
+
+@dataclass(slots=True)
+class _NegativeEntry:
+    expires_at: float
+    strikes: int
+    reason: str  # "empty" or "error"
+
+
+@dataclass(slots=True)
+class BookCacheMetrics:
+    """Counters describing how the cache shaped the request budget."""
+
+    fetches: int = 0
+    positive_hits: int = 0
+    skipped: int = 0
+    empty: int = 0
+    errors: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.fetches} fetched, {self.positive_hits} served from cache, "
+            f"{self.skipped} skipped as dead, {self.empty} empty, {self.errors} errors"
+        )
+
+
+class OrderBookCache:
+    """Wrap an order book source with TTL caches keyed by token id.
+
+    Tokens whose book comes back empty (no bids and no asks) or fails to load
+    are suppressed for `negative_ttl` seconds; each further empty result or
+    error multiplies the suppression window by `backoff`, capped at
+    `max_negative_ttl`. A healthy book clears the token's strikes and is
+    reused for `positive_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        source: Polymarket | ClobReader,
+        negative_ttl: float = 300.0,
+        max_negative_ttl: float = 6 * 3600.0,
+        backoff: float = 2.0,
+        positive_ttl: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.source = source
+        self.negative_ttl = negative_ttl
+        self.max_negative_ttl = max_negative_ttl
+        self.backoff = backoff
+        self.positive_ttl = positive_ttl
+        self.clock = clock
+        self.metrics = BookCacheMetrics()
+        self._negative: dict[str, _NegativeEntry] = {}
+        self._positive: dict[str, tuple[float, OrderBookSummary]] = {}
+        self._next_sweep = clock() + positive_ttl
+
+    def is_suppressed(self, token_id: str) -> bool:
+        """Return True while a token sits in the negative cache."""
+        entry = self._negative.get(str(token_id))
+        return entry is not None and entry.expires_at > self.clock()
+
+    def suppressed(self, token_ids: Iterable[str]) -> list[str]:
+        """Return the subset of `token_ids` that should not be fetched right now."""
+        suppressed = [token_id for token_id in token_ids if self.is_suppressed(token_id)]
+        self.metrics.skipped += len(suppressed)
+        return suppressed
+
+    def get_orderbook(self, token_id: str) -> OrderBookSummary:
+        """Return a book from cache or the source, recording empty books and errors."""
+        token_id = str(token_id)
+        now = self.clock()
+        negative = self._negative.get(token_id)
+        if negative is not None and negative.expires_at > now:
+            self.metrics.skipped += 1
+            raise OrderBookUnavailable(
+                f"Order book for {token_id} suppressed ({negative.reason}, "
+                f"{negative.strikes} strikes)"
+            )
+        cached = self._positive.get(token_id)
+        if cached is not None:
+            if cached[0] > now:
+                self.metrics.positive_hits += 1
+                return cached[1]
+            del self._positive[token_id]
+
+        self.metrics.fetches += 1
+        try:
+            book = self.source.get_orderbook(token_id)
+        except Exception:
+            self.metrics.errors += 1
+            self._strike(token_id, "error", now)
+            raise
+
+        if not getattr(book, "asks", None) and not getattr(book, "bids", None):
+            self.metrics.empty += 1
+            self._strike(token_id, "empty", now)
+            return book
+
+        self._negative.pop(token_id, None)
+        self._positive[token_id] = (now + self.positive_ttl, book)
+        if now >= self._next_sweep:
+            self._sweep_positive(now)
+        return book
+
+    def _sweep_positive(self, now: float) -> None:
+        # A scan rarely looks a token up twice, so expired books are swept on
+        # insert at most once per TTL rather than only when the cache is saved.
+        self._positive = {
+            token_id: entry for token_id, entry in self._positive.items() if entry[0] > now
+        }
+        self._next_sweep = now + self.positive_ttl
+
+    def _strike(self, token_id: str, reason: str, now: float) -> None:
+        self._positive.pop(token_id, None)
+        previous = self._negative.get(token_id)
+        strikes = previous.strikes + 1 if previous is not None else 1
+        ttl = min(self.negative_ttl * self.backoff ** (strikes - 1), self.max_negative_ttl)
+        self._negative[token_id] = _NegativeEntry(now + ttl, strikes, reason)
+        log_debug(f"Suppressing order book {token_id} for {ttl:.0f}s ({reason})")
+
+    def prune(self) -> None:
+        """Drop expired positive entries and negative entries long past expiry."""
+        now = self.clock()
+        self._sweep_positive(now)
+        # Keep expired strikes for one extra window so back-off survives a retry.
+        self._negative = {
+            token_id: entry
+            for token_id, entry in self._negative.items()
+            if entry.expires_at + self.max_negative_ttl > now
+        }
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Persist the negative cache so later runs skip the same dead books."""
+        self.prune()
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {token_id: asdict(entry) for token_id, entry in self._negative.items()}
+        target.write_text(json.dumps(payload))
+
+    def load(self, path: str | os.PathLike[str]) -> None:
+        """Merge negative entries previously written by `save`."""
+        source = Path(path)
+        if not source.exists():
+            return
+        try:
+            payload = json.loads(source.read_text())
+            for token_id, entry in payload.items():
+                self._negative[token_id] = _NegativeEntry(**entry)
+        except (ValueError, TypeError) as exc:
+            log_error(f"Ignoring unreadable order book cache {source}: {exc}")
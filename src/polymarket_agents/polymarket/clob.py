@@ -0,0 +1,62 @@
+"""Read-only client for the public Polymarket CLOB endpoints."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+import httpx
+from py_clob_client.clob_types import OrderBookSummary
+from py_clob_client.utilities import parse_raw_orderbook_summary
+
+from polymarket_agents.utils.logging import log_error
+
+CLOB_URL = "https://clob.polymarket.com"
+
+
+class ClobReader:
+    """Unauthenticated access to CLOB order books and prices over a shared HTTP session.
+
+    Unlike `Polymarket`, this client needs no wallet or API credentials, so it can
+    be pointed at a local stand-in server or driven through a replay transport.
+    """
+
+    def __init__(
+        self,
+        base_url: str = CLOB_URL,
+        http_client: httpx.Client | None = None,
+    ) -> None:
+        self.clob_url = base_url.rstrip("/")
+        self.http_client = http_client or httpx.Client(
+            timeout=httpx.Timeout(30.0, read=30.0)
+        )
+
+    def get_orderbook(self, token_id: str) -> OrderBookSummary:
+        """Return the order book summary for a single outcome token."""
+        payload = self._request("GET", "/book", params={"token_id": str(token_id)})
+        return parse_raw_orderbook_summary(payload)
+
+    def get_orderbooks(self, token_ids: Iterable[str]) -> list[OrderBookSummary]:
+        """Return order book summaries for several tokens in one request."""
+        body = [{"token_id": str(token_id)} for token_id in token_ids]
+        if not body:
+            return []
+        payload = self._request("POST", "/books", json=body)
+        return [parse_raw_orderbook_summary(raw_book) for raw_book in payload]
+
+    def get_price(self, token_id: str, side: str) -> float:
+        """Return the best resting price for `side` (`BUY` or `SELL`) on a token."""
+        payload = self._request(
+            "GET", "/price", params={"token_id": str(token_id), "side": side}
+        )
+        return float(payload["price"])
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Issue a request against the CLOB and return the decoded JSON payload."""
+        endpoint = self.clob_url + path
+        response = self.http_client.request(method, endpoint, **kwargs)
+        if response.status_code != 200:
+            log_error(
+                f"CLOB returned HTTP {response.status_code} for {method} {endpoint}"
+            )
+            raise RuntimeError(f"Unable to fetch data from {endpoint}")
+        return response.json()
@@ -2,19 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
 
 import httpx
 
-from polymarket_agents.utils.logging import log_error
+from polymarket_agents.utils.logging import log_debug, log_error
+
+
+DATA_API_URL = "https://data-api.polymarket.com"
+MAX_POSITIONS_PAGE_SIZE = 500
+
+
+@dataclass(slots=True)
+class WalletPositions:
+    """All positions fetched for one wallet, with fetch statistics."""
+
+    wallet: str
+    positions: List[dict] = field(default_factory=list)
+    pages: int = 0
+    latency_s: float = 0.0
+    error: Optional[str] = None
 
 
 class DataAPI:
     """Minimal wrapper around the Polymarket data-api service."""
 
-    def __init__(self) -> None:
-        self.base_url = "https://data-api.polymarket.com"
+    def __init__(
+        self,
+        base_url: str = DATA_API_URL,
+        http_client: Optional[httpx.Client] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
         self.positions_endpoint = f"{self.base_url}/positions"
+        self.http_client = http_client or httpx.Client(
+            timeout=httpx.Timeout(30.0, read=30.0)
+        )
+        # Used by the bulk fetcher; async clients are bound to the running loop.
+        self.async_transport = async_transport
 
     def get_positions(self, user: str, **params: Any) -> List[dict]:
         """Return positions associated with the provided on-chain address."""
@@ -24,11 +52,90 @@ class DataAPI:
         query: Dict[str, Any] = {"user": user}
         query.update(params)
 
-        response = httpx.get(
-            self.positions_endpoint,
-            params=query,
+        response = self.http_client.get(self.positions_endpoint, params=query)
+        return self._parse_positions_response(response)
+
+    def get_positions_for_wallets(
+        self,
+        users: Iterable[str],
+        page_size: int = MAX_POSITIONS_PAGE_SIZE,
+        max_concurrency: int = 8,
+        **params: Any,
+    ) -> Dict[str, WalletPositions]:
+        """Fetch every position for many wallets concurrently (blocking wrapper)."""
+        return asyncio.run(
+            self.aget_positions_for_wallets(
+                users, page_size=page_size, max_concurrency=max_concurrency, **params
+            )
+        )
+
+    async def aget_positions_for_wallets(
+        self,
+        users: Iterable[str],
+        page_size: int = MAX_POSITIONS_PAGE_SIZE,
+        max_concurrency: int = 8,
+        **params: Any,
+    ) -> Dict[str, WalletPositions]:
+        """Page through `limit`/`offset` for each wallet over one pooled async client.
+
+        At most `max_concurrency` requests are in flight across all wallets. A
+        failing wallet is reported through `WalletPositions.error` instead of
+        aborting the batch.
+        """
+        wallets = list(dict.fromkeys(user for user in users if user))
+        if not wallets:
+            raise ValueError("At least one user address must be provided.")
+        page_size = max(1, min(int(page_size), MAX_POSITIONS_PAGE_SIZE))
+        semaphore = asyncio.Semaphore(max(int(max_concurrency), 1))
+        limits = httpx.Limits(max_connections=max(int(max_concurrency), 1))
+        async with httpx.AsyncClient(
             timeout=httpx.Timeout(30.0, read=30.0),
+            limits=limits,
+            transport=self.async_transport,
+        ) as client:
+            results = await asyncio.gather(
+                *(
+                    self._fetch_wallet(client, semaphore, wallet, page_size, params)
+                    for wallet in wallets
+                )
+            )
+        return {result.wallet: result for result in results}
+
+    async def _fetch_wallet(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        wallet: str,
+        page_size: int,
+        params: Dict[str, Any],
+    ) -> WalletPositions:
+        result = WalletPositions(wallet=wallet)
+        started = time.perf_counter()
+        offset = 0
+        try:
+            while True:
+                query: Dict[str, Any] = {**params, "user": wallet, "limit": page_size}
+                query["offset"] = offset
+                async with semaphore:
+                    response = await client.get(self.positions_endpoint, params=query)
+                page = self._parse_positions_response(response)
+                result.pages += 1
+                result.positions.extend(page)
+                if len(page) < page_size:
+                    break
+                offset += page_size
+        except (httpx.HTTPError, RuntimeError, ValueError) as exc:
+            # ValueError covers malformed JSON bodies (json.JSONDecodeError).
+            result.error = str(exc)
+            log_error(f"Failed to fetch positions for {wallet}: {exc}")
+        result.latency_s = time.perf_counter() - started
+        log_debug(
+            f"Fetched {len(result.positions)} positions for {wallet} "
+            f"in {result.pages} pages ({result.latency_s:.3f}s)"
         )
+        return result
+
+    def _parse_positions_response(self, response: httpx.Response) -> List[dict]:
         if response.status_code != 200:
             log_error(
                 f"Data API returned HTTP {response.status_code} for "
@@ -6,6 +6,8 @@ import httpx
 from polymarket_agents.utils.objects import ClobReward, Market, PolymarketEvent, Tag
 from polymarket_agents.utils.logging import log_debug, log_error,log_print,print_markets
 
+GAMMA_URL = "https://gamma-api.polymarket.com"
+
 TRADABLE_MARKET_BASE_FILTER: Dict[str, Any] = {
     "active": True,
     "closed": False,
@@ -17,11 +19,18 @@ TRADABLE_MARKET_BASE_FILTER: Dict[str, Any] = {
 class GammaMarketClient:
     """Thin wrapper around the public Gamma REST API used by the agents."""
 
-    def __init__(self):
-        """Initialise base URLs for the Gamma API."""
-        self.gamma_url = "https://gamma-api.polymarket.com"
+    def __init__(
+        self,
+        base_url: str = GAMMA_URL,
+        http_client: Optional[httpx.Client] = None,
+    ):
+        """Initialise base URLs and the HTTP session used for the Gamma API."""
+        self.gamma_url = base_url.rstrip("/")
         self.gamma_markets_endpoint = self.gamma_url + "/markets"
         self.gamma_events_endpoint = self.gamma_url + "/events"
+        self.http_client = http_client or httpx.Client(
+            timeout=httpx.Timeout(30.0, read=30.0)
+        )
 
     def parse_pydantic_market(self, market_object: dict) -> Optional[Market]:
         """Convert a raw market payload into the richer `Market` pydantic model."""
@@ -184,9 +193,31 @@ class GammaMarketClient:
                 parsed_markets.append(parsed)
         return parsed_markets
 
+    def get_market_categories(
+        self, condition_ids: Iterable[str], batch_size: int = 50
+    ) -> dict[str, str]:
+        """Map condition ids to the market's category (or its event's), in batches.
+
+        Markets without a category on either level are left out of the result.
+        """
+        wanted = list(dict.fromkeys(str(item) for item in condition_ids if item))
+        categories: dict[str, str] = {}
+        for start in range(0, len(wanted), batch_size):
+            batch = wanted[start : start + batch_size]
+            payload = self._fetch(
+                self.gamma_markets_endpoint,
+                {"condition_ids": batch, "limit": len(batch)},
+            )
+            for market_obj in payload:
+                events = market_obj.get("events") or [{}]
+                category = market_obj.get("category") or events[0].get("category")
+                if market_obj.get("conditionId") and category:
+                    categories[str(market_obj["conditionId"])] = str(category)
+        return categories
+
     def _fetch(self, endpoint: str, params: Dict[str, Any]) -> list[dict]:
         """Perform a GET request against Gamma and return the JSON payload."""
-        response = httpx.get(endpoint, params=params, timeout=httpx.Timeout(30.0, read=30.0))
+        response = self.http_client.get(endpoint, params=params)
         if response.status_code != 200:
             log_error(
                 f"Error response returned from api: HTTP {response.status_code} for {endpoint}"
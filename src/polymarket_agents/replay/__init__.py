@@ -0,0 +1,26 @@
+from .backends import CassetteBackend, SyntheticBackend
+from .cassette import Cassette, CassetteMiss, Interaction
+from .synthetic import SyntheticUniverse
+from .transport import (
+    BackendTransport,
+    RecordingTransport,
+    ReplayTransport,
+    backend_client,
+    recording_client,
+    replay_client,
+)
+
+__all__ = [
+    "BackendTransport",
+    "Cassette",
+    "CassetteBackend",
+    "CassetteMiss",
+    "Interaction",
+    "RecordingTransport",
+    "ReplayTransport",
+    "SyntheticBackend",
+    "SyntheticUniverse",
+    "backend_client",
+    "recording_client",
+    "replay_client",
+]
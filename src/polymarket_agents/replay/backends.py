@@ -0,0 +1,101 @@
+"""Data sources that answer stand-in Gamma, CLOB and Data API requests."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Mapping
+
+import httpx
+
+from polymarket_agents.replay.cassette import Cassette, CassetteMiss
+from polymarket_agents.replay.synthetic import SyntheticUniverse
+
+
+def _int_param(params: Mapping[str, Any], name: str, default: int) -> int:
+    try:
+        return int(params.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class SyntheticBackend:
+    """Serve generated payloads from a `SyntheticUniverse`."""
+
+    def __init__(self, universe: SyntheticUniverse) -> None:
+        self.universe = universe
+
+    def markets(self, params: Mapping[str, Any]) -> list[dict]:
+        return self.universe.markets(
+            offset=_int_param(params, "offset", 0), limit=_int_param(params, "limit", 100)
+        )
+
+    def events(self, params: Mapping[str, Any]) -> list[dict]:
+        return self.universe.events(
+            offset=_int_param(params, "offset", 0), limit=_int_param(params, "limit", 100)
+        )
+
+    def book(self, token_id: str) -> dict | None:
+        return self.universe.book(token_id)
+
+    def books(self, token_ids: Iterable[str]) -> list[dict]:
+        books = (self.universe.book(token_id) for token_id in token_ids)
+        return [book for book in books if book is not None]
+
+    def price(self, token_id: str, side: str) -> dict | None:
+        return self.universe.price(token_id, side)
+
+    def positions(self, params: Mapping[str, Any]) -> list[dict]:
+        return self.universe.positions(
+            str(params.get("user", "")),
+            offset=_int_param(params, "offset", 0),
+            limit=_int_param(params, "limit", 100),
+        )
+
+
+class CassetteBackend:
+    """Serve recorded responses from a cassette, matching on path and query only."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        self.cassette = cassette
+
+    def _lookup(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None = None,
+        body: Any = None,
+    ) -> Any:
+        # QueryParams keeps repeated names; plain mappings may map a name to a list.
+        query = httpx.QueryParams(params or {}).multi_items()
+        raw_body = json.dumps(body) if body is not None else None
+        try:
+            interaction = self.cassette.find_by_path(method, path, query, raw_body)
+        except CassetteMiss:
+            return None
+        if interaction.status != 200:
+            return None
+        return json.loads(interaction.response_body)
+
+    def markets(self, params: Mapping[str, Any]) -> list[dict]:
+        return self._lookup("GET", "/markets", params) or []
+
+    def events(self, params: Mapping[str, Any]) -> list[dict]:
+        return self._lookup("GET", "/events", params) or []
+
+    def book(self, token_id: str) -> dict | None:
+        return self._lookup("GET", "/book", {"token_id": token_id})
+
+    def books(self, token_ids: Iterable[str]) -> list[dict]:
+        body = [{"token_id": str(token_id)} for token_id in token_ids]
+        recorded = self._lookup("POST", "/books", body=body)
+        if recorded is not None:
+            return recorded
+        # Fall back to individually recorded books when no batch was captured.
+        books = (self.book(entry["token_id"]) for entry in body)
+        return [book for book in books if book is not None]
+
+    def price(self, token_id: str, side: str) -> dict | None:
+        return self._lookup("GET", "/price", {"token_id": token_id, "side": side})
+
+    def positions(self, params: Mapping[str, Any]) -> list[dict]:
+        return self._lookup("GET", "/positions", params) or []
@@ -0,0 +1,186 @@
+"""Compressed on-disk storage for recorded HTTP interactions."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import parse_qsl
+
+# Query parameters whose value changes on every call and must not affect matching.
+DEFAULT_IGNORED_PARAMS: frozenset[str] = frozenset({"end_date_min"})
+
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed request has no recorded counterpart."""
+
+
+@dataclass(slots=True)
+class Interaction:
+    """A single recorded request/response pair."""
+
+    method: str
+    host: str
+    path: str
+    query: list[tuple[str, str]]
+    request_body: str | None
+    status: int
+    content_type: str
+    response_body: str
+    recorded_at: float = field(default_factory=time.time)
+
+    def to_record(self) -> dict:
+        record = asdict(self)
+        record["query"] = [list(pair) for pair in self.query]
+        return record
+
+    @classmethod
+    def from_record(cls, record: dict) -> "Interaction":
+        record = dict(record)
+        record["query"] = [tuple(pair) for pair in record.get("query", [])]
+        return cls(**record)
+
+
+def request_key(
+    method: str,
+    host: str,
+    path: str,
+    query: Iterable[tuple[str, str]],
+    body: str | None,
+    ignored_params: frozenset[str] = DEFAULT_IGNORED_PARAMS,
+) -> str:
+    """Build a stable lookup key for a request, ignoring volatile parameters."""
+    canonical_query = sorted(
+        (str(name), str(value)) for name, value in query if name not in ignored_params
+    )
+    body_digest = hashlib.sha1(_canonical_body(body).encode("utf-8")).hexdigest()
+    return json.dumps(
+        [method.upper(), host.lower(), path.rstrip("/") or "/", canonical_query, body_digest]
+    )
+
+
+def _canonical_body(body: str | None) -> str:
+    """Normalise JSON request bodies so serializer spacing does not break matching."""
+    if not body:
+        return ""
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return body
+
+
+def parse_query(raw_query: str | bytes) -> list[tuple[str, str]]:
+    """Decode a raw URL query string into name/value pairs."""
+    if isinstance(raw_query, bytes):
+        raw_query = raw_query.decode("utf-8")
+    return parse_qsl(raw_query, keep_blank_values=True)
+
+
+class Cassette:
+    """Ordered collection of interactions persisted as gzip-compressed JSON lines.
+
+    Repeated requests with the same key are replayed in recording order; once
+    exhausted, the last matching response keeps being served.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        ignored_params: frozenset[str] = DEFAULT_IGNORED_PARAMS,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.ignored_params = ignored_params
+        self.interactions: list[Interaction] = []
+        self._index: dict[str, list[Interaction]] = {}
+        self._cursor: dict[str, int] = {}
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        ignored_params: frozenset[str] = DEFAULT_IGNORED_PARAMS,
+    ) -> "Cassette":
+        """Read a cassette from disk."""
+        cassette = cls(path, ignored_params=ignored_params)
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if line:
+                    cassette.append(Interaction.from_record(json.loads(line)))
+        return cassette
+
+    def save(self, path: str | os.PathLike[str] | None = None) -> Path:
+        """Write every interaction to `path` (or the cassette's own path)."""
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("A path is required to save a cassette.")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(target, "wt", encoding="utf-8") as handle:
+            for interaction in self.interactions:
+                handle.write(json.dumps(interaction.to_record(), separators=(",", ":")))
+                handle.write("\n")
+        self.path = target
+        return target
+
+    def append(self, interaction: Interaction) -> None:
+        """Add an interaction and index it for replay."""
+        self.interactions.append(interaction)
+        key = self._key_for(interaction)
+        self._index.setdefault(key, []).append(interaction)
+
+    def find(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        query: Iterable[tuple[str, str]],
+        body: str | None = None,
+    ) -> Interaction:
+        """Return the next recorded response for a request or raise `CassetteMiss`."""
+        key = request_key(method, host, path, query, body, self.ignored_params)
+        matches = self._index.get(key)
+        if not matches:
+            raise CassetteMiss(f"No recorded response for {method} {host}{path}")
+        position = self._cursor.get(key, 0)
+        self._cursor[key] = position + 1
+        return matches[min(position, len(matches) - 1)]
+
+    def find_by_path(
+        self, method: str, path: str, query: Iterable[tuple[str, str]], body: str | None = None
+    ) -> Interaction:
+        """Like `find`, but match on any recorded host (used by the stand-in server)."""
+        for host in self.hosts():
+            try:
+                return self.find(method, host, path, query, body)
+            except CassetteMiss:
+                continue
+        raise CassetteMiss(f"No recorded response for {method} {path}")
+
+    def hosts(self) -> list[str]:
+        """Return the distinct hosts present in the cassette."""
+        return sorted({interaction.host for interaction in self.interactions})
+
+    def rewind(self) -> None:
+        """Restart replay from the first recorded response for every key."""
+        self._cursor.clear()
+
+    def __iter__(self) -> Iterator[Interaction]:
+        return iter(self.interactions)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def _key_for(self, interaction: Interaction) -> str:
+        return request_key(
+            interaction.method,
+            interaction.host,
+            interaction.path,
+            interaction.query,
+            interaction.request_body,
+            self.ignored_params,
+        )
@@ -0,0 +1,53 @@
+"""Capture live Gamma, CLOB and Data API responses into a cassette."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+from polymarket_agents.polymarket.clob import ClobReader
+from polymarket_agents.polymarket.data_api import DataAPI
+from polymarket_agents.polymarket.gamma import GammaMarketClient
+from polymarket_agents.replay.cassette import Cassette
+from polymarket_agents.replay.transport import recording_client
+from polymarket_agents.utils.logging import log_debug, log_print
+
+
+def record_session(
+    path: str | os.PathLike[str],
+    market_limit: int = 50,
+    offset: int = 0,
+    event_limit: int = 20,
+    wallets: Iterable[str] = (),
+) -> Path:
+    """Record a representative scan (markets, events, books, prices, positions)."""
+    cassette = Cassette(path)
+    with recording_client(cassette) as http_client:
+        gamma = GammaMarketClient(http_client=http_client)
+        clob = ClobReader(http_client=http_client)
+        data_api = DataAPI(http_client=http_client)
+
+        log_print(f"Recording {market_limit} markets from offset {offset}...")
+        markets = gamma.get_tradable_markets(limit=market_limit, offset=offset)
+        if event_limit:
+            gamma.get_tradeable_events(limit=event_limit)
+
+        token_ids = [
+            str(token_id) for market in markets for token_id in market.clobTokenIds or []
+        ]
+        for token_id in token_ids:
+            try:
+                clob.get_orderbook(token_id)
+                clob.get_price(token_id, "BUY")
+            except Exception as exc:  # recorded as-is; a failing book is still useful
+                log_debug(f"Recorded failure for token {token_id}: {exc}")
+        if token_ids:
+            clob.get_orderbooks(token_ids)
+
+        for wallet in wallets:
+            data_api.get_positions(user=wallet, limit=500, offset=0)
+
+    saved = cassette.save()
+    log_print(f"Saved {len(cassette)} interactions to {saved}")
+    return saved
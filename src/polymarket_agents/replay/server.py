@@ -0,0 +1,57 @@
+"""Local FastAPI stand-in for the Gamma, CLOB and Data API endpoints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+from fastapi import Body, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from polymarket_agents.replay.backends import CassetteBackend, SyntheticBackend
+from polymarket_agents.replay.transport import dispatch
+
+
+def create_app(backend: SyntheticBackend | CassetteBackend) -> FastAPI:
+    """Build an app serving `/markets`, `/events`, `/book`, `/books`, `/price`, `/positions`."""
+    app = FastAPI(title="Polymarket stand-in")
+
+    def respond(method: str, path: str, request: Request, body: Any = None) -> JSONResponse:
+        params = httpx.QueryParams(request.query_params.multi_items())
+        status, payload = dispatch(backend, method, path, params, body)
+        return JSONResponse(payload, status_code=status)
+
+    @app.get("/markets")
+    def markets(request: Request) -> JSONResponse:
+        return respond("GET", "/markets", request)
+
+    @app.get("/events")
+    def events(request: Request) -> JSONResponse:
+        return respond("GET", "/events", request)
+
+    @app.get("/book")
+    def book(request: Request) -> JSONResponse:
+        return respond("GET", "/book", request)
+
+    @app.post("/books")
+    def books(request: Request, payload: list[dict] = Body(default_factory=list)) -> JSONResponse:
+        return respond("POST", "/books", request, payload)
+
+    @app.get("/price")
+    def price(request: Request) -> JSONResponse:
+        return respond("GET", "/price", request)
+
+    @app.get("/positions")
+    def positions(request: Request) -> JSONResponse:
+        return respond("GET", "/positions", request)
+
+    return app
+
+
+def serve(
+    backend: SyntheticBackend | CassetteBackend, host: str = "127.0.0.1", port: int = 8765
+) -> None:
+    """Run the stand-in server until interrupted."""
+    import uvicorn
+
+    uvicorn.run(create_app(backend), host=host, port=port, log_level="warning")
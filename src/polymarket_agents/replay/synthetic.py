@@ -0,0 +1,243 @@
+"""Deterministic synthetic Gamma, CLOB and Data API payloads.
+
+Every market, book and position is derived from `(seed, index)` on demand, so a
+100k-market universe costs no memory until it is read and two processes with the
+same parameters see byte-identical data.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+_TOKEN_BASE = 10**38
+_TOKEN_STRIDE = 64  # upper bound on outcomes per market
+_TICK = 0.001
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# End dates start this far after `_EPOCH`, so synthetic markets stay open for years.
+_OPEN_DAYS = 10 * 365
+_CATEGORIES = ("Politics", "Sports", "Crypto", "Business", "Science", "Pop Culture")
+
+
+@dataclass(slots=True)
+class SyntheticUniverse:
+    """Parameters describing a generated market catalogue and its order books."""
+
+    n_markets: int = 1_000
+    min_outcomes: int = 2
+    max_outcomes: int = 2
+    min_depth: int = 1
+    max_depth: int = 10
+    arbitrage_rate: float = 0.01
+    empty_book_rate: float = 0.05
+    positions_per_wallet: int = 25
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_outcomes <= self.max_outcomes <= _TOKEN_STRIDE:
+            raise ValueError(f"Outcome counts must lie within 1..{_TOKEN_STRIDE}.")
+        if not 0 <= self.min_depth <= self.max_depth:
+            raise ValueError("Book depth bounds are invalid.")
+
+    def _rng(self, *parts: object) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.seed, *parts)))
+
+    def outcome_count(self, index: int) -> int:
+        return self._rng("outcomes", index).randint(self.min_outcomes, self.max_outcomes)
+
+    def token_ids(self, index: int) -> list[str]:
+        base = _TOKEN_BASE + index * _TOKEN_STRIDE
+        return [str(base + outcome) for outcome in range(self.outcome_count(index))]
+
+    def market_index_for_token(self, token_id: str) -> tuple[int, int] | None:
+        """Return `(market_index, outcome_index)` for a synthetic token id."""
+        try:
+            offset = int(token_id) - _TOKEN_BASE
+        except (TypeError, ValueError):
+            return None
+        if offset < 0:
+            return None
+        index, outcome = divmod(offset, _TOKEN_STRIDE)
+        if index >= self.n_markets or outcome >= self.outcome_count(index):
+            return None
+        return index, outcome
+
+    def fair_probabilities(self, index: int) -> list[float]:
+        rng = self._rng("fair", index)
+        weights = [rng.gammavariate(1.0, 1.0) for _ in range(self.outcome_count(index))]
+        total = sum(weights) or 1.0
+        return [weight / total for weight in weights]
+
+    def market(self, index: int) -> dict:
+        """Return a raw Gamma `/markets` payload entry for market `index`."""
+        rng = self._rng("market", index)
+        outcome_count = self.outcome_count(index)
+        outcomes = (
+            ["Yes", "No"]
+            if outcome_count == 2
+            else [f"Candidate {position + 1}" for position in range(outcome_count)]
+        )
+        prices = [round(price, 3) for price in self.fair_probabilities(index)]
+        created = _EPOCH + timedelta(minutes=index)
+        end = _EPOCH + timedelta(days=_OPEN_DAYS + rng.randint(0, 365))
+        volume = round(rng.lognormvariate(8.0, 2.0), 2)
+        liquidity = round(rng.lognormvariate(7.0, 1.5), 2)
+        return {
+            "id": str(100_000 + index),
+            "question": f"Synthetic market #{index}?",
+            "conditionId": f"0x{index:064x}",
+            "slug": f"synthetic-market-{index}",
+            "category": _CATEGORIES[index % len(_CATEGORIES)],
+            "description": f"Synthetic market {index} with {outcome_count} outcomes.",
+            "endDate": end.replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+            "createdAt": created.isoformat().replace("+00:00", "Z"),
+            "updatedAt": created.isoformat().replace("+00:00", "Z"),
+            "outcomes": json.dumps(outcomes),
+            "outcomePrices": json.dumps([str(price) for price in prices]),
+            "clobTokenIds": json.dumps(self.token_ids(index)),
+            "volume": str(volume),
+            "volumeNum": volume,
+            "liquidity": str(liquidity),
+            "liquidityNum": liquidity,
+            "volume24hr": round(volume * rng.random() * 0.1, 2),
+            "spread": 0.01,
+            "active": True,
+            "closed": False,
+            "archived": False,
+            "restricted": False,
+            "enableOrderBook": True,
+            "acceptingOrders": True,
+            "negRisk": outcome_count > 2,
+            "orderPriceMinTickSize": _TICK,
+        }
+
+    def markets(self, offset: int = 0, limit: int = 100) -> list[dict]:
+        start = max(offset, 0)
+        stop = min(start + max(limit, 0), self.n_markets)
+        return [self.market(index) for index in range(start, stop)]
+
+    def events(self, offset: int = 0, limit: int = 100, markets_per_event: int = 3) -> list[dict]:
+        """Group consecutive markets into synthetic events."""
+        n_events = -(-self.n_markets // markets_per_event)
+        start = max(offset, 0)
+        stop = min(start + max(limit, 0), n_events)
+        events: list[dict] = []
+        for event_index in range(start, stop):
+            first = event_index * markets_per_event
+            nested = self.markets(first, markets_per_event)
+            events.append(
+                {
+                    "id": str(500_000 + event_index),
+                    "slug": f"synthetic-event-{event_index}",
+                    "title": f"Synthetic event #{event_index}",
+                    "description": f"Synthetic event grouping {len(nested)} markets.",
+                    "active": True,
+                    "closed": False,
+                    "archived": False,
+                    "restricted": False,
+                    "enableOrderBook": True,
+                    "markets": nested,
+                    "tags": [{"id": "1", "label": nested[0]["category"], "slug": "synthetic"}],
+                }
+            )
+        return events
+
+    def book(self, token_id: str) -> dict | None:
+        """Return a raw CLOB `/book` payload, or `None` for unknown tokens."""
+        location = self.market_index_for_token(token_id)
+        if location is None:
+            return None
+        index, outcome = location
+        rng = self._rng("book", index, outcome)
+        bids: list[dict] = []
+        asks: list[dict] = []
+        if rng.random() >= self.empty_book_rate:
+            fair = self.fair_probabilities(index)[outcome]
+            half_spread = 0.005 + rng.random() * 0.02
+            if self._rng("arb", index).random() < self.arbitrage_rate:
+                # Push every ask below fair value so the set costs less than $1.
+                half_spread = -0.02
+            depth = rng.randint(self.min_depth, self.max_depth)
+            best_ask = min(max(fair + half_spread, _TICK), 1 - _TICK)
+            best_bid = min(max(fair - abs(half_spread), _TICK), 1 - _TICK)
+            for level in range(depth):
+                ask_price = min(best_ask + level * 0.01, 1 - _TICK)
+                bid_price = max(best_bid - level * 0.01, _TICK)
+                asks.append({"price": f"{ask_price:.3f}", "size": f"{rng.uniform(5, 500):.2f}"})
+                bids.append({"price": f"{bid_price:.3f}", "size": f"{rng.uniform(5, 500):.2f}"})
+            # The live CLOB lists the best level last on both sides.
+            asks.reverse()
+            bids.reverse()
+        updated = _EPOCH + timedelta(minutes=index, seconds=rng.randint(1, 86_400))
+        return {
+            "market": f"0x{index:064x}",
+            "asset_id": str(token_id),
+            "timestamp": str(int(updated.timestamp() * 1000)),
+            "hash": f"{self.seed:x}{index:x}{outcome:x}",
+            "bids": bids,
+            "asks": asks,
+            "min_order_size": "5",
+            "tick_size": str(_TICK),
+            "neg_risk": self.outcome_count(index) > 2,
+            "last_trade_price": f"{self.fair_probabilities(index)[outcome]:.3f}",
+        }
+
+    def price(self, token_id: str, side: str) -> dict | None:
+        """Return a `/price` payload: best bid for `BUY`, best ask for `SELL`."""
+        book = self.book(token_id)
+        if book is None:
+            return None
+        levels = book["bids"] if side.upper() == "BUY" else book["asks"]
+        if not levels:
+            return None
+        return {"price": levels[-1]["price"]}
+
+    def positions(self, user: str, offset: int = 0, limit: int = 100) -> list[dict]:
+        """Return a page of Data API `/positions` entries for a wallet."""
+        count = self.positions_per_wallet
+        start = max(offset, 0)
+        stop = min(start + max(limit, 0), count)
+        payload: list[dict] = []
+        for position_index in range(start, stop):
+            rng = self._rng("position", user.lower(), position_index)
+            index = rng.randrange(self.n_markets)
+            market = self.market(index)
+            outcomes = json.loads(market["outcomes"])
+            tokens = self.token_ids(index)
+            outcome = rng.randrange(len(tokens))
+            size = round(rng.uniform(1, 1_000), 4)
+            avg_price = round(rng.uniform(0.05, 0.95), 4)
+            cur_price = round(self.fair_probabilities(index)[outcome], 4)
+            initial = round(size * avg_price, 4)
+            current = round(size * cur_price, 4)
+            payload.append(
+                {
+                    "proxyWallet": user,
+                    "asset": tokens[outcome],
+                    "conditionId": market["conditionId"],
+                    "size": size,
+                    "avgPrice": avg_price,
+                    "initialValue": initial,
+                    "currentValue": current,
+                    "cashPnl": round(current - initial, 4),
+                    "percentPnl": round((current - initial) / initial * 100, 4),
+                    "totalBought": initial,
+                    "realizedPnl": 0,
+                    "percentRealizedPnl": 0,
+                    "curPrice": cur_price,
+                    "redeemable": False,
+                    "mergeable": False,
+                    "title": market["question"],
+                    "slug": market["slug"],
+                    "eventSlug": f"synthetic-event-{index // 3}",
+                    "outcome": outcomes[outcome],
+                    "outcomeIndex": outcome,
+                    "oppositeOutcome": outcomes[1 - outcome] if len(outcomes) == 2 else None,
+                    "oppositeAsset": tokens[1 - outcome] if len(tokens) == 2 else None,
+                    "endDate": market["endDate"],
+                    "negativeRisk": market["negRisk"],
+                }
+            )
+        return payload
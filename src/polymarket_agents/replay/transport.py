@@ -0,0 +1,161 @@
+"""httpx transports for recording, replaying and stubbing Polymarket HTTP traffic."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+
+from polymarket_agents.replay.backends import CassetteBackend, SyntheticBackend
+from polymarket_agents.replay.cassette import Cassette, Interaction, parse_query
+
+_JSON = "application/json"
+
+
+def _request_body(request: httpx.Request) -> str | None:
+    content = request.read()
+    return content.decode("utf-8") if content else None
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Forward requests to a real transport and capture every response."""
+
+    def __init__(
+        self, cassette: Cassette, inner: httpx.BaseTransport | None = None
+    ) -> None:
+        self.cassette = cassette
+        self.inner = inner or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.inner.handle_request(request)
+        content = response.read()
+        response.close()
+        content_type = response.headers.get("content-type", _JSON)
+        self.cassette.append(
+            Interaction(
+                method=request.method,
+                host=request.url.host,
+                path=request.url.path,
+                query=parse_query(request.url.query),
+                request_body=_request_body(request),
+                status=response.status_code,
+                content_type=content_type,
+                response_body=content.decode("utf-8", errors="replace"),
+            )
+        )
+        # Rebuild the response without transfer headers; the body is already decoded.
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": content_type},
+            content=content,
+            request=request,
+        )
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serve responses from a cassette; unknown requests raise `CassetteMiss`."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        self.cassette = cassette
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request, _request_body(request))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        content = await request.aread()
+        return self._respond(request, content.decode("utf-8") if content else None)
+
+    def _respond(self, request: httpx.Request, body: str | None) -> httpx.Response:
+        interaction = self.cassette.find(
+            request.method,
+            request.url.host,
+            request.url.path,
+            parse_query(request.url.query),
+            body,
+        )
+        return httpx.Response(
+            interaction.status,
+            headers={"content-type": interaction.content_type},
+            content=interaction.response_body.encode("utf-8"),
+            request=request,
+        )
+
+
+def dispatch(
+    backend: SyntheticBackend | CassetteBackend,
+    method: str,
+    path: str,
+    params: httpx.QueryParams,
+    body: Any = None,
+) -> tuple[int, Any]:
+    """Route a stand-in request to the backend and return `(status, payload)`.
+
+    `params` keeps every value of repeated query parameters (e.g. `condition_ids`).
+    """
+    path = path.rstrip("/") or "/"
+    if method == "GET" and path == "/markets":
+        return 200, backend.markets(params)
+    if method == "GET" and path == "/events":
+        return 200, backend.events(params)
+    if method == "GET" and path == "/book":
+        book = backend.book(str(params.get("token_id", "")))
+        if book is None:
+            return 404, {"error": "No orderbook exists for the requested token id"}
+        return 200, book
+    if method == "POST" and path == "/books":
+        token_ids = [str(entry.get("token_id", "")) for entry in body or []]
+        return 200, backend.books(token_ids)
+    if method == "GET" and path == "/price":
+        price = backend.price(str(params.get("token_id", "")), str(params.get("side", "")))
+        if price is None:
+            return 404, {"error": "No orderbook exists for the requested token id"}
+        return 200, price
+    if method == "GET" and path == "/positions":
+        if not params.get("user"):
+            return 400, {"error": "user is required"}
+        return 200, backend.positions(params)
+    return 404, {"error": f"Unsupported stand-in route {method} {path}"}
+
+
+class BackendTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answer requests in-process from a stand-in backend, without opening sockets."""
+
+    def __init__(self, backend: SyntheticBackend | CassetteBackend) -> None:
+        self.backend = backend
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request, request.read())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request, await request.aread())
+
+    def _respond(self, request: httpx.Request, raw_body: bytes) -> httpx.Response:
+        body = json.loads(raw_body) if raw_body else None
+        status, payload = dispatch(
+            self.backend,
+            request.method,
+            request.url.path,
+            httpx.QueryParams(parse_query(request.url.query)),
+            body,
+        )
+        return httpx.Response(status, json=payload, request=request)
+
+
+def recording_client(cassette: Cassette, **kwargs: Any) -> httpx.Client:
+    """Return an HTTP client that records live traffic into `cassette`."""
+    kwargs.setdefault("timeout", httpx.Timeout(30.0, read=30.0))
+    return httpx.Client(transport=RecordingTransport(cassette), **kwargs)
+
+
+def replay_client(cassette: Cassette, **kwargs: Any) -> httpx.Client:
+    """Return an HTTP client that answers only from `cassette`."""
+    return httpx.Client(transport=ReplayTransport(cassette), **kwargs)
+
+
+def backend_client(backend: SyntheticBackend | CassetteBackend, **kwargs: Any) -> httpx.Client:
+    """Return an HTTP client wired directly to a stand-in backend."""
+    return httpx.Client(transport=BackendTransport(backend), **kwargs)
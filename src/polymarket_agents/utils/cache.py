@@ -0,0 +1,80 @@
+"""Small persistent key/value cache with per-namespace time-to-live."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
+
+
+def cache_key(*parts: Any, **params: Any) -> str:
+    """Stable string key for positional parts and keyword parameters."""
+    return json.dumps([parts, params], sort_keys=True, default=str)
+
+
+class TTLCache:
+    """JSON values in SQLite, keyed by `(namespace, key)` and expiring after `ttl` seconds.
+
+    Safe to share between threads; expired rows are ignored on read and
+    removed by `purge`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        namespace: str,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = float(ttl)
+        self.clock = clock
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT stored_at, value FROM entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        if row is None or row[0] + self.ttl <= self.clock():
+            return None
+        return json.loads(row[1])
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, stored_at, value) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, key, self.clock(), json.dumps(value)),
+            )
+
+    def purge(self) -> int:
+        """Delete expired entries in this namespace and return how many were removed."""
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM entries WHERE namespace = ? AND stored_at + ? <= ?",
+                (self.namespace, self.ttl, self.clock()),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self.connection.close()
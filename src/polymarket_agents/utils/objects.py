@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import Optional, Union
-from pydantic import BaseModel
+from typing import Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Trade(BaseModel):
@@ -206,3 +206,15 @@ class Article(BaseModel):
     urlToImage: Optional[str]
     publishedAt: Optional[str]
     content: Optional[str]
+
+
+class TradeRecommendation(BaseModel):
+    """One trade decision returned by the `one_best_trade` prompt."""
+
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    price: float = Field(gt=0, lt=1, description="Limit price on the order book.")
+    size: float = Field(gt=0, le=1, description="Fraction of available funds to commit.")
+    side: Literal["BUY", "SELL"]
+    outcome: str = Field(min_length=1, description="Outcome name the trade is on.")
+    confidence: float = Field(ge=0, le=1, description="Confidence in the trade, 0 to 1.")
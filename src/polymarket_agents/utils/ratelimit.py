@@ -0,0 +1,59 @@
+"""Thread-safe token-bucket rate limiting for outbound API calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Allow `rate` acquisitions per `per` seconds, with bursts up to `burst`.
+
+    `acquire` blocks the calling thread until enough tokens have accumulated.
+    A `rate` of zero or less disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        per: float = 60.0,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = float(rate)
+        self.per = float(per)
+        self.capacity = float(burst) if burst is not None else max(self.rate, 1.0)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate / self.per)
+        self._updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens and return how long the caller must wait to use them."""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            self._refill(self.clock())
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.per / self.rate
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Block until `amount` tokens are available; returns the time spent waiting."""
+        delay = self.reserve(amount)
+        if delay > 0:
+            self.sleep(delay)
+        return delay